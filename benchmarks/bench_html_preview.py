@@ -0,0 +1,63 @@
+"""
+Compares the streaming and BeautifulSoup engines of `utils.get_html_preview`.
+
+Usage:
+    python benchmarks/bench_html_preview.py [--sections 500] [--repeat 200]
+"""
+import argparse
+import sys
+import timeit
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django_email_sender.utils import get_html_preview
+
+
+def build_marketing_html(sections: int) -> str:
+    """Builds a large newsletter-style HTML email with inline styles and a tracking script."""
+    style   = "<style>" + "".join(f".c{i} {{ color: #{i:06x}; padding: {i}px; }}" for i in range(200)) + "</style>"
+    section = (
+        '<tr><td class="c1" style="padding:20px;font-family:Arial">'
+        '<h2>Spring sale &mdash; up to 50% off</h2>'
+        '<p>Hi {{ name }}, our biggest sale of the year starts today. '
+        '<a href="https://example.com/sale">Shop now</a></p>'
+        '<img src="https://example.com/banner.png" alt="banner"/></td></tr>'
+    )
+    return (
+        f"<!DOCTYPE html><html><head><title>Newsletter</title>{style}</head><body>"
+        f"<table>{section * sections}</table>"
+        "<script>window.dataLayer = window.dataLayer || [];</script></body></html>"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=500, help="Number of repeated content sections in the HTML")
+    parser.add_argument("--repeat", type=int, default=200, help="Number of previews generated per engine")
+    parser.add_argument("--length", type=int, default=100, help="Length of the preview")
+    args = parser.parse_args()
+
+    html = build_marketing_html(args.sections)
+    print(f"HTML size: {len(html) / 1024:.1f} KiB, {args.repeat} previews of {args.length} characters\n")
+
+    if get_html_preview(html, args.length, engine="stream") != get_html_preview(html, args.length, engine="bs4"):
+        print("warning: the engines produced different previews")
+
+    timings = {}
+    for engine in ("stream", "bs4"):
+        total           = timeit.timeit(lambda: get_html_preview(html, args.length, engine=engine), number=args.repeat)
+        timings[engine] = total / args.repeat * 1000
+        print(f"{engine:<8} {timings[engine]:10.3f} ms/preview")
+
+    print(f"\nspeed-up: {timings['bs4'] / timings['stream']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
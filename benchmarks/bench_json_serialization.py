@@ -0,0 +1,120 @@
+"""
+Compares the JSON serialization of an `EmailPayload` before and after the single-pass
+serializer: the legacy `asdict` + `sanitize_for_json` + `json.dumps(indent=4)` path, the
+standard library engine of `utils.dumps_json` and, if installed, the orjson engine.
+
+Usage:
+    python benchmarks/bench_json_serialization.py [--items 2000] [--repeat 50]
+"""
+import argparse
+import json
+import sys
+import timeit
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(USE_I18N=False)
+
+from django.utils.translation import gettext_lazy
+
+from django_email_sender.email_sender_payload import EmailPayload
+from django_email_sender.utils import _get_orjson, dumps_json, sanitize_for_json
+
+
+class Customer:
+    def __init__(self, pk: int):
+        self.pk = pk
+
+    def __str__(self):
+        return f"Customer #{self.pk}"
+
+
+def build_context(items: int) -> dict:
+    """Builds an order-confirmation style template context with the values a real one holds."""
+    return {
+        "customer": Customer(1),
+        "greeting": gettext_lazy("Thank you for your order"),
+        "ordered_on": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        "tags": {"vip", "newsletter", "spring-sale"},
+        "items": [
+            {
+                "sku": f"SKU-{i:06d}",
+                "name": f"Product {i} — édition limitée",
+                "quantity": i % 5 + 1,
+                "price": Decimal(f"{i % 100}.99"),
+                "in_stock": bool(i % 3),
+                "options": {"colour": "blue", "size": ["S", "M", "L"][i % 3], "gift_wrap": None},
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def build_payload(items: int) -> EmailPayload:
+    context = build_context(items)
+    return EmailPayload(from_email="shop@example.com",
+                        to_email="customer@example.com",
+                        subject="Your order",
+                        body_html="<p>Thank you for your order</p>" * 50,
+                        body_text="Thank you for your order\n" * 50,
+                        context=context,
+                        headers={"X-Order": "1"},
+                        recipients=("accounts@example.com",),
+                        email_id="bench",
+                        )
+
+
+def legacy_to_json(payload: EmailPayload) -> str:
+    """The serialization `EmailBase.to_json` did before the single-pass serializer."""
+    return json.dumps(sanitize_for_json(asdict(payload)), indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000, help="Number of order lines in the template context")
+    parser.add_argument("--repeat", type=int, default=50, help="Number of serializations per path")
+    args = parser.parse_args()
+
+    payload = build_payload(args.items)
+    paths   = {
+        "legacy": lambda: legacy_to_json(payload),
+        "json": lambda: dumps_json(payload.to_dict(), engine="json"),
+    }
+
+    if _get_orjson():
+        paths["orjson"] = lambda: dumps_json(payload.to_dict(), engine="orjson")
+    else:
+        print("orjson isn't installed, skipping its engine\n")
+
+    expected = json.loads(paths["legacy"]())
+
+    for name, serialize in paths.items():
+        output = serialize()
+        if json.loads(output) != expected:
+            print(f"warning: the '{name}' path produced a different document")
+
+    print(f"{args.items} order lines, {args.repeat} serializations per path\n")
+
+    timings = {}
+    for name, serialize in paths.items():
+        size          = len(serialize().encode())
+        total         = timeit.timeit(serialize, number=args.repeat)
+        timings[name] = total / args.repeat * 1000
+        print(f"{name:<8} {timings[name]:10.3f} ms/serialization {size / 1024:10.1f} KiB")
+
+    print()
+    for name in paths:
+        if name != "legacy":
+            print(f"speed-up of {name}: {timings['legacy'] / timings[name]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
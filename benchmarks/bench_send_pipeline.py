@@ -0,0 +1,335 @@
+"""
+Times the full `EmailSender.send` and `EmailSenderLogger.send` pipelines per email.
+
+Runs offline: Django is configured with the locmem email backend, an in-memory SQLite
+database and a temporary `EMAIL_TEMPLATES_DIR` holding generated templates. Each case
+builds the email with the chainable API and sends it, so the timings cover validation,
+template lookup and rendering, message building, delivery to the backend and, for the
+logger, the logging, previews and database save.
+
+The cases cover every combination of:
+    - template size: small, medium and large templates,
+    - recipient count: the primary recipient plus extra ones added with `add_new_recipient`,
+    - verbose logging on/off (logger only),
+    - database logging on/off (logger only),
+    - the template preview cache on/off (logger only).
+
+The results are written as JSON, so they can be kept per release and compared:
+
+Usage:
+    python benchmarks/bench_send_pipeline.py --output results-2.1.0.json
+    python benchmarks/bench_send_pipeline.py --quick --compare results-2.0.5.json --threshold 0.15
+"""
+import argparse
+import atexit
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from datetime import datetime, timezone
+from itertools import product
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import django
+
+from django.conf import settings
+
+# The email templates directory is resolved when `email_sender` is imported, so the
+# settings (and the templates) must exist before the package is imported.
+TEMP_DIR        = Path(tempfile.mkdtemp(prefix="email-sender-bench-"))
+atexit.register(shutil.rmtree, TEMP_DIR, ignore_errors=True)
+TEMPLATES_DIR   = TEMP_DIR / "templates"
+TEMPLATE_FOLDER = "bench"
+
+TEMPLATE_SIZES = {"small": 1, "medium": 20, "large": 200}
+RECIPIENTS     = (1, 10, 100)
+
+settings.configure(
+    BASE_DIR=TEMP_DIR,
+    MYAPP_TEMPLATES_DIR=TEMPLATES_DIR,
+    DEBUG=False,
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    INSTALLED_APPS=["django.contrib.contenttypes", "django_email_sender"],
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates", "DIRS": [str(TEMPLATES_DIR)]}],
+    USE_TZ=True,
+    LANGUAGE_CODE="en",
+)
+django.setup()
+
+from django.core import mail
+from django.db import connection
+from django.test.utils import override_settings
+
+from django_email_sender.email_logger import EmailSenderLogger
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.models import EmailBaseLog
+from django_email_sender.template_cache import clear_template_preview_cache
+
+
+class BenchmarkLog(EmailBaseLog):
+    class Meta:
+        app_label = "django_email_sender"
+
+
+def write_templates() -> None:
+    """Writes an HTML and a text template per size, each section being roughly 1 KiB."""
+    folder = TEMPLATES_DIR / "emails_templates" / TEMPLATE_FOLDER
+    folder.mkdir(parents=True)
+
+    html_section = (
+        '<tr><td style="padding:20px;font-family:Arial">'
+        "<h2>Hi {{ username }}, your order #{{ order_id }} has shipped</h2>"
+        "<p>{% for item in items %}{{ item.name }} x {{ item.quantity }}{% if not forloop.last %}, {% endif %}{% endfor %}</p>"
+        '<p>Track it at <a href="{{ tracking_url }}">{{ tracking_url }}</a>. '
+        + "Thanks for shopping with us. " * 20 +
+        "</p></td></tr>"
+    )
+    text_section = (
+        "Hi {{ username }}, your order #{{ order_id }} has shipped.\n"
+        "{% for item in items %}- {{ item.name }} x {{ item.quantity }}\n{% endfor %}"
+        "Track it at {{ tracking_url }}.\n" + "Thanks for shopping with us. " * 20 + "\n"
+    )
+
+    for size, sections in TEMPLATE_SIZES.items():
+        (folder / f"{size}.html").write_text(
+            "<!DOCTYPE html><html><head><title>{{ subject }}</title>"
+            "<style>td { color: #333; }</style></head><body><table>"
+            + html_section * sections +
+            "</table></body></html>",
+            encoding="utf-8",
+        )
+        (folder / f"{size}.txt").write_text(text_section * sections, encoding="utf-8")
+
+
+def create_log_table() -> None:
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(BenchmarkLog)
+
+
+def get_bench_logger() -> logging.Logger:
+    """Returns a logger that formats every record and writes it to the null device."""
+    logger = logging.getLogger("email_sender_benchmark")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    if not logger.handlers:
+        handler = logging.StreamHandler(open(os.devnull, "w"))
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+        logger.addHandler(handler)
+    return logger
+
+
+CONTEXT = {
+    "username": "benchmark",
+    "order_id": 1042,
+    "items": [{"name": f"Item {i}", "quantity": i} for i in range(5)],
+    "tracking_url": "https://example.com/track/1042",
+}
+
+
+def build_email(target, size: str, recipients: int):
+    """Fills in the email fields on an `EmailSender` or `EmailSenderLogger` with the chainable API."""
+    target.from_address("no-reply@example.com")\
+          .to("recipient0@example.com")\
+          .with_subject("Your order has shipped")\
+          .with_context(CONTEXT)\
+          .with_html_template(f"{size}.html", TEMPLATE_FOLDER)\
+          .with_text_template(f"{size}.txt", TEMPLATE_FOLDER)
+
+    for index in range(1, recipients):
+        target.add_new_recipient(f"recipient{index}@example.com")
+    return target
+
+
+def send_with_email_sender(size: str, recipients: int) -> None:
+    build_email(EmailSender.create(), size, recipients).send()
+
+
+def send_with_logger(size: str, recipients: int, verbose: bool, db_logging: bool) -> None:
+    email_logger = EmailSenderLogger.create()\
+        .start_logging_session()\
+        .config_logger(get_bench_logger(), "debug")\
+        .add_email_sender_instance(EmailSender())
+
+    if verbose:
+        email_logger.enable_verbose()
+
+    if db_logging:
+        email_logger.add_log_model(BenchmarkLog).enable_email_meta_data_save(save_to_db=True)
+
+    build_email(email_logger, size, recipients).send()
+
+
+def time_case(func, iterations: int, warmup: int) -> dict:
+    """Runs `func` `warmup` times untimed, then `iterations` times, and returns the timing statistics in milliseconds."""
+    for _ in range(warmup):
+        func()
+
+    timings = []
+
+    for _ in range(iterations):
+        start = perf_counter()
+        func()
+        timings.append((perf_counter() - start) * 1000)
+
+    mail.outbox.clear()
+    timings.sort()
+
+    return {
+        "iterations": iterations,
+        "mean_ms": statistics.fmean(timings),
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "min_ms": timings[0],
+        "max_ms": timings[-1],
+        "stdev_ms": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "emails_per_second": 1000 / statistics.fmean(timings),
+    }
+
+
+def get_cases(sizes, recipient_counts):
+    """Yields `(name, params, func)` for every benchmark case."""
+    for size, recipients in product(sizes, recipient_counts):
+        params = {"pipeline": "EmailSender.send", "template_size": size, "recipients": recipients}
+        yield f"sender-{size}-r{recipients}", params, lambda s=size, r=recipients: send_with_email_sender(s, r)
+
+    for size, recipients, verbose, db_logging, preview_cache in product(sizes, recipient_counts, (False, True),
+                                                                          (False, True), (True, False)):
+        name = (f"logger-{size}-r{recipients}"
+                f"-verbose_{'on' if verbose else 'off'}"
+                f"-db_{'on' if db_logging else 'off'}"
+                f"-preview_cache_{'on' if preview_cache else 'off'}")
+        params = {
+            "pipeline": "EmailSenderLogger.send",
+            "template_size": size,
+            "recipients": recipients,
+            "verbose": verbose,
+            "db_logging": db_logging,
+            "preview_cache": preview_cache,
+        }
+        yield name, params, lambda s=size, r=recipients, v=verbose, d=db_logging: send_with_logger(s, r, v, d)
+
+
+def run_case(params: dict, func, iterations: int, warmup: int) -> dict:
+    if params.get("preview_cache", True):
+        return time_case(func, iterations, warmup)
+
+    # a cache size of 0 drops every preview straight away, so the templates are read and parsed on every send
+    clear_template_preview_cache()
+
+    with override_settings(EMAIL_SENDER_PREVIEW_CACHE_SIZE=0):
+        return time_case(func, iterations, warmup)
+
+
+def get_environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+
+    try:
+        from importlib.metadata import version
+        package_version = version("django-email-sender")
+    except Exception:
+        package_version = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "package_version": package_version,
+        "git_commit": commit or None,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "django": django.get_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def compare(results: dict, baseline_path: str, threshold: float) -> bool:
+    """
+    Prints the change of the median of every case against a baseline file.
+
+    Returns:
+        bool: True if no case got slower by more than `threshold` (a fraction, e.g. 0.1 for 10%).
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {case["name"]: case for case in json.load(f)["results"]}
+
+    regressions = []
+    print(f"\nCompared with {baseline_path}:")
+
+    for case in results["results"]:
+        previous = baseline.get(case["name"])
+
+        if previous is None:
+            continue
+
+        change = case["median_ms"] / previous["median_ms"] - 1
+        marker = "  REGRESSION" if change > threshold else ""
+        print(f"  {case['name']:<70} {previous['median_ms']:9.3f} -> {case['median_ms']:9.3f} ms  {change:+7.1%}{marker}")
+
+        if change > threshold:
+            regressions.append(case["name"])
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) are more than {threshold:.0%} slower than the baseline.")
+    return not regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50, help="Timed sends per case")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed sends per case before timing")
+    parser.add_argument("--sizes", nargs="+", choices=list(TEMPLATE_SIZES), default=list(TEMPLATE_SIZES),
+                        help="Template sizes to benchmark")
+    parser.add_argument("--recipients", nargs="+", type=int, default=list(RECIPIENTS), help="Recipient counts to benchmark")
+    parser.add_argument("--filter", default=None, help="Only run the cases whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="10 iterations and 2 warm-up sends per case")
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file instead of stdout")
+    parser.add_argument("--compare", default=None, help="A previous JSON results file to compare the medians with")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="With --compare, exit with status 1 if a case is slower by more than this fraction")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.iterations, args.warmup = 10, 2
+
+    write_templates()
+    create_log_table()
+
+    results = {"environment": get_environment(),
+               "settings": {"iterations": args.iterations, "warmup": args.warmup},
+               "results": []}
+
+    for name, params, func in get_cases(args.sizes, args.recipients):
+        if args.filter and args.filter not in name:
+            continue
+
+        stats = run_case(params, func, args.iterations, args.warmup)
+        results["results"].append({"name": name, **params, **stats})
+        print(f"{name:<70} {stats['median_ms']:9.3f} ms  (p95 {stats['p95_ms']:.3f} ms)", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
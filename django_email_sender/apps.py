@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class DjangoEmailSenderConfig(AppConfig):
+    name         = "django_email_sender"
+    verbose_name = "Django Email Sender"
+
+    def ready(self):
+        # Opt-in: compile the email templates when the worker starts instead of on its first emails
+        if getattr(settings, "EMAIL_SENDER_WARM_UP_TEMPLATES", False):
+            from django_email_sender.template_cache import warm_up_templates
+            warm_up_templates()
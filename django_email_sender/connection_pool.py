@@ -0,0 +1,293 @@
+import atexit
+import os
+
+from contextlib import contextmanager
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.mail import get_connection
+
+from django_email_sender.exceptions import EmailConnectionPoolClosed, EmailConnectionPoolExhausted
+from django_email_sender.messages import ConnectionPoolMessages
+
+
+class PooledConnection:
+    """An open email backend connection and the bookkeeping the pool needs to retire it."""
+
+    __slots__ = ("backend", "created_at", "last_used_at", "messages_sent")
+
+    def __init__(self, backend):
+        self.backend            = backend
+        self.created_at: float  = monotonic()
+        self.last_used_at       = self.created_at
+        self.messages_sent: int = 0
+
+
+class EmailConnectionPool:
+    """
+    Keeps up to `size` open (and, for SMTP, authenticated) email backend connections per
+    process and lends them out, so consecutive emails reuse the same TCP/TLS session
+    instead of connecting, negotiating TLS and logging in for every email.
+
+    A connection is retired (closed and replaced by a new one) when:
+        - it is older than `max_age` seconds,
+        - it has sent `max_messages` messages,
+        - it has been idle for more than `health_check_after` seconds and doesn't answer an SMTP NOOP,
+        - sending through it raised an error.
+
+    The pool is thread-safe: a connection is only ever used by one thread at a time, and a
+    thread asking for a connection while all `size` are in use waits up to `timeout` seconds.
+
+    Example:
+        pool = EmailConnectionPool(size=4, max_age=300, max_messages=100)
+
+        EmailSender.create()\\
+            .with_connection_pool(pool)\\
+            ...
+            .send()
+
+        # or use a connection directly
+        with pool.connection() as connection:
+            connection.send_messages(messages)
+    """
+
+    def __init__(self, size: int = 4, max_age: Optional[float] = 300, max_messages: Optional[int] = 100,
+                 health_check_after: Optional[float] = 10, timeout: Optional[float] = None,
+                 backend: Optional[str] = None, **backend_kwargs: Any):
+        """
+        Args:
+            size (int): The maximum number of connections, in use or idle.
+            max_age (float, optional): The number of seconds after which a connection is retired. None disables it.
+            max_messages (int, optional): The number of messages after which a connection is retired. None disables it.
+            health_check_after (float, optional): The number of idle seconds after which a connection is checked
+                                                  with a NOOP before it is reused. 0 checks it every time, None never.
+            timeout (float, optional): How long to wait for a free connection. None waits forever.
+            backend (str, optional): The dotted path of the email backend. Defaults to `EMAIL_BACKEND`.
+            **backend_kwargs: Passed to `get_connection()`, e.g. `host`, `username`, `use_tls`.
+        """
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("The size of the connection pool must be a positive integer")
+
+        self.size                             = size
+        self.max_age                          = max_age
+        self.max_messages                     = max_messages
+        self.health_check_after               = health_check_after
+        self.timeout                          = timeout
+        self._backend                         = backend
+        self._backend_kwargs: Dict[str, Any]  = backend_kwargs
+        self._idle: List[PooledConnection]    = []
+        self._lock                            = Lock()
+        self._slots                           = BoundedSemaphore(size)
+        self._is_closed: bool                 = False
+        self.connections_opened: int          = 0
+        self.connections_retired: int         = 0
+
+    def acquire(self) -> PooledConnection:
+        """
+        Takes a healthy connection from the pool, opening a new one if none is idle.
+
+        Every connection acquired must be given back with `release()`.
+
+        Raises:
+            EmailConnectionPoolExhausted: If no connection became free within `timeout` seconds.
+            EmailConnectionPoolClosed: If the pool has been closed.
+        """
+        if self._is_closed:
+            raise EmailConnectionPoolClosed(ConnectionPoolMessages.POOL_CLOSED)
+
+        if not self._slots.acquire(timeout=self.timeout):
+            raise EmailConnectionPoolExhausted(ConnectionPoolMessages.POOL_EXHAUSTED, size=self.size, timeout=self.timeout)
+
+        try:
+            while True:
+                with self._lock:
+                    # the most recently used connection is the most likely to still be alive
+                    pooled = self._idle.pop() if self._idle else None
+
+                if pooled is None:
+                    return self._open()
+
+                if self._is_reusable(pooled):
+                    return pooled
+
+                self._retire(pooled)
+
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, pooled: PooledConnection, discard: bool = False) -> None:
+        """
+        Gives a connection back to the pool.
+
+        Args:
+            pooled (PooledConnection): The connection returned by `acquire()`.
+            discard (bool): If True the connection is closed instead of being reused, e.g. after an error.
+        """
+        try:
+            pooled.last_used_at = monotonic()
+
+            if discard or self._is_closed or self._has_expired(pooled):
+                self._retire(pooled)
+                return
+
+            with self._lock:
+                self._idle.append(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Lends an open backend connection for the duration of the `with` block.
+
+        If the block raises, the connection is closed rather than returned to the pool.
+        """
+        pooled = self.acquire()
+
+        try:
+            yield pooled.backend
+        except BaseException:
+            self.release(pooled, discard=True)
+            raise
+
+        self.release(pooled)
+
+    def send_messages(self, messages: List[Any]) -> int:
+        """
+        Sends the messages through a pooled connection.
+
+        Args:
+            messages (list): The `EmailMessage` instances to send.
+
+        Returns:
+            int: The number of messages sent.
+        """
+        pooled = self.acquire()
+
+        try:
+            sent = pooled.backend.send_messages(messages) or 0
+        except BaseException:
+            self.release(pooled, discard=True)
+            raise
+
+        pooled.messages_sent += len(messages)
+        self.release(pooled)
+        return sent
+
+    def _open(self) -> PooledConnection:
+        """Opens a new backend connection."""
+        backend = get_connection(self._backend, **self._backend_kwargs)
+        backend.open()
+
+        with self._lock:
+            self.connections_opened += 1
+        return PooledConnection(backend)
+
+    def _is_reusable(self, pooled: PooledConnection) -> bool:
+        """Returns True if the idle connection can be lent out again."""
+        if self._has_expired(pooled):
+            return False
+
+        if self.health_check_after is None or monotonic() - pooled.last_used_at < self.health_check_after:
+            return True
+        return self._is_alive(pooled)
+
+    def _has_expired(self, pooled: PooledConnection) -> bool:
+        """Returns True if the connection has reached its maximum age or number of messages."""
+        if self.max_age is not None and monotonic() - pooled.created_at >= self.max_age:
+            return True
+        return self.max_messages is not None and pooled.messages_sent >= self.max_messages
+
+    @staticmethod
+    def _is_alive(pooled: PooledConnection) -> bool:
+        """
+        Checks an SMTP connection with a NOOP. Backends without a network
+        connection (locmem, console, file, ...) are always alive.
+        """
+        smtp = getattr(pooled.backend, "connection", None)
+
+        if smtp is None or not hasattr(smtp, "noop"):
+            return True
+
+        try:
+            status, _ = smtp.noop()
+        except Exception:
+            return False
+        return status == 250
+
+    def _retire(self, pooled: PooledConnection) -> None:
+        """Closes a connection that won't be reused."""
+        try:
+            pooled.backend.close()
+        except Exception:
+            # the connection is dropped either way
+            pass
+
+        with self._lock:
+            self.connections_retired += 1
+
+    def close(self) -> None:
+        """Closes the idle connections. Connections in use are closed when they are released."""
+        with self._lock:
+            self._is_closed  = True
+            idle, self._idle = self._idle, []
+
+        for pooled in idle:
+            self._retire(pooled)
+
+    @property
+    def idle_connections(self) -> int:
+        """Returns the number of open connections waiting to be reused."""
+        return len(self._idle)
+
+    @property
+    def is_closed(self) -> bool:
+        """Returns True if the pool has been closed."""
+        return self._is_closed
+
+
+_connection_pool: Optional[EmailConnectionPool] = None
+_connection_pool_lock = Lock()
+
+
+def get_connection_pool() -> Optional[EmailConnectionPool]:
+    """
+    Returns the process-wide connection pool, or None if connection pooling isn't configured.
+
+    The pool is enabled with the optional `EMAIL_SENDER_CONNECTION_POOL` setting, which accepts
+    the same keyword arguments as `EmailConnectionPool`, e.g.
+
+        EMAIL_SENDER_CONNECTION_POOL = {"size": 4, "max_age": 300, "max_messages": 100}
+
+    The pool is created on first use in each process, and its connections are closed when
+    the interpreter exits.
+    """
+    global _connection_pool
+
+    options = getattr(settings, "EMAIL_SENDER_CONNECTION_POOL", None)
+
+    if options is None:
+        return None
+
+    with _connection_pool_lock:
+        if _connection_pool is None or _connection_pool.is_closed:
+            _connection_pool = EmailConnectionPool(**options)
+            atexit.register(_connection_pool.close)
+    return _connection_pool
+
+
+def _forget_connection_pool_after_fork() -> None:
+    """
+    The connections of a pool created before a fork belong to the parent process, so the
+    child starts with a pool of its own (without closing the parent's connections).
+    """
+    global _connection_pool, _connection_pool_lock
+    _connection_pool      = None
+    _connection_pool_lock = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_connection_pool_after_fork)
@@ -0,0 +1,210 @@
+import atexit
+
+from queue import Empty, Full, Queue
+from threading import Condition, Lock, Thread
+from typing import Callable, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from django_email_sender.exceptions import EmailQueueClosedError, EmailQueueFullError
+from django_email_sender.messages import QueueMessages
+
+
+# Placed on the queue once per worker to tell it to stop
+_STOP = object()
+
+
+class EmailDeliveryQueue:
+    """
+    A bounded queue drained by a pool of worker threads, used to deliver emails
+    in the background instead of in the request thread.
+
+    Jobs are plain callables. `EmailSenderLogger` submits a job per email when queued
+    delivery is enabled (see `EmailSenderLogger.enable_queued_delivery()`), and each job
+    renders, delivers, logs and records the metadata of its email.
+
+    Backpressure:
+        When the queue is full, `submit` waits up to `timeout` seconds for a free slot
+        (forever if `timeout` is None) and raises `EmailQueueFullError` if none becomes
+        free. If `block` is False the error is raised straight away.
+
+    Shutdown:
+        `shutdown(drain=True)` stops accepting jobs, lets the workers finish everything
+        already on the queue and then stops them. The process-wide queue returned by
+        `get_delivery_queue()` is drained automatically when the interpreter exits.
+
+    Example:
+        queue = EmailDeliveryQueue(workers=8, max_size=5000)
+
+        EmailSenderLogger.create()\
+            .add_email_sender_instance(EmailSender())\
+            .enable_queued_delivery(queue)
+    """
+
+    def __init__(self, workers: int = 4, max_size: int = 1000, block: bool = True, timeout: Optional[float] = None):
+        """
+        Args:
+            workers (int): The number of worker threads draining the queue.
+            max_size (int): The maximum number of jobs waiting on the queue. 0 means unbounded.
+            block (bool): Whether `submit` waits for a free slot when the queue is full.
+            timeout (float, optional): How long `submit` waits for a free slot before giving up.
+                                       None waits forever.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("The number of workers must be a positive integer")
+
+        self._queue: Queue             = Queue(maxsize=max_size)
+        self._num_of_workers: int      = workers
+        self._block: bool              = block
+        self._timeout                  = timeout
+        self._threads: List[Thread]    = []
+        self._lock                     = Lock()
+        self._submits_done             = Condition(self._lock)
+        self._submits_in_progress: int = 0
+        self._is_closed: bool          = False
+        self.completed_jobs: int       = 0
+        self.failed_jobs: int          = 0
+
+    def start(self) -> "EmailDeliveryQueue":
+        """Starts the worker threads. Called automatically by the first `submit`."""
+        with self._lock:
+            if self._threads:
+                return self
+
+            for index in range(self._num_of_workers):
+                thread = Thread(target=self._work, name=f"email-delivery-worker-{index + 1}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def submit(self, job: Callable[[], None]) -> None:
+        """
+        Adds a job to the queue to be run by one of the workers.
+
+        Args:
+            job (Callable): A callable taking no arguments.
+
+        Raises:
+            EmailQueueClosedError: If the queue has been shut down.
+            EmailQueueFullError: If the queue is still full after waiting for a free slot.
+        """
+        with self._lock:
+            if self._is_closed:
+                raise EmailQueueClosedError(QueueMessages.QUEUE_CLOSED)
+            self._submits_in_progress += 1
+
+        try:
+            if not self._threads:
+                self.start()
+
+            self._queue.put(job, block=self._block, timeout=self._timeout)
+
+        except Full:
+            raise EmailQueueFullError(QueueMessages.QUEUE_FULL, max_size=self._queue.maxsize)
+
+        finally:
+            with self._lock:
+                self._submits_in_progress -= 1
+                self._submits_done.notify_all()
+
+    def _work(self) -> None:
+        """Runs jobs from the queue until told to stop."""
+        while True:
+            job = self._queue.get()
+
+            try:
+                if job is _STOP:
+                    return
+                job()
+                self._count_job(failed=False)
+
+            except Exception:
+                # the job logs its own failure through the EmailSenderLogger
+                self._count_job(failed=True)
+
+            finally:
+                close_old_connections()
+                self._queue.task_done()
+
+    def _count_job(self, failed: bool) -> None:
+        """Records the outcome of a job run by one of the workers."""
+        with self._lock:
+            if failed:
+                self.failed_jobs += 1
+            else:
+                self.completed_jobs += 1
+
+    def shutdown(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stops accepting new jobs and stops the workers.
+
+        A job whose `submit` was already under way when the queue closed is put on the queue
+        before the workers are told to stop, so it is run (or discarded) like any other job.
+
+        Args:
+            drain (bool): If True, every job already on the queue is run before the workers stop.
+                          If False, jobs that haven't started yet are discarded.
+            timeout (float, optional): The maximum time in seconds to wait for each worker to stop.
+        """
+        with self._lock:
+            self._is_closed = True
+            self._submits_done.wait_for(lambda: not self._submits_in_progress)
+            threads         = list(self._threads)
+
+        if not drain:
+            self._discard_pending_jobs()
+
+        for _ in threads:
+            self._queue.put(_STOP)
+
+        for thread in threads:
+            thread.join(timeout)
+
+    def _discard_pending_jobs(self) -> None:
+        """Removes every job that hasn't been picked up by a worker yet."""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                return
+            self._queue.task_done()
+
+    def join(self) -> None:
+        """Blocks until every job currently on the queue has been run."""
+        self._queue.join()
+
+    @property
+    def pending_jobs(self) -> int:
+        """Returns the approximate number of jobs waiting on the queue."""
+        return self._queue.qsize()
+
+    @property
+    def is_closed(self) -> bool:
+        """Returns True if the queue has been shut down."""
+        return self._is_closed
+
+
+_delivery_queue: Optional[EmailDeliveryQueue] = None
+_delivery_queue_lock = Lock()
+
+
+def get_delivery_queue() -> EmailDeliveryQueue:
+    """
+    Returns the process-wide delivery queue, creating it on first use.
+
+    The queue is configured with the optional `EMAIL_SENDER_DELIVERY_QUEUE` setting, which
+    accepts the same keyword arguments as `EmailDeliveryQueue`, e.g.
+
+        EMAIL_SENDER_DELIVERY_QUEUE = {"workers": 8, "max_size": 5000, "timeout": 2}
+
+    The queue is drained when the interpreter exits.
+    """
+    global _delivery_queue
+
+    with _delivery_queue_lock:
+        if _delivery_queue is None or _delivery_queue.is_closed:
+            options         = getattr(settings, "EMAIL_SENDER_DELIVERY_QUEUE", {})
+            _delivery_queue = EmailDeliveryQueue(**options)
+            atexit.register(_delivery_queue.shutdown, drain=True)
+    return _delivery_queue
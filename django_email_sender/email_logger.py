@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 import logging
 
+from asgiref.sync import sync_to_async
+from contextvars import ContextVar
+from copy import copy
 from dataclasses import dataclass
 from datetime import datetime
 from django.conf import settings
@@ -11,10 +14,14 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from enum import Enum
 from logging import Logger, LoggerAdapter
+from threading import Lock
 from traceback import format_exc
 from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Union
+from weakref import WeakKeyDictionary
 
 
+from django_email_sender.delivery_queue import EmailDeliveryQueue, get_delivery_queue
+from django_email_sender.log_writer import BufferedLogWriter, get_log_writer
 from django_email_sender.models import EmailBaseLog
 from django_email_sender.email_sender_constants import EmailSenderConstants, LoggerType
 from django_email_sender.email_sender import EmailSender
@@ -40,6 +47,7 @@ from django_email_sender.messages import (
     LoggerMessages,
     LogExecutionMessages,
     MethodConstants,
+    QueueMessages,
     RecipientMessages,
     TemplateMessages,
     TemplateResolutionMessages,
@@ -69,8 +77,10 @@ from django_email_sender.email_sender_constants import (
     get_email_sender_param_contract,
 )
 
-from django_email_sender.utils import get_html_preview, get_safe_text_preview
-from django_email_sender.utils import measure_duration
+from django_email_sender.utils import dedupe_recipients, get_html_preview, get_safe_text_preview
+from django_email_sender.utils import ameasure_duration, format_stage_timings, measure_duration
+from django_email_sender.template_cache import get_template_previews
+from django_email_sender.tracing import get_tracer
 
 
 dirs                = get_template_dirs()
@@ -107,6 +117,146 @@ class _EmailSenderLoggerKeys:
 
 
 
+# The status message of the summary for each outcome of a send, see `EmailSenderLogger._get_send_status`
+_SEND_STATUS_MESSAGES: Dict[str, str] = {
+    "sent": "Successfully sent",
+    "enqueued": "Enqueued in the outbox",
+    "failed": "Failed to send email",
+}
+
+# Maps the LoggerType values to the numeric levels used by the logging module
+_LOG_LEVELS: Dict[str, int] = {
+    LoggerType.DEBUG: logging.DEBUG,
+    LoggerType.INFO: logging.INFO,
+    LoggerType.WARNING: logging.WARNING,
+    LoggerType.ERROR: logging.ERROR,
+}
+
+# The EmailSender classes that have passed `_is_email_sender_class_valid`. Weak-keyed so
+# classes created at runtime (e.g. in tests) can still be garbage collected.
+_validated_email_sender_classes: "WeakKeyDictionary[type, bool]" = WeakKeyDictionary()
+_validated_email_sender_classes_lock = Lock()
+
+
+def clear_email_sender_validation_cache() -> None:
+    """
+    Forgets every EmailSender class that has passed validation, so the next
+    `add_email_sender_instance` call validates the class again.
+
+    Only needed if the methods of an EmailSender class are replaced at runtime.
+    """
+    with _validated_email_sender_classes_lock:
+        _validated_email_sender_classes.clear()
+
+
+class _SendStateKey:
+    """
+    Identifies a logger's thread-safe mode in `_send_states`. The logger holds it only
+    while the mode is on, so the states of every thread and task are dropped when the
+    mode is turned off or the logger is garbage collected.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+# The state of the email each logger in thread-safe mode is building in the current
+# thread or asyncio task. A dictionary is never changed once set, it is copied instead,
+# as a task created from the current context shares the dictionary set at that time.
+_send_states: "ContextVar[Optional[WeakKeyDictionary[_SendStateKey, _EmailSendState]]]" = ContextVar(
+    "email_sender_logger_send_states", default=None
+)
+
+
+class _EmailSendState:
+    """
+    Holds the state of the email an `EmailSenderLogger` is building and sending, as opposed
+    to the logger's configuration (logger, log model, filters, formatter, ...).
+
+    A logger owns a single state by default. In thread-safe mode (see
+    `EmailSenderLogger.enable_thread_safe_mode()`) every thread or asyncio task using
+    the logger gets a state of its own.
+
+    With queued delivery the outcome of a send (delivery status, metadata and count) is
+    written by a delivery worker while the thread that queued it may be reading it, so
+    those attributes are read and written under the state's `_lock`.
+    """
+
+    __slots__ = (
+        "_email_sender",
+        "_text_preview",
+        "_html_preview",
+        "_field_changes",
+        "_email_delivery_count",
+        "_is_delivery_successful",
+        "_is_headers_set",
+        "_is_context_set",
+        "_was_sent_successfully",
+        "_email_was_processed",
+        "_meta_data",
+        "_fields_marked_for_reset",
+        "_email_payload",
+        "_methods_seen",
+        "_prepare_duration",
+        "_lock",
+    )
+
+    def __init__(self, email_sender: Optional[EmailSender] = None) -> None:
+        self._email_sender: EmailSender         = email_sender
+        self._text_preview: str                 = None
+        self._html_preview: str                 = None
+        self._field_changes: Dict[str, Any]     = {}
+        self._email_delivery_count: int         = 0
+        self._is_delivery_successful: bool      = False
+        self._is_headers_set: bool              = False
+        self._is_context_set: bool              = False
+        self._was_sent_successfully             = False
+        self._email_was_processed               = None
+        self._meta_data: json                   = None
+        self._fields_marked_for_reset           = False
+        self._email_payload: EmailPayload       = None
+        self._methods_seen: List[str]           = []
+        self._prepare_duration: float           = 0.0
+        self._lock                              = Lock()
+
+
+class _PerSendAttribute:
+    """
+    Descriptor that stores an `EmailSenderLogger` attribute in the logger's current
+    `_EmailSendState` rather than on the logger itself.
+
+    Guarded attributes are read and written under the state's lock, as they are also
+    written by the delivery worker of a queued email (see `_record_queued_delivery`).
+    """
+
+    def __init__(self, guarded: bool = False) -> None:
+        self.guarded = guarded
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, email_logger: "EmailSenderLogger", owner=None):
+        if email_logger is None:
+            return self
+
+        send_state = email_logger._get_send_state()
+
+        if not self.guarded:
+            return getattr(send_state, self.name)
+
+        with send_state._lock:
+            return getattr(send_state, self.name)
+
+    def __set__(self, email_logger: "EmailSenderLogger", value) -> None:
+        send_state = email_logger._get_send_state()
+
+        if not self.guarded:
+            setattr(send_state, self.name, value)
+            return
+
+        with send_state._lock:
+            setattr(send_state, self.name, value)
+
+
 class EmailSenderLogger:
     """
     Handles structured email logging using a provided logger instance.
@@ -117,8 +267,29 @@ class EmailSenderLogger:
     This design prevents interference with user-defined logging configurations.
     """
 
+    # The state of the email being built and sent, see `_EmailSendState`
+    _email_sender            = _PerSendAttribute()
+    _text_preview            = _PerSendAttribute()
+    _html_preview            = _PerSendAttribute()
+    _field_changes           = _PerSendAttribute()
+    _email_delivery_count    = _PerSendAttribute(guarded=True)
+    _is_delivery_successful  = _PerSendAttribute(guarded=True)
+    _is_headers_set          = _PerSendAttribute()
+    _is_context_set          = _PerSendAttribute()
+    _was_sent_successfully   = _PerSendAttribute(guarded=True)
+    _email_was_processed     = _PerSendAttribute()
+    _meta_data               = _PerSendAttribute(guarded=True)
+    _fields_marked_for_reset = _PerSendAttribute()
+    _email_payload           = _PerSendAttribute()
+    _methods_seen            = _PerSendAttribute()
+    _prepare_duration        = _PerSendAttribute()
+
     def __init__(self) -> None:
         
+        self._send_state: _EmailSendState              = _EmailSendState()
+        self._send_state_key: Optional[_SendStateKey]  = None
+        self._email_sender_class: Optional[type]       = None
+        self._delivery_settings: Optional[EmailSender] = None
         self._show_traceback_error: bool               = False
         self._method_tracing                           = False
         self._logger: Optional[Logger]                 = None
@@ -128,30 +299,19 @@ class EmailSenderLogger:
         self._is_config: bool                          = False
         self._current_log_level: str                   = None
         self._logger_started: bool                     = False
-        self._email_sender: EmailSender                = None
-        self._text_preview: str                        = None
-        self._html_preview: str                        = None
-        self._field_changes: Dict[str, Any]            = {}
         self._TEMPLATE_FOLDER_KEY: str                 = _EmailSenderLoggerKeys.TEMPLATE_FOLDER_KEY
-        self._email_delivery_count: int                = 0
-        self._is_delivery_successful: bool             = False
         self._enable_field_trace_logging: bool         = False
         self._fields: Set                              = set()  
-        self._is_headers_set: bool                     = False
-        self._is_context_set: bool                     = False
         self._exclude_fields: Optional[Set[str]]       = set()
         self._enable_exclusion_field_trace: bool       = False
-        self._was_sent_successfully                    = False
-        self._email_was_processed                      = None
         self._log_model                                = None
-        self._meta_data: json                          = None
         self._custom_formatter: Optional[Callable[[str], str]] = None
         self._email_sender_paras: dict                 = get_email_sender_param_contract()
         self._save_errors_to_db                        = False
         self._to_db                                    = False
-        self._fields_marked_for_reset                  = False
-        self._email_payload                            = None
-        self._methods_seen                             = []
+        self._delivery_queue: Optional[EmailDeliveryQueue] = None
+        self._log_writer: Optional[BufferedLogWriter]  = None
+        self._structured_summary: bool                 = getattr(settings, "EMAIL_SENDER_STRUCTURED_SUMMARY", False)
         safe_set_language(self._logger)
 
     @classmethod
@@ -193,8 +353,10 @@ class EmailSenderLogger:
         
         self._is_email_sender_class_valid(email_sender_instance)
         
-        self._email_sender = email_sender_instance.create()
-        class_name         = email_sender_instance.__class__.__name__
+        self._email_sender_class = type(email_sender_instance)
+        self._delivery_settings  = email_sender_instance.create()._copy_delivery_settings(email_sender_instance)
+        self._email_sender       = email_sender_instance.create()._copy_delivery_settings(email_sender_instance)
+        class_name               = email_sender_instance.__class__.__name__
 
         self._log_message(ConfigMessages.CONFIG_SETUP_SUCCESS, config_details=class_name)
     
@@ -207,6 +369,9 @@ class EmailSenderLogger:
         Validates whether the provided EmailSender instance is valid. 
         If the instance is not valid, it raises relevant errors.
 
+        The verdict is cached per EmailSender class, so the fields and method signatures
+        are only inspected for the first valid instance of each class.
+
         Args:
             email_sender_instance (EmailSender): An instance of EmailSender to log sent emails and their outcomes.
 
@@ -237,7 +402,12 @@ class EmailSenderLogger:
                 self._log_message(error_msg, exc=e)
                 raise IncorrectEmailSenderInstance(ConfigMessages.format_message(error_msg))
 
-        class_name = email_sender_instance.__class__.__name__
+        class_name         = email_sender_instance.__class__.__name__
+        email_sender_class = type(email_sender_instance)
+
+        if _validated_email_sender_classes.get(email_sender_class):
+            self._log_debug_verbose(MethodConstants.CLASS_ALREADY_VALIDATED, class_name=class_name)
+            return True
 
         self._log_debug_verbose( MethodConstants.format_message(MethodConstants.EVALUATING_FIELD_METHODS, class_name=class_name))
              
@@ -245,6 +415,8 @@ class EmailSenderLogger:
         is_methods_valid = self._validate_email_sender_public_methods(email_sender_instance)
 
         if is_fields_valid and is_methods_valid:
+            with _validated_email_sender_classes_lock:
+                _validated_email_sender_classes[email_sender_class] = True
             return True
         
         self._log_message(MethodConstants.MISSING_FIELDS_ERROR, fields=is_fields_valid, methods=is_methods_valid)
@@ -541,47 +713,116 @@ class EmailSenderLogger:
         corresponding method on the EmailSender instance, passing in any arguments
         and logging the entire process.
 
+        If queued delivery is enabled (see `enable_queued_delivery()`), a snapshot of the
+        email is added to the delivery queue and the method returns straight away. The
+        delivery, logging and metadata are then handled by one of the queue's workers.
+
         Args:
             *args: Positional arguments to pass to the EmailSender method.
             **kwargs: Keyword arguments to pass to the EmailSender method.
         """
 
+        if self._delivery_queue is not None:
+            self._enqueue_send(**kwargs)
+            return
+        
+        with self._start_span("send"):
+            with self._start_span("prepare"):
+                recipients, self._prepare_duration = measure_duration(self._prepare_send, **kwargs)
+            
+            try:
+                # send the email, return the resp and the time it took
+                email_resp, elasped = measure_duration(self._email_sender.send, *args, **kwargs)
+                
+            except (EmailSendError, EmailTemplateNotFound, EmailSenderBaseException) as e:
+                self._handle_failed_delivery(error=e)
+                return
+            
+            self._complete_send(email_resp, elasped, recipients)
+        return 
+
+    async def asend(self, *args, **kwargs):
+        """
+        The asynchronous version of `send()` for use in async (ASGI) views.
+
+        Delivery is delegated to `EmailSender.asend()`, so the event loop is not blocked while the
+        email is rendered and sent. The logging before and after the delivery, and the optional
+        database save, run in worker threads because they perform blocking I/O.
+
+        Args:
+            *args: Positional arguments to pass to the EmailSender method.
+            **kwargs: Keyword arguments to pass to the EmailSender method.
+        """
+        with self._start_span("asend"):
+            with self._start_span("prepare"):
+                recipients, self._prepare_duration = await ameasure_duration(sync_to_async(self._prepare_send, thread_sensitive=False), **kwargs)
+
+            try:
+                email_resp, elasped = await ameasure_duration(self._email_sender.asend, *args, **kwargs)
+                
+            except (EmailSendError, EmailTemplateNotFound, EmailSenderBaseException) as e:
+                await sync_to_async(self._handle_failed_delivery, thread_sensitive=False)(error=e)
+                return
+
+            # the database save must run in the thread Django uses for synchronous code
+            await sync_to_async(self._complete_send)(email_resp, elasped, recipients)
+
+    def _prepare_send(self, **kwargs) -> List[str]:
+        """
+        Snapshots the email fields and logs the details of the email before it is delivered.
+
+        Args:
+            **kwargs: The keyword arguments passed to `send()`, used to check for 'auto_reset'.
+
+        Returns:
+            List[str]: The additional recipients the email will be sent to.
+        """
         self._handle_auto_reset(**kwargs)
         recipients = list(self._email_sender.list_of_recipients)
         self._log_debug_trace_format()
 
         self._log_email_preparation_details(recipients)     
         self._load_template_preview_in_logger(preview_chars=100)
+        return recipients
 
-        
-        try:
-            # send the email, return the resp and the time it took
-            email_resp, elasped         = measure_duration(self._email_sender.send, *args, **kwargs)
-        
-            emails_sent_count, is_sent  = email_resp
-            timestamp                   = timezone.now()
-            self._was_sent_successfully = is_sent
-            self._email_was_processed   = True
-            self._clear_methods_seen()
-            
-        except EmailSendError as e:
-            self._create_meta_data(self._was_sent_successfully, timezone.now(), errors=True)
-            self._log_and_raise_failed_email_delivery(error=e)
-            return 
-           
-        except EmailTemplateNotFound as e:
+    def _handle_failed_delivery(self, error: Exception) -> None:
+        """
+        Records the metadata for a failed delivery, logs the failure and re-raises it.
+
+        Args:
+            error (Exception): The exception raised by the EmailSender while sending.
+
+        Raises:
+            EmailSendError: Always raised with the details of the failure.
+        """
+        if isinstance(error, (EmailSendError, EmailTemplateNotFound)):
             self._create_meta_data(self._was_sent_successfully, timezone.now(), errors=True)
-            self._log_and_raise_failed_email_delivery(error=e)
+            self._log_and_raise_failed_email_delivery(error=error)
             return
         
-        except EmailSenderBaseException:
-            missing_fields = EmailMessages.MISSING_EMAIL_FIELDS.format(subject=self._email_sender.subject,
-                                                                       from_email=self._email_sender.from_email,
-                                                                       to_email=self._email_sender.to_email,
-                                                                       )
-            self._log_and_raise_failed_email_delivery(error=missing_fields)
-            
-            raise EmailSenderBaseException(missing_fields)
+        missing_fields = EmailMessages.MISSING_EMAIL_FIELDS.format(subject=self._email_sender.subject,
+                                                                   from_email=self._email_sender.from_email,
+                                                                   to_email=self._email_sender.to_email,
+                                                                   )
+        self._log_and_raise_failed_email_delivery(error=missing_fields)
+        
+        raise EmailSenderBaseException(missing_fields)
+
+    def _complete_send(self, email_resp: tuple, elasped: float, recipients: List[str]) -> None:
+        """
+        Logs the summary of a delivered email, saves it to the database if enabled and
+        records its metadata.
+
+        Args:
+            email_resp (tuple): The `(emails_sent_count, is_sent)` response from the EmailSender.
+            elasped (float): The time in seconds it took to send the email.
+            recipients (List[str]): The additional recipients the email was sent to.
+        """
+        emails_sent_count, is_sent  = email_resp
+        timestamp                   = timezone.now()
+        self._was_sent_successfully = is_sent
+        self._email_was_processed   = True
+        self._clear_methods_seen()
         
         self._log_email_summary(time_taken=elasped, 
                                   status=is_sent, 
@@ -596,12 +837,11 @@ class EmailSenderLogger:
             self._is_delivery_successful = True
         
         if self._to_db:
-            self._log_activity_to_db()
+            with self._start_span("db_log"):
+                self._log_activity_to_db()
             
         self._create_meta_data(is_sent, timestamp)
         self._update_email_delivery_count(emails_sent_count)
-        
-        return 
     
     def _handle_auto_reset(self, **kwargs):
         """
@@ -617,19 +857,264 @@ class EmailSenderLogger:
         if kwargs.get("auto_reset"):
             self._fields_marked_for_reset = True
 
-            # Snapshot the current state of the email sender
-        payload_data = {
-                "from_email": self._email_sender.from_email,
-                "to_email": self._email_sender.to_email,
-                "subject": self._email_sender.subject,
-                "body_html": self._email_sender.html_template,
-                "body_text": self._email_sender.text_template,
-                "context": self._email_sender.context,
-                "headers": self._email_sender.headers,
-            }
-
-            # Use static data to construct the payload
-        self._email_payload = EmailPayload(**payload_data)
+        self._email_payload = self._snapshot_email_payload()
+
+    def _snapshot_email_payload(self) -> EmailPayload:
+        """
+        Copies the current fields of the `EmailSender` instance into an immutable payload.
+
+        The context, headers and recipients are copied, so later changes made to the
+        `EmailSender` instance do not affect the snapshot.
+
+        Returns:
+            EmailPayload: The snapshot of the email.
+        """
+        return EmailPayload(
+            from_email=self._email_sender.from_email,
+            to_email=self._email_sender.to_email,
+            subject=self._email_sender.subject,
+            body_html=self._email_sender.html_template,
+            body_text=self._email_sender.text_template,
+            context=dict(self._email_sender.context or {}),
+            headers=dict(self._email_sender.headers or {}),
+            recipients=tuple(self._email_sender.list_of_recipients),
+            email_id=self._email_sender.email_id,
+        )
+
+    def enable_thread_safe_mode(self) -> "EmailSenderLogger":
+        """
+        Allows one configured logger to be shared by every thread (and asyncio task) of the process.
+
+        By default the state of the email being built and sent (its `EmailSender` fields,
+        previews, field changes, payload, metadata, ...) is stored on the logger, so a logger
+        can only build one email at a time. In thread-safe mode that state is held in a
+        `ContextVar`, so each thread or task builds its own email with its own `EmailSender`,
+        while the configuration (logger, log level, log model, filters, formatter, language)
+        is set up once and shared.
+
+        The calling thread or task keeps the email it was building. Every other thread or task
+        starts with an empty email whose `EmailSender` delivers like the sender passed to
+        `add_email_sender_instance()` (chunk size, connection pool, rate limiter, retry policy,
+        outbox and tracer). Changes made to the sender of one thread are not seen by the others.
+
+        Call `start_new_email()` at the start of each email so a thread that handles many
+        requests doesn't carry over the state of its previous email.
+
+        Returns:
+            EmailSenderLogger: The current instance for chaining.
+
+        Example:
+            # configured once, e.g. at module level
+            email_logger = EmailSenderLogger.create()\
+                               .add_email_sender_instance(EmailSender())\
+                               .config_logger(logger, LoggerType.INFO)\
+                               .add_log_model(CustomLogModel)\
+                               .enable_thread_safe_mode()
+
+            # in each request
+            email_logger.start_new_email()\
+                        .from_address("no-reply@example.com")\
+                        .to(user.email)\
+                        ...
+                        .send()
+        """
+        self._log_debug_trace_format()
+        
+        if self._send_state_key is None:
+            self._send_state_key = _SendStateKey()
+            self._set_send_state(self._send_state)
+        return self
+
+    def disable_thread_safe_mode(self) -> "EmailSenderLogger":
+        """
+        Stores the email state on the logger again, so the logger should only be used by one thread.
+
+        Returns:
+            EmailSenderLogger: The current instance for chaining.
+        """
+        self._log_debug_trace_format()
+        
+        if self._send_state_key is not None:
+            self._send_state     = self._get_send_state()
+            self._send_state_key = None
+        return self
+
+    def start_new_email(self) -> "EmailSenderLogger":
+        """
+        Discards the state of the previous email and starts a new one with a fresh `EmailSender`.
+
+        In thread-safe mode only the state of the calling thread or task is replaced.
+        The delivery count and status start again from zero.
+
+        Returns:
+            EmailSenderLogger: The current instance for chaining.
+        """
+        self._log_debug_trace_format()
+        send_state = self._create_send_state()
+
+        if self._send_state_key is None:
+            self._send_state = send_state
+        else:
+            self._set_send_state(send_state)
+        return self
+
+    def _create_send_state(self) -> _EmailSendState:
+        """
+        Returns an empty email state with a new instance of the configured `EmailSender` class,
+        delivering the same way as the sender passed to `add_email_sender_instance()`.
+        """
+        email_sender = None
+
+        if self._email_sender_class:
+            email_sender = self._email_sender_class.create()._copy_delivery_settings(self._delivery_settings)
+        return _EmailSendState(email_sender)
+
+    def _get_send_state(self) -> _EmailSendState:
+        """
+        Returns the state of the email being built and sent.
+
+        In thread-safe mode this is the state of the calling thread or task, created on first use.
+        """
+        if self._send_state_key is None:
+            return self._send_state
+
+        send_states = _send_states.get()
+        send_state  = send_states.get(self._send_state_key) if send_states is not None else None
+
+        if send_state is None:
+            send_state = self._create_send_state()
+            self._set_send_state(send_state)
+        return send_state
+
+    def _set_send_state(self, send_state: _EmailSendState) -> None:
+        """Makes the given state the state of the calling thread or task in thread-safe mode."""
+        send_states                       = WeakKeyDictionary(_send_states.get() or {})
+        send_states[self._send_state_key] = send_state
+        _send_states.set(send_states)
+
+    def enable_queued_delivery(self, delivery_queue: Optional[EmailDeliveryQueue] = None) -> "EmailSenderLogger":
+        """
+        Enables queued delivery, where `send()` hands the email over to a pool of background
+        workers and returns immediately instead of delivering it in the calling thread.
+
+        When `send()` is called, an immutable `EmailPayload` snapshot of the email is queued.
+        A worker then renders and delivers it, logs the summary, saves it to the database
+        (if enabled) and records its metadata. As a result `is_email_sent`, `email_meta_data`
+        and `email_delivery_count` are only updated once the worker has finished.
+
+        Args:
+            delivery_queue (EmailDeliveryQueue, optional): The queue to use. If omitted, the
+                process-wide queue configured by the `EMAIL_SENDER_DELIVERY_QUEUE` setting is used.
+
+        Returns:
+            EmailSenderLogger: The current instance for chaining.
+
+        Raises (from `send()`):
+            EmailQueueFullError: If the queue is full and no slot became free in time.
+            EmailQueueClosedError: If the queue has been shut down.
+        """
+        self._log_debug_trace_format()
+        self._delivery_queue = delivery_queue or get_delivery_queue()
+        self._log_message(QueueMessages.QUEUED_DELIVERY, queue=self._delivery_queue.__class__.__name__)
+        return self
+
+    def disable_queued_delivery(self) -> "EmailSenderLogger":
+        """
+        Disables queued delivery, so `send()` delivers the email in the calling thread again.
+
+        Returns:
+            EmailSenderLogger: The current instance for chaining.
+        """
+        self._log_debug_trace_format()
+        self._delivery_queue = None
+        return self
+
+    def _enqueue_send(self, **kwargs) -> None:
+        """
+        Snapshots the email and submits a job to the delivery queue that sends it.
+
+        The job runs on a copy of this logger holding its own `EmailSender` built from the
+        snapshot, so the fields of this instance can be changed or cleared while the email
+        is waiting to be delivered.
+        """
+        self._log_debug_trace_format()
+        
+        payload         = self._snapshot_email_payload()
+        delivery_logger = self._copy_for_queued_delivery(payload)
+        send_state      = self._get_send_state()
+        
+        self._delivery_queue.submit(lambda: delivery_logger._deliver_queued_payload(origin_state=send_state))
+        self._log_message(QueueMessages.EMAIL_QUEUED, email_id=payload.email_id, to_email=payload.to_email)
+
+        if kwargs.get("auto_reset"):
+            self._email_sender.clear_all_fields()
+
+    def _copy_for_queued_delivery(self, payload: EmailPayload) -> "EmailSenderLogger":
+        """
+        Creates a copy of this logger, sharing its configuration, that sends the given payload.
+
+        Args:
+            payload (EmailPayload): The snapshot of the email to send.
+
+        Returns:
+            EmailSenderLogger: The copy used by the delivery worker.
+        """
+        email_sender                    = self._email_sender.create()
+        email_sender.from_email         = payload.from_email
+        email_sender.to_email           = payload.to_email
+        email_sender.subject            = payload.subject
+        email_sender.html_template      = payload.body_html
+        email_sender.text_template      = payload.body_text
+        email_sender.context            = dict(payload.context)
+        email_sender.headers            = dict(payload.headers)
+        email_sender.list_of_recipients = dict.fromkeys(payload.recipients)
+        email_sender.email_id           = payload.email_id
+
+        # the delivery settings aren't part of the payload, so they are carried over from the sender
+        email_sender._copy_delivery_settings(self._email_sender)
+
+        delivery_logger                          = copy(self)
+        delivery_logger._send_state_key          = None
+        delivery_logger._send_state              = _EmailSendState(email_sender)
+        delivery_logger._email_payload           = payload
+        delivery_logger._fields_marked_for_reset = True
+        delivery_logger._field_changes           = self._field_changes.copy()
+        delivery_logger._methods_seen            = list(self._methods_seen)
+        delivery_logger._delivery_queue          = None
+        return delivery_logger
+
+    def _deliver_queued_payload(self, origin_state: _EmailSendState) -> None:
+        """
+        Runs on a delivery worker: sends the email and copies the outcome back to the state it was queued from.
+
+        Args:
+            origin_state (_EmailSendState): The email state of the logger whose `send()` queued the email.
+        """
+        try:
+            self.send()
+        finally:
+            self._record_queued_delivery(origin_state)
+
+    def _record_queued_delivery(self, origin_state: _EmailSendState) -> None:
+        """
+        Updates the delivery status, metadata and count of the origin state with the outcome of this delivery.
+
+        The origin state is updated under its lock, which its logger also takes to read these
+        attributes, so the thread that queued the email sees the complete outcome.
+
+        Args:
+            origin_state (_EmailSendState): The email state of the logger that queued the email.
+        """
+        meta_data              = self._meta_data
+        was_sent_successfully  = self._was_sent_successfully
+        is_delivery_successful = self._is_delivery_successful
+        email_delivery_count   = self._email_delivery_count
+
+        with origin_state._lock:
+            origin_state._meta_data              = meta_data
+            origin_state._was_sent_successfully  = was_sent_successfully
+            origin_state._is_delivery_successful = origin_state._is_delivery_successful or is_delivery_successful
+            origin_state._email_delivery_count  += email_delivery_count
       
                         
     def _log_email_preparation_details(self, recipients: list[str]) -> None:
@@ -647,6 +1132,9 @@ class EmailSenderLogger:
         Args:
             recipients (list[str]): A list of recipient email addresses to whom the email will be sent.
         """
+        if not self._logging_enabled or not self._is_log_level_enabled(LoggerType.INFO):
+            return
+        
         self._log_message(EmailLogSummary.SPACE)
         self._log_message(EmailMessages.START_EMAIL_SEND)
         self._log_message(EmailMessages.CHECK_FOR_LIST_OF_EMAIL_RECIPIENT)
@@ -965,7 +1453,8 @@ class EmailSenderLogger:
         Args:
             show_traceback (bool): A flag that determines whether a traceback should be 
                                 included in the log message. Defaults to False.
-            method_tracing (bool): shows the call between the methods
+            method_tracing (bool): shows the call between the methods. Together with `enable_verbose()`
+                                   it also turns on the per-method debug trace messages.
 
         Returns:
             EmailSenderLogger: The current instance of EmailSenderLogger, allowing for method chaining.
@@ -1126,6 +1615,8 @@ class EmailSenderLogger:
             - status (whether it was sent or not)
             - timestamp (The date it was sent)
             - errors
+            - attempts (the number of delivery attempts)
+            - stage_timings (the seconds spent in each stage, see `_get_stage_timings`)
         
         Args:
             - is_sent (bool): A boolean value that determines if an email was sent or not.
@@ -1146,19 +1637,26 @@ class EmailSenderLogger:
         else:
             timestamp = timestamp.isoformat()
         
+        attempts      = self._email_sender.delivery_attempts or 1
+        stage_timings = self._get_stage_timings()
+
         if self._fields_marked_for_reset:
              meta_data = EmailMetaData(to_email=self._email_payload.to_email,
                                   subject=self._email_payload.subject,
                                   status=status,
                                   timestamp=timestamp,
-                                  errors=errors
+                                  errors=errors,
+                                  attempts=attempts,
+                                  stage_timings=stage_timings,
                                   )
         else:
             meta_data = EmailMetaData(to_email=self._email_sender.to_email,
                                     subject=self._email_sender.subject,
                                     status=status,
                                     timestamp=timestamp,
-                                    errors=errors
+                                    errors=errors,
+                                    attempts=attempts,
+                                    stage_timings=stage_timings,
                                     )
         
         is_valid = meta_data.is_valid()
@@ -1168,6 +1666,30 @@ class EmailSenderLogger:
         self._meta_data = meta_data.to_json()
             
     
+    def _start_span(self, name: str):
+        """
+        Starts a span named `email_sender_logger.<name>` on the tracer of the `EmailSender`
+        (see `EmailSender.with_tracer`), so the logger's spans and the sender's spans
+        end up in the same trace.
+        """
+        tracer = self._email_sender._get_tracer() if self._email_sender is not None else get_tracer()
+        return tracer.start_span(f"email_sender_logger.{name}")
+
+    def _get_stage_timings(self) -> Dict[str, float]:
+        """
+        Returns the seconds spent in each stage of the last send, in the order the stages ran:
+            - prepare: the logger's own work before delivery (snapshot, logging, template previews)
+            - validate: checking the required fields
+            - render: rendering the text and HTML templates
+            - build: building the email messages
+            - throttle: waiting on the rate limiter (only with a rate limiter)
+            - deliver: handing the messages to the backend, including retries (SMTP time)
+            - enqueue: writing the messages to the outbox (only with an outbox, instead of deliver)
+
+        A stage the send didn't reach, e.g. because it failed earlier, is left out.
+        """
+        return {EmailSenderConstants.Stages.PREPARE.value: self._prepare_duration, **self._email_sender.stage_timings}
+
     def add_log_model(self, log_model: EmailBaseLog) -> "EmailSenderLogger":
         """
         Registers a custom log model with the EmailSenderLogger to enable 
@@ -1658,6 +2180,10 @@ class EmailSenderLogger:
         class name, and line number, while also including a configurable depth trace level. If logging 
         is also enabled and the logger instance is available, it logs detailed debug information.
 
+        Since almost every method calls it, it returns before looking at the call stack unless
+        verbose mode (`enable_verbose()`) and method tracing (`set_traceback(method_tracing=True)`)
+        are both on and the logger accepts DEBUG messages, so it costs next to nothing otherwise.
+
         Args:
             depth_trace (int, optional): The depth level of the trace. Defaults to 2.
                 This controls how much of the call stack is traced.
@@ -1678,9 +2204,12 @@ class EmailSenderLogger:
         if not isinstance(depth_trace, int):
             raise TypeError("Depth trace must be an integer")
 
+        if not (self._debug_verbose and self._method_tracing and self._is_log_level_enabled(LoggerType.DEBUG)):
+            return
+
         debug_info = mark_method_for_debugging(depth=depth_trace)
 
-        if debug_info and self._debug_verbose:
+        if debug_info:
             self._log_message(
                 DebugMessages.format_message(
                     DebugMessages.format_message(
@@ -1752,6 +2281,53 @@ class EmailSenderLogger:
         self._to_db = save_to_db
         return self
 
+    def enable_buffered_db_logging(self, log_writer: Optional[BufferedLogWriter] = None) -> "EmailSenderLogger":
+        """
+        Saves the email log records in batches instead of one INSERT per email.
+
+        Records are handed to a `BufferedLogWriter`, whose background thread writes them with
+        a single `bulk_create` once its batch size or flush interval is reached, outside the
+        transaction of the request. Any remaining records are written when the interpreter exits. The log model must be added with
+        `add_log_model()` first, unless a writer is passed, in which case its model is used.
+
+        Note: `enable_email_meta_data_save` must still be set for any data to be saved.
+
+        Args:
+            log_writer (BufferedLogWriter, optional): The writer to use. If omitted, the process-wide
+                writer for the log model is used, configured by the `EMAIL_SENDER_LOG_WRITER` setting.
+
+        Raises:
+            IncorrectEmailModelAddedError: If no log model has been added, or the writer
+                                           saves to a different model than the one added.
+
+        Returns:
+            EmailSenderLogger: The current instance for chaining.
+
+        Example:
+            EmailSenderLogger.create()\
+                .add_log_model(CustomLogModel)\
+                .enable_email_meta_data_save()\
+                .enable_buffered_db_logging()
+        """
+        self._log_debug_trace_format()
+
+        if log_writer is None:
+            
+            if self._log_model is None:
+                raise IncorrectEmailModelAddedError(EmailMessages.LOG_MODEL_REQUIRED_FOR_BUFFERING)
+            log_writer = get_log_writer(self._log_model)
+
+        elif self._log_model is None:
+            self.add_log_model(log_writer.log_model)
+
+        elif log_writer.log_model is not self._log_model:
+            raise IncorrectEmailModelAddedError(EmailMessages.LOG_WRITER_MODEL_MISMATCH,
+                                                writer_model=log_writer.log_model.__name__,
+                                                log_model=self._log_model.__name__
+                                                )
+        self._log_writer = log_writer
+        return self
+
     def _log_activity_to_db(self) -> "EmailSenderLogger":
         """
         Logs the email activity to the database if the email has been processed 
@@ -1828,15 +2404,7 @@ class EmailSenderLogger:
         if self._fields_marked_for_reset:
             email_payload = self._email_payload
         else:
-            email_payload = EmailPayload(
-                from_email=self._email_sender.from_email,
-                to_email=self._email_sender.to_email,
-                subject=self._email_sender.subject,
-                body_html=self._email_sender.html_template,
-                body_text=self._email_sender.text_template,
-                context=self._email_sender.context,
-                headers=self._email_sender.headers
-            )
+            email_payload       = self._snapshot_email_payload()
             self._email_payload = email_payload
             
     
@@ -1872,11 +2440,30 @@ class EmailSenderLogger:
         if not isinstance(logger_type, (LoggerType, str)): 
             return
         
+        # checked before the traceback is formatted, so dropped messages cost next to nothing
+        if not self._logging_enabled or not self._is_log_level_enabled(logger_type):
+            return
+        
         if exc is not None:
             msg = self._add_traceback(exc, msg)
     
-        if self._logging_enabled:
-            self._dispatch__log_message(msg, logger_type, *args, **kwargs)
+        self._dispatch__log_message(msg, logger_type, *args, **kwargs)
+
+    def _is_log_level_enabled(self, logger_type: str) -> bool:
+        """
+        Checks whether a message of the given type would be emitted by the configured logger.
+
+        Args:
+            logger_type (str): The type of log e.g. 'debug', 'info', 'warning' or 'error'.
+
+        Returns:
+            bool: True if a logger is configured and accepts messages of that level, False otherwise.
+        """
+        if not self._logger:
+            return False
+        
+        level = _LOG_LEVELS.get(logger_type.lower(), logging.INFO)
+        return self._logger.isEnabledFor(level)
 
     def _add_traceback(self, exc: Exception, msg: str) -> str:
         """
@@ -1927,11 +2514,14 @@ class EmailSenderLogger:
         """
         Dispatches a formatted log message to the appropriate logging method.
 
-        This method first formats the provided message using the `translate_message` function,
-        into a language that can be translated to any of the supported languages, and then selects 
-        the correct logging method based on the `logger_type` provided e.g 'DEBUG', 'ERROR', etc. 
-        If the logging method is found, it calls the method to log the message ar raises 
-        an exception if occurs during the process, it silently ignores the error.
+        The message is only dispatched if the logger accepts messages of the given level, so
+        messages dropped by the level never pay for formatting it with the `translate_message`
+        function, into a language that can be translated to any of the supported languages.
+        The message is passed to the logger as a plain string, so filters and handlers that
+        expect `record.msg` to be a `str` keep working. The correct logging method is selected based on the
+        `logger_type` provided e.g 'DEBUG', 'ERROR', etc. If the logging method is found, it calls
+        the method to log the message ar raises an exception if occurs during the process, it
+        silently ignores the error.
 
         Args:
             msg (str): The message to be logged.
@@ -1945,11 +2535,13 @@ class EmailSenderLogger:
         """
         try:
             
-            formatted_msg = translate_message(msg, *args, **kwargs)
-            log_method    = self._get_log_method(logger_type)  
+            if not self._is_log_level_enabled(logger_type):
+                return
+            
+            log_method = self._get_log_method(logger_type)  
                        
             if log_method:
-                log_method(formatted_msg)
+                log_method(str(translate_message(msg, *args, **kwargs)))
                 
         except Exception as e:
             self._log_message("ERROR - {e}", LoggerType.DEBUG, e=str(e))
@@ -2066,8 +2658,7 @@ class EmailSenderLogger:
         
         self._log_debug_trace_format()
         
-        html_preview = get_html_preview(self._read_content_from_file(html_path), preview_chars)
-        text_preview = get_safe_text_preview(self._read_content_from_file(text_path), preview_chars)
+        html_preview, text_preview = self._get_template_previews(html_path, text_path, preview_chars)
 
         # check if a preview is available, if not shows the 'HAS_PREVIEW' message.
         self._text_preview = text_preview or translate_message(HAS_PREVIEW, ".html")
@@ -2081,6 +2672,22 @@ class EmailSenderLogger:
 
         return html_preview, text_preview
     
+    def _get_template_previews(self, html_path, text_path, preview_chars: int) -> tuple:
+        """
+        Returns the HTML and text previews from the process-wide preview cache
+        (see `template_cache.get_template_previews`), so repeated sends of the same
+        templates don't read or parse the files again.
+
+        If a file can't be read, its preview is built from the message returned by
+        `_read_content_from_file`, which also logs the failure.
+        """
+        try:
+            return get_template_previews(html_path, text_path, preview_chars)
+        except OSError:
+            html_preview = get_html_preview(self._read_content_from_file(html_path), preview_chars)
+            text_preview = get_safe_text_preview(self._read_content_from_file(text_path), preview_chars)
+            return html_preview, text_preview
+
     def _read_content_from_file(self, file_path):
         """
         Reads the content of a file at the specified path.
@@ -2189,9 +2796,22 @@ class EmailSenderLogger:
             str: (Implicitly returns `None`, but could return summary string if needed in the future.)
             
         """
+        if not self._logging_enabled or not self._is_log_level_enabled(LoggerType.INFO):
+            return
+
+        if self._structured_summary:
+            self._log_structured_email_summary(additional_recipients=additional_recipients,
+                                               time_taken=time_taken,
+                                               status=status,
+                                               emails_sent_count=emails_sent_count,
+                                               timestamp=timestamp,
+                                               attachments=attachments,
+                                               )
+            return
 
         skipped        = self._get_num_of_skipped_fields()
-        status_message = "Successfully sent" if status else "Failed to send email"
+        send_status    = self._get_send_status(status)
+        status_message = _SEND_STATUS_MESSAGES[send_status]
         
         fields = ", ".join(self._fields)
         skipped_fields = ", ".join(self._exclude_fields)
@@ -2207,7 +2827,7 @@ class EmailSenderLogger:
         self._log_message(EmailLogSummary.FROM, from_email=self._email_payload.from_email)
         self._log_message(EmailLogSummary.TO, to_email=self._email_payload.to_email)
         self._log_message(EmailLogSummary.ADDITIONAL_RECIPIENTS, additional_recipients=additional_recipients)
-        self._log_message(EmailLogSummary.TOTAL_RECIPIENTS, total_recipients=len(additional_recipients) + 1)
+        self._log_message(EmailLogSummary.TOTAL_RECIPIENTS, total_recipients=self._count_total_recipients())
         self._log_message(EmailLogSummary.HTML_TEMPLATE, html_template=self._email_payload.body_html)
         self._log_message(EmailLogSummary.TEXT_TEMPLATE, text_template=self._email_payload.body_text)
         self._log_message(EmailLogSummary.HTML_SHORT_NAME, html_name=self._field_changes.get("short_html_name"))
@@ -2215,8 +2835,12 @@ class EmailSenderLogger:
         self._log_message(EmailLogSummary.ATTACHMENTS, attachments=attachments)
         self._log_message(EmailLogSummary.ENVIRONMENT, environment=self._get_environment())
         self._log_message(EmailLogSummary.TIME_TAKEN, time_taken=time_taken)
+        self._log_message(EmailLogSummary.STAGE_TIMINGS, stage_timings=format_stage_timings(self._get_stage_timings()))
         self._log_message(EmailLogSummary.STATUS, status_message=status_message)
-        self._log_message(EmailLogSummary.DELIVERED, delivered=emails_sent_count)
+        if send_status == "enqueued":
+            self._log_message(EmailLogSummary.ENQUEUED, enqueued=emails_sent_count)
+        else:
+            self._log_message(EmailLogSummary.DELIVERED, delivered=emails_sent_count)
         self._log_message(EmailLogSummary.TEXT_PREVIEW, text_preview=self._text_preview)
         self._log_message(EmailLogSummary.HTML_PREVIEW, html_preview=self._html_preview)
         self._log_message(EmailLogSummary.EMAIL_FORMAT)
@@ -2234,6 +2858,115 @@ class EmailSenderLogger:
         self._log_message(FieldSummaryLog.END_SUMMARY)
         self._log_message(EmailLogSummary.SPACE)
            
+    def _get_send_status(self, is_sent: bool) -> str:
+        """
+        Returns the outcome of the send reported by the summary: "sent", "failed", or "enqueued"
+        when the email was written to the outbox (see `EmailSender.with_outbox`) instead of being delivered.
+        """
+        if not is_sent:
+            return "failed"
+        return "enqueued" if self._email_sender.was_enqueued else "sent"
+
+    def _count_total_recipients(self) -> int:
+        """
+        Returns the number of distinct addresses the email was sent to, deduplicated like
+        `EmailSender._get_recipients()`. They are counted from the payload snapshot taken
+        before the send, as `auto_reset` clears the recipients of the sender once it is sent.
+        """
+        payload    = self._email_payload
+        recipients = [payload.to_email, *payload.recipients] if payload.to_email else list(payload.recipients)
+        return len(dedupe_recipients(recipients))
+
+    def _log_structured_email_summary(self, additional_recipients, time_taken, status, emails_sent_count, timestamp, attachments=None) -> None:
+        """
+        Logs the summary of the email sending operation as a single record.
+
+        The record carries the full summary as a dictionary in its `email_summary` attribute
+        (passed through `extra=`), so JSON log handlers can output every field, while text
+        handlers only output a one-line message. This replaces the roughly thirty separate
+        log lines of the banner summary with one log write per email.
+
+        Args:
+            additional_recipients (list): List of email addresses.
+            time_taken (float): Duration in seconds it took to process and send the email.
+            status (bool): Whether the email was successfully sent (`True`) or failed (`False`).
+            emails_sent_count (int): Number of recipients to whom the email was actually sent.
+            timestamp (datetime): Timestamp when the email was processed.
+            attachments (list, optional): List of attached file names, if any. Defaults to `None`.
+        """
+        send_status    = self._get_send_status(status)
+        status_message = _SEND_STATUS_MESSAGES[send_status]
+        is_enqueued    = send_status == "enqueued"
+
+        summary = {
+            "email_id": self._email_sender.email_id,
+            "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+            "language": settings.LANGUAGE_CODE,
+            "subject": self._email_payload.subject,
+            "from_email": self._email_payload.from_email,
+            "to_email": self._email_payload.to_email,
+            "additional_recipients": list(additional_recipients),
+            "total_recipients": self._count_total_recipients(),
+            "html_template": self._email_payload.body_html,
+            "text_template": self._email_payload.body_text,
+            "html_short_name": self._field_changes.get("short_html_name"),
+            "text_short_name": self._field_changes.get("short_text_name"),
+            "attachments": attachments,
+            "environment": str(self._get_environment()),
+            "duration": time_taken,
+            "stage_timings": self._get_stage_timings(),
+            "status": send_status,
+            "delivered": 0 if is_enqueued else emails_sent_count,
+            "enqueued": emails_sent_count if is_enqueued else 0,
+            "text_preview": self._text_preview,
+            "html_preview": self._html_preview,
+            "fields_logged": sorted(self._fields),
+            "fields_skipped": sorted(self._exclude_fields),
+            "headers_set": self._is_headers_set,
+            "context_set": self._is_context_set,
+            "field_audit": self._get_field_audit(),
+        }
+
+        # a LoggerAdapter replaces the `extra` passed to it, so the record is logged on the
+        # underlying logger with the adapter's extra merged in
+        logger = getattr(self._logger, "logger", self._logger)
+        extra  = {**getattr(self._logger, "extra", {}), "email_summary": summary}
+
+        logger.info(str(translate_message(EmailLogSummary.STRUCTURED_SUMMARY,
+                                          email_id=summary["email_id"],
+                                          to_email=summary["to_email"],
+                                          status_message=status_message,
+                                          time_taken=time_taken,
+                                          )),
+                    extra=extra
+                    )
+
+    def enable_structured_summary(self, structured_summary: bool = True) -> "EmailSenderLogger":
+        """
+        Switches the summary logged after each email between the structured and the banner format.
+
+        - Structured: a single log record whose `email_summary` attribute holds a dictionary with
+          the email id, timestamps, recipients, duration, status and field audit. Suited to JSON
+          log handlers in production, since it is one log write per email.
+        - Banner (default): the human-readable multi-line summary, suited to development.
+
+        The default for new loggers can be set with `EMAIL_SENDER_STRUCTURED_SUMMARY = True` in settings.py.
+
+        Args:
+            structured_summary (bool): True for the structured summary, False for the banner. Defaults to True.
+
+        Returns:
+            EmailSenderLogger: The current instance for chaining.
+
+        Example:
+            class JsonFormatter(logging.Formatter):
+                def format(self, record):
+                    return json.dumps(getattr(record, "email_summary", {"message": record.getMessage()}), default=str)
+        """
+        self._log_debug_trace_format()
+        self._structured_summary = structured_summary
+        return self
+
     def log_only_fields(self, *fields):
         """
         Enables selective logging for specific fields during trace logging.
@@ -2343,7 +3076,13 @@ class EmailSenderLogger:
 
         try:
             
-            log_model.save()
+            if self._log_writer is not None:
+                self._log_writer.add(log_model)
+                self._log_message(EmailMessages.EMAIL_BUFFERED_FOR_DB, LoggerType.DEBUG, 
+                                  pending=self._log_writer.pending_records)
+            else:
+                log_model.save()
+            
             self._email_was_processed = None  # Reset state
             return True
         
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
-from typing import List, Optional, Dict, Union
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from typing import Any, List, Optional, Dict, Union
+from django.core.mail import EmailMultiAlternatives, get_connection
 from pathlib import Path
-from os.path import join, exists
+from contextlib import contextmanager
+from functools import partial
+from inspect import iscoroutinefunction
+from os.path import join
 from secrets import token_hex
+from time import perf_counter
 
 from django_email_sender.exceptions import (
     EmailTemplateNotFound,
@@ -14,13 +21,23 @@ from django_email_sender.exceptions import (
     ContextIsNotADictionary,
     EmailSenderBaseException,
     EmailSendError,
+    EmailDeliveryAttemptsExhausted,
     IncorrectEmailSenderFieldType,
    
 )
 
 from django_email_sender.messages import TemplateMessages, EmailMessages, ContextMessages, FieldMessages
 from django_email_sender.email_sender_constants import EmailSenderConstants
-from .utils import get_template_dirs
+from django_email_sender.email_sender_payload import EmailSendResult
+from .connection_pool import EmailConnectionPool, get_connection_pool
+from .metrics import is_metrics_enabled, record_enqueue, record_send
+from .personalisation import render_shared_templates
+from .rate_limit import EmailRateLimiter, get_rate_limiter
+from .retry import RetryPolicy, get_retry_policy
+from .template_cache import path_exists, render_template
+from .tracing import Tracer, get_tracer
+from .utils import chunk_recipients, dedupe_recipients, get_template_dirs, normalise_email_address
+from .validation import validate_custom_email_model
 from .translation import safe_set_language
 
 
@@ -107,8 +124,18 @@ class EmailSender:
         self.text_template: Optional[str] = None
         self.context: Dict[str, str]      = {}
         self.headers: Dict[str, str]      = {}
-        self.list_of_recipients           = set()
+        self.list_of_recipients: Dict[str, None] = {}
         self.email_id                     = token_hex()
+        self.recipient_chunk_size: Optional[int] = None
+        self.connection_pool                     = None
+        self.rate_limiter                        = None
+        self.retry_policy                        = None
+        self.outbox_model                        = None
+        self.tracer                              = None
+        self.delivery_attempts: int              = 0
+        self.delivery_retries: int               = 0
+        self.was_enqueued: bool                  = False
+        self.stage_timings: Dict[str, float]     = {}
       
         self.fields_to_reset = {
             EmailSenderConstants.Fields.FROM_EMAIL.value: None,
@@ -253,8 +280,12 @@ class EmailSender:
         """
         Adds an additional email recipient to the list of recipients.
 
-        This method ensures no duplicate recipients are added by storing 
-        them internally in a set.
+        This method ensures no duplicate recipients are added by storing them
+        internally as the keys of a dict, which keeps them in the order they
+        were added, so the recipients are always chunked in the same order.
+        The address is normalised first (see `utils.normalise_email_address`),
+        so addresses that only differ in the case of their domain are treated
+        as the same recipient.
 
         Args:
             recipient (str): The email address to add as a recipient.
@@ -266,8 +297,147 @@ class EmailSender:
         if not isinstance(recipient, str):
             raise IncorrectEmailSenderFieldType(FieldMessages.FIELD_TYPE_IS_INCORRECT, expected_type=recipient, received_type=type(recipient))
             
-        self.list_of_recipients.add(recipient)
+        self.list_of_recipients[normalise_email_address(recipient)] = None
+        return self
+
+    def with_recipient_chunk_size(self, chunk_size: Optional[int]) -> "EmailSender":
+        """
+        Sets the maximum number of recipients per message.
+
+        When the email has more recipients than this, `send()` splits them into several
+        messages, rendered once and delivered over a single connection, instead of one
+        message with a very large To: header. Defaults to the `EMAIL_SENDER_RECIPIENT_CHUNK_SIZE`
+        setting, or 100 if it isn't set.
+
+        Args:
+            chunk_size (int, optional): The maximum number of recipients per message. 0 disables the chunking,
+                                        None uses the setting.
+
+        Returns:
+            EmailSender: The current instance for chaining.
+        """
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 0):
+            raise IncorrectEmailSenderFieldType(FieldMessages.FIELD_TYPE_IS_INCORRECT, expected_type=int, received_type=type(chunk_size))
+        
+        self.recipient_chunk_size = chunk_size
+        return self
+
+    def with_connection_pool(self, connection_pool: Optional[EmailConnectionPool]) -> "EmailSender":
+        """
+        Sets the connection pool `send()` and `asend()` deliver through, so the email reuses an
+        already open (and authenticated) backend connection instead of opening a new one.
+
+        Defaults to the process-wide pool configured by the `EMAIL_SENDER_CONNECTION_POOL`
+        setting. Without the setting and without a pool, a new connection is opened per email.
+
+        Args:
+            connection_pool (EmailConnectionPool, optional): The pool to use, or None for the default.
+
+        Returns:
+            EmailSender: The current instance for chaining.
+        """
+        self.connection_pool = connection_pool
+        return self
+
+    def with_rate_limiter(self, rate_limiter: Optional[EmailRateLimiter]) -> "EmailSender":
+        """
+        Sets the rate limiter the email waits on before it is delivered, so bursts are spread
+        out to the rate the email provider accepts instead of being rejected.
+
+        Defaults to the process-wide limiter configured by the `EMAIL_SENDER_RATE_LIMIT` setting.
+        Without the setting and without a limiter, emails are sent straight away.
+
+        Args:
+            rate_limiter (EmailRateLimiter, optional): The limiter to use, or None for the default.
+
+        Returns:
+            EmailSender: The current instance for chaining.
+        """
+        self.rate_limiter = rate_limiter
+        return self
+
+    def with_retry_policy(self, retry_policy: Optional[RetryPolicy]) -> "EmailSender":
+        """
+        Sets the policy used to retry deliveries that failed for a transient reason
+        (4xx SMTP replies, dropped connections, timeouts).
+
+        Defaults to the process-wide policy configured by the `EMAIL_SENDER_RETRY` setting.
+        Without the setting and without a policy, a single delivery attempt is made.
+
+        Args:
+            retry_policy (RetryPolicy, optional): The policy to use, or None for the default.
+
+        Returns:
+            EmailSender: The current instance for chaining.
+        """
+        self.retry_policy = retry_policy
+        return self
+
+    def with_outbox(self, outbox_model) -> "EmailSender":
+        """
+        Sets the outbox model `send()` and `asend()` write the rendered email to, instead of delivering it.
+
+        The email is then delivered by an `outbox.OutboxWorker` (see the `process_email_outbox`
+        management command). As the row is written with the caller's database connection, sending
+        inside `transaction.atomic()` only enqueues the email if the transaction commits, and an
+        email that was enqueued survives the process that rendered it.
+
+        Defaults to the model named by the `EMAIL_SENDER_OUTBOX_MODEL` setting. Without the
+        setting and without a model, the email is delivered straight away.
+
+        Args:
+            outbox_model (class, optional): A class inheriting from `EmailBaseOutbox`, or None for the default.
+
+        Returns:
+            EmailSender: The current instance for chaining.
+        """
+        if outbox_model is not None:
+            # imported here as the models can't be imported before the app registry is ready
+            from django_email_sender.models import EmailBaseOutbox
+
+            validate_custom_email_model(outbox_model, EmailBaseOutbox)
+
+        self.outbox_model = outbox_model
+        return self
+
+    def with_tracer(self, tracer: Optional[Tracer]) -> "EmailSender":
+        """
+        Sets the tracer `send()` and `asend()` report their spans to: one span for the send
+        and a child span for each stage (validate, render, build, throttle, deliver or enqueue).
+
+        Defaults to the process-wide tracer configured by the `EMAIL_SENDER_TRACER` setting.
+        Without the setting and without a tracer, nothing is traced.
+
+        Args:
+            tracer (Tracer, optional): The tracer to use, e.g. `tracing.OpenTelemetryTracer()`, or None for the default.
+
+        Returns:
+            EmailSender: The current instance for chaining.
+        """
+        self.tracer = tracer
         return self
+
+    def _copy_delivery_settings(self, email_sender: "EmailSender") -> "EmailSender":
+        """
+        Copies how the email is delivered (chunk size, connection pool, rate limiter, retry policy,
+        outbox and tracer) from another sender, without any of its email fields.
+
+        Returns:
+            EmailSender: The current instance for chaining.
+        """
+        self.recipient_chunk_size = email_sender.recipient_chunk_size
+        self.connection_pool      = email_sender.connection_pool
+        self.rate_limiter         = email_sender.rate_limiter
+        self.retry_policy         = email_sender.retry_policy
+        self.outbox_model         = email_sender.outbox_model
+        self.tracer               = email_sender.tracer
+        return self
+
+    def _get_recipient_chunk_size(self) -> Optional[int]:
+        """Returns the maximum number of recipients per message, 0 or None meaning no limit."""
+        if self.recipient_chunk_size is not None:
+            return self.recipient_chunk_size
+        return getattr(settings, "EMAIL_SENDER_RECIPIENT_CHUNK_SIZE", 100)
             
     def _raise_if_template_path_not_found(self, email_path: str) -> None:
         """
@@ -281,19 +451,22 @@ class EmailSender:
         Args:
             email_path (str): The full relative path to the template file to check.
 
+        Existence checks are cached per worker (see `template_cache.path_exists`), so each directory
+        and template is only looked up on disk once unless `EMAIL_SENDER_PATH_CACHE_TTL` says otherwise.
+
         Raises:
             TemplateDirNotFound: If the base template directory is missing.
             EmailTemplateDirNotFound: If the 'email_templates' folder is missing.
             TemplateNotFound: If the given email template file does not exist.
         """
      
-        if not exists(TEMPLATES_DIR):
+        if not path_exists(TEMPLATES_DIR):
             raise TemplateDirNotFound(message=TemplateMessages.PRIMARY_TEMPLATE_MISSING)
 
-        if not exists(EMAIL_TEMPLATES_DIR):
+        if not path_exists(EMAIL_TEMPLATES_DIR):
             raise EmailTemplateNotFound(message=TemplateMessages.format_message(TemplateMessages.EMAIL_TEMPLATE_NOT_FOUND, path=EMAIL_TEMPLATES_DIR))
 
-        if not exists(email_path):
+        if not path_exists(email_path):
             raise EmailTemplateNotFound(message=TemplateMessages.format_message(TemplateMessages.TEMPLATE_NOT_FOUND, path=email_path))
 
     def _create_path(self, template_name: str, folder_name: str = None):
@@ -348,15 +521,22 @@ class EmailSender:
         self.headers = headers
         return self
 
-    def _validate(self):
-        """ """
-        if not all([self.from_email, self.to_email, self.subject, self.html_template, self.text_template]):
+    def _validate(self, require_recipient: bool = True):
+        """
+        Ensures all the required email components are set and that the templates exist.
+
+        Args:
+            require_recipient (bool): If False, the `to_email` field is not required. This is used
+                                      by `send_many` where each message carries its own recipient.
+        """
+        recipient = self.to_email if require_recipient else True
+        
+        if not all([self.from_email, recipient, self.subject, self.html_template, self.text_template]):
             
             error_msg =  _("All email components (from, to, subject, html, text) must be set before sending.")
             raise EmailSenderBaseException(error_msg)
 
-        self._raise_if_template_path_not_found(TEMPLATES_DIR)
-        self._raise_if_template_path_not_found(EMAIL_TEMPLATES_DIR)
+        # Both template directories are checked by every call, so only the templates need checking
         self._raise_if_template_path_not_found(self.text_template)
         self._raise_if_template_path_not_found(self.html_template)
 
@@ -402,10 +582,11 @@ class EmailSender:
         Returns a combined list of email recipients.
 
         This includes the primary recipient `self.to_email` (if provided and not None)
-        and any additional recipients from `self.list_of_recipients`.
+        and any additional recipients from `self.list_of_recipients`. The addresses are
+        normalised and deduplicated, so the primary recipient is never sent the email twice.
 
         Returns:
-            list: A list of recipient email addresses.
+            list: A list of unique recipient email addresses, starting with the primary recipient.
         """
         recipients = []
         
@@ -413,7 +594,48 @@ class EmailSender:
             recipients.append(self.to_email)
         if self.list_of_recipients:
             recipients.extend(self.list_of_recipients)
-        return recipients
+        return dedupe_recipients(recipients)
+
+    def _build_messages(self, recipients: List[str], context: Dict, connection=None) -> List[EmailMultiAlternatives]:
+        """
+        Renders the templates once and builds one message per chunk of recipients
+        (see `with_recipient_chunk_size`).
+
+        Returns:
+            List[EmailMultiAlternatives]: The messages, a single one unless the recipients had to be split.
+        """
+        with self._measure_stage(EmailSenderConstants.Stages.RENDER):
+            text_content = render_template(self.text_template, context=context)
+            html_content = render_template(self.html_template, context=context)
+
+        with self._measure_stage(EmailSenderConstants.Stages.BUILD):
+            chunks = chunk_recipients(recipients, self._get_recipient_chunk_size())
+            return [self._create_message(chunk, text_content, html_content, connection=connection) for chunk in chunks]
+
+    def _create_message(self, recipients: List[str], text_content: str, html_content: str, connection=None) -> EmailMultiAlternatives:
+        """
+        Builds the email message from the already rendered text and HTML content.
+
+        Args:
+            recipients (List[str]): The email addresses the message will be delivered to.
+            text_content (str): The rendered text template, used as the body.
+            html_content (str): The rendered HTML template, attached as the HTML alternative.
+            connection (optional): An open email backend connection to send the message through.
+
+        Returns:
+            EmailMultiAlternatives: The message, ready to be sent.
+        """
+        msg = EmailMultiAlternatives(
+            subject=self.subject,
+            body=text_content,
+            from_email=self.from_email,
+            to=recipients,
+            headers=self.headers or {},
+            connection=connection,
+        )
+     
+        msg.attach_alternative(html_content, "text/html")
+        return msg
 
     def send(self, auto_reset: bool = False) -> int:
         """
@@ -429,34 +651,535 @@ class EmailSender:
             EmailSendError: Raises an EmailSendError if an error occurs while sending an email.
 
         Returns:
-            int: The number of successfully delivered messages (typically 1 if successful).
+            int: The number of successfully delivered messages (typically 1, or one per chunk when the recipients are split).
         """
-        self._validate()
-            
-        text_content = render_to_string(self.text_template, context=self.context)
-        html_content = render_to_string(self.html_template, context=self.context)
+        self.stage_timings = {}
 
-        msg = EmailMultiAlternatives(
-            subject=self.subject,
-            body=text_content,
-            from_email=self.from_email,
-            to=self._get_recipients(),
-            headers=self.headers or {},
-        )
-     
-        msg.attach_alternative(html_content, "text/html")
+        with self._start_send_span("email_sender.send"), self._record_failed_send():
+            return self._send(auto_reset)
+
+    def _send(self, auto_reset: bool = False) -> int:
+        with self._measure_stage(EmailSenderConstants.Stages.VALIDATE):
+            self._validate()
+
+        outbox_model = self._get_outbox_model()
+
+        if outbox_model:
+            return self._enqueue(outbox_model, auto_reset)
+        
+        connection_pool = self.connection_pool or get_connection_pool()
+        connection      = None if connection_pool else get_connection()
+        messages        = self._build_messages(self._get_recipients(), self.context, connection=connection)
+
+        self._throttle(messages)
 
         try:
-            resp = msg.send()
+            resp = self._deliver_and_record(messages, connection_pool, connection)
+
             is_sent = True if resp > 0 else False
             if auto_reset:
                 self.clear_all_fields()
     
             return (resp, is_sent)
 
+        except EmailDeliveryAttemptsExhausted:
+            raise
         except EmailSendError as e:
-            error_msg = EmailMessages.FAILED_TO_SEND_EMAIL.format(from_user=self.from_address, to_user=self.to, error=str(e))
+            error_msg = EmailMessages.FAILED_TO_SEND_EMAIL.format(from_user=self.from_email, to_user=self.to_email, error=str(e))
             raise EmailSendError(message=error_msg)
         except EmailSenderBaseException as e:
           raise EmailSendError(message=EmailMessages.ERROR_OCCURED, e=_("Something went wrong and the email wasn't sent"))
 
+    async def asend(self, auto_reset: bool = False) -> int:
+        """
+        Asynchronously send the email using Django's email backend.
+
+        This is the non-blocking version of `send()` for use in async (ASGI) views. The templates
+        are rendered in a worker thread, and the message is then delivered through the backend's
+        `asend_messages()` coroutine when the configured backend provides one. Otherwise the
+        blocking delivery runs in a worker thread, so the event loop is never blocked.
+
+        Args:
+            auto_reset (bool): If auto_reset is True, the instance is reset after sending.
+
+        Raises:
+            ValueError: If any required fields are missing before sending.
+            EmailSendError: Raises an EmailSendError if an error occurs while sending an email.
+
+        Returns:
+            int: The number of successfully delivered messages (typically 1, or one per chunk when the recipients are split).
+
+        Example:
+            async def send_verification_email(user):
+                return await EmailSender.create()\
+                    .from_address("no-reply@example.com")\
+                    .to(user.email)\
+                    .with_subject("Verify Your Email")\
+                    .with_context({"username": user.username})\
+                    .with_text_template(folder_name="emails", template_name="verification.txt")\
+                    .with_html_template(folder_name="emails", template_name="verification.html")\
+                    .asend()
+        """
+        self.stage_timings = {}
+
+        with self._start_send_span("email_sender.asend"), self._record_failed_send():
+            return await self._asend(auto_reset)
+
+    async def _asend(self, auto_reset: bool = False) -> int:
+        with self._measure_stage(EmailSenderConstants.Stages.VALIDATE):
+            self._validate()
+
+        outbox_model = self._get_outbox_model()
+
+        if outbox_model:
+            return await sync_to_async(self._enqueue)(outbox_model, auto_reset)
+
+        connection_pool = self.connection_pool or get_connection_pool()
+        connection      = None if connection_pool else get_connection()
+        messages        = await sync_to_async(self._build_messages, thread_sensitive=False)(
+                                              self._get_recipients(), self.context, connection=connection)
+        rate_limiter    = self.rate_limiter or get_rate_limiter()
+
+        if rate_limiter:
+            with self._measure_stage(EmailSenderConstants.Stages.THROTTLE):
+                await asyncio.sleep(rate_limiter.reserve(self.from_email, tokens=len(messages)))
+
+        try:
+            resp = await self._adeliver_and_record(messages, connection_pool, connection)
+
+            is_sent = True if resp and resp > 0 else False
+            if auto_reset:
+                self.clear_all_fields()
+
+            return (resp or 0, is_sent)
+
+        except EmailDeliveryAttemptsExhausted:
+            raise
+        except EmailSendError as e:
+            error_msg = EmailMessages.FAILED_TO_SEND_EMAIL.format(from_user=self.from_email, to_user=self.to_email, error=str(e))
+            raise EmailSendError(message=error_msg)
+        except EmailSenderBaseException as e:
+            raise EmailSendError(message=EmailMessages.ERROR_OCCURED, e=_("Something went wrong and the email wasn't sent"))
+
+    def _get_outbox_model(self):
+        """Returns the outbox model the email is written to (see `with_outbox`), or None to deliver it straight away."""
+        if self.outbox_model is not None:
+            return self.outbox_model
+
+        # imported here as the outbox imports the models, which can't be imported before the app registry is ready
+        from .outbox import get_outbox_model
+
+        return get_outbox_model()
+
+    def _enqueue(self, outbox_model, auto_reset: bool = False) -> int:
+        """
+        Renders the email and writes its messages to the outbox.
+
+        Returns:
+            tuple: The number of messages enqueued and whether the email was enqueued.
+        """
+        messages = self._build_messages(self._get_recipients(), self.context)
+        rows     = self._enqueue_messages(outbox_model, messages)
+
+        if auto_reset:
+            self.clear_all_fields()
+        return (len(rows), bool(rows))
+
+    def _enqueue_messages(self, outbox_model, messages: List[EmailMultiAlternatives]) -> list:
+        """Writes the rendered messages to the outbox and records the enqueue in the metrics registry."""
+        from .outbox import enqueue_messages
+
+        self.delivery_attempts = 0
+        self.delivery_retries  = 0
+
+        with self._measure_stage(EmailSenderConstants.Stages.ENQUEUE):
+            rows = enqueue_messages(outbox_model, messages, email_id=self.email_id)
+
+        self.was_enqueued = True
+
+        if is_metrics_enabled():
+            record_enqueue(self._get_template_label(), self.stage_timings)
+        return rows
+
+    def _throttle(self, messages: List[EmailMultiAlternatives]) -> None:
+        """Waits until the rate limiter (see `with_rate_limiter`) lets the messages through."""
+        rate_limiter = self.rate_limiter or get_rate_limiter()
+
+        if rate_limiter:
+            with self._measure_stage(EmailSenderConstants.Stages.THROTTLE):
+                rate_limiter.acquire(self.from_email, tokens=len(messages))
+
+    def _deliver_and_record(self, messages: List[EmailMultiAlternatives], connection_pool=None, connection=None,
+                            close_connection: bool = True) -> int:
+        """
+        Times the delivery of the messages and records the delivered email in the metrics registry
+        (see `metrics.py`). A failed delivery is recorded by `_record_failed_send`.
+        """
+        with self._measure_stage(EmailSenderConstants.Stages.DELIVER):
+            sent = self._deliver(messages, connection_pool, connection, close_connection)
+
+        self._record_metrics(messages, sent)
+        return sent
+
+    async def _adeliver_and_record(self, messages: List[EmailMultiAlternatives], connection_pool=None, connection=None) -> int:
+        """The async version of `_deliver_and_record`."""
+        with self._measure_stage(EmailSenderConstants.Stages.DELIVER):
+            sent = await self._adeliver(messages, connection_pool, connection)
+
+        self._record_metrics(messages, sent or 0)
+        return sent
+
+    @contextmanager
+    def _record_failed_send(self):
+        """
+        Records a send that raised in the metrics registry, whichever stage it failed in:
+        validation, rendering, the rate limiter, the delivery or the outbox. The outcome of
+        the previous send (`delivery_attempts`, `delivery_retries`, `was_enqueued`) is reset first.
+        """
+        self.delivery_attempts = 0
+        self.delivery_retries  = 0
+        self.was_enqueued      = False
+
+        try:
+            yield
+        except Exception as error:
+            self._record_metrics([], 0, error)
+            raise
+
+    def _record_metrics(self, messages: List[EmailMultiAlternatives], sent: int, error: Exception = None) -> None:
+        if not is_metrics_enabled():
+            return
+
+        message_bytes = 0
+
+        if error is None:
+            for message in messages:
+                message_bytes += len(message.body.encode()) + sum(len(str(content).encode()) for content, _ in message.alternatives)
+
+        record_send(self._get_template_label(), self.stage_timings,
+                    messages_sent=sent,
+                    message_bytes=message_bytes,
+                    retries=self.delivery_retries,
+                    error=error,
+                    )
+
+    def _get_template_label(self) -> str:
+        """
+        Returns the HTML template relative to the email templates directory, used as the
+        `template` label of the metrics and the `email.template` attribute of the spans.
+        """
+        if not self.html_template:
+            return ""
+        try:
+            return Path(self.html_template).relative_to(EMAIL_TEMPLATES_DIR).as_posix()
+        except ValueError:
+            return Path(self.html_template).name
+
+    def _deliver(self, messages: List[EmailMultiAlternatives], connection_pool=None, connection=None,
+                 close_connection: bool = True) -> int:
+        """
+        Delivers the rendered messages through the connection pool or the connection.
+
+        With a retry policy each message is retried on its own, so a transient failure never
+        resends a message that was already delivered, and the already rendered message is
+        reused for every attempt. The attempts are counted per message: `delivery_attempts`
+        holds the most attempts any message needed and `delivery_retries` the number of
+        retries of all the messages together.
+
+        `close_connection` is False when the connection is shared by the messages of a
+        `send_many` batch, which closes it after the last one.
+
+        Returns:
+            int: The number of messages delivered.
+
+        Raises:
+            EmailDeliveryAttemptsExhausted: If a message still couldn't be delivered after the retries.
+            Exception: A permanent error (see `RetryPolicy.is_transient`) is raised unchanged.
+        """
+        retry_policy           = self.retry_policy or get_retry_policy()
+        self.delivery_attempts = 0
+        self.delivery_retries  = 0
+
+        if retry_policy is None:
+            self.delivery_attempts = 1
+
+            # A large recipient list is split into several messages, sent over the same connection
+            if connection_pool:
+                return connection_pool.send_messages(messages)
+            return messages[0].send() if len(messages) == 1 else connection.send_messages(messages)
+
+        try:
+            return sum(retry_policy.call(partial(self._deliver_message, message, connection_pool), 
+                                         on_attempt=self._count_delivery_attempt)
+                       for message in messages)
+        
+        except Exception as e:
+            if not retry_policy.is_transient(e):
+                raise
+            raise EmailDeliveryAttemptsExhausted(EmailMessages.FAILED_AFTER_ATTEMPTS, attempts=self.delivery_attempts, error=str(e))
+        
+        finally:
+            if close_connection:
+                self._close_connection(connection)
+
+    async def _adeliver(self, messages: List[EmailMultiAlternatives], connection_pool=None, connection=None) -> int:
+        """The async version of `_deliver`, using the backend's `asend_messages()` coroutine when it has one."""
+        retry_policy           = self.retry_policy or get_retry_policy()
+        self.delivery_attempts = 0
+        self.delivery_retries  = 0
+
+        if retry_policy is None:
+            self.delivery_attempts = 1
+            return await self._adeliver_messages(messages, connection_pool, connection)
+
+        try:
+            sent = 0
+            
+            for message in messages:
+                sent += await retry_policy.acall(partial(self._adeliver_messages, [message], connection_pool, connection, True),
+                                                 on_attempt=self._count_delivery_attempt)
+            return sent
+        
+        except Exception as e:
+            if not retry_policy.is_transient(e):
+                raise
+            raise EmailDeliveryAttemptsExhausted(EmailMessages.FAILED_AFTER_ATTEMPTS, attempts=self.delivery_attempts, error=str(e))
+        
+        finally:
+            await sync_to_async(self._close_connection, thread_sensitive=False)(connection)
+
+    async def _adeliver_messages(self, messages: List[EmailMultiAlternatives], connection_pool=None, 
+                                 connection=None, is_retry_attempt: bool = False) -> int:
+        """Makes one async delivery attempt for the messages."""
+        asend_messages = getattr(connection, "asend_messages", None)
+        
+        if connection_pool is None and iscoroutinefunction(asend_messages):
+            return await asend_messages(messages)
+
+        if is_retry_attempt:
+            return await sync_to_async(self._deliver_message, thread_sensitive=False)(messages[0], connection_pool)
+
+        if connection_pool:
+            return await sync_to_async(connection_pool.send_messages, thread_sensitive=False)(messages)
+        return await sync_to_async(connection.send_messages, thread_sensitive=False)(messages)
+
+    def _deliver_message(self, message: EmailMultiAlternatives, connection_pool=None) -> int:
+        """
+        Makes one delivery attempt for a message. If it fails, the connection is dropped,
+        so the next attempt starts with a new one.
+        """
+        if connection_pool:
+            return connection_pool.send_messages([message])
+
+        connection = message.connection
+
+        try:
+            # kept open between the messages of the email, closed by `_deliver`
+            connection.open()
+            return connection.send_messages([message])
+        except Exception:
+            self._close_connection(connection)
+            raise
+
+    @contextmanager
+    def _measure_stage(self, stage: EmailSenderConstants.Stages):
+        """
+        Adds the time spent in the block to the stage's entry in `stage_timings`, in seconds,
+        and reports the block as a child span of the send (see `with_tracer`).
+        """
+        start = perf_counter()
+
+        try:
+            with self._get_tracer().start_span(f"email_sender.{stage.value}"):
+                yield
+        finally:
+            self.stage_timings[stage.value] = self.stage_timings.get(stage.value, 0.0) + perf_counter() - start
+
+    def _start_send_span(self, name: str):
+        """Starts the span covering a whole send, the parent of the spans of its stages."""
+        return self._get_tracer().start_span(name, attributes={
+            "email.id": self.email_id,
+            "email.template": self._get_template_label(),
+        })
+
+    def _get_tracer(self) -> Tracer:
+        return self.tracer or get_tracer()
+
+    def _count_delivery_attempt(self, attempt: int) -> None:
+        """Called by the retry policy before each attempt to deliver a message, with the message's attempt number."""
+        self.delivery_attempts = max(self.delivery_attempts, attempt)
+
+        if attempt > 1:
+            self.delivery_retries += 1
+
+    @staticmethod
+    def _close_connection(connection) -> None:
+        """Closes a backend connection, ignoring the errors of a connection that is already broken."""
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def send_many(self, recipient_contexts: List[Dict[str, Any]], auto_reset: bool = False, personalise: bool = False) -> List[EmailSendResult]:
+        """
+        Sends one email per recipient through a single backend connection.
+
+        The sender, subject, headers and templates are taken from the current instance. Each
+        entry in `recipient_contexts` supplies its own recipient and an optional context which is
+        merged over the instance context, so shared values only need to be set once using
+        `.with_context(...)`.
+
+        The connection is opened once before the first message and closed after the last one,
+        which avoids a new connection (and TLS handshake) for every email in the batch. With a
+        connection pool (see `with_connection_pool`) the messages are delivered through the pool
+        instead. Each message goes through the same delivery as `send()`: it waits on the rate
+        limiter, is retried by the retry policy and is recorded in the metrics, the stage timings
+        and the traces. A failed delivery closes the connection, so the next message is sent over
+        a new one instead of a connection the server has dropped. With an outbox (see `with_outbox`)
+        each message is written to the outbox instead, like `send()` does, and no connection is opened.
+
+        Args:
+            recipient_contexts (List[Dict[str, Any]]): A list of dictionaries, each containing a
+                `"to"` key with the recipient's email address and an optional `"context"` key
+                with the context for that recipient.
+            auto_reset (bool): If auto_reset is True, the instance is reset after the batch is sent.
+            personalise (bool): If True, the templates are rendered once with the instance context and
+                only their `{% personalise %}` blocks are rendered per recipient, with the recipient's
+                context merged over the instance context. The recipient's context is not visible
+                outside those blocks. Requires `{% load email_sender_tags %}` in the templates.
+
+        Raises:
+            EmailSenderBaseException: If any required fields are missing or an entry is malformed.
+            EmailSendError: If the connection to the email backend could not be opened.
+
+        Returns:
+            List[EmailSendResult]: One result per entry, in the same order as `recipient_contexts`.
+                                   A failed message does not stop the rest of the batch, its error
+                                   is recorded on its result instead.
+
+        Example:
+            results = EmailSender.create()\
+                .from_address("no-reply@example.com")\
+                .with_subject("Your weekly digest")\
+                .with_context({"site_name": "Example"})\
+                .with_text_template(folder_name="emails", template_name="digest.txt")\
+                .with_html_template(folder_name="emails", template_name="digest.html")\
+                .send_many([
+                    {"to": "first@example.com", "context": {"username": "first"}},
+                    {"to": "second@example.com", "context": {"username": "second"}},
+                ])
+        """
+        self._validate(require_recipient=False)
+        self._validate_recipient_contexts(recipient_contexts)
+
+        shared_templates = render_shared_templates(self.text_template, self.html_template, self.context) if personalise else None
+        outbox_model     = self._get_outbox_model()
+        connection_pool  = None if outbox_model else self.connection_pool or get_connection_pool()
+        connection       = None
+
+        if outbox_model is None and connection_pool is None:
+            connection = get_connection()
+
+            try:
+                connection.open()
+            except Exception as e:
+                error_msg = EmailMessages.FAILED_TO_OPEN_CONNECTION.format(error=str(e))
+                raise EmailSendError(message=error_msg)
+
+        results = []
+
+        try:
+            for entry in recipient_contexts:
+                results.append(self._send_to_recipient(entry, connection_pool, connection, shared_templates, outbox_model))
+        finally:
+            self._close_connection(connection)
+
+        if auto_reset:
+            self.clear_all_fields()
+        return results
+
+    def _send_to_recipient(self, entry: Dict[str, Any], connection_pool=None, connection=None,
+                           shared_templates: tuple = None, outbox_model=None) -> EmailSendResult:
+        """
+        Renders and sends (or enqueues) a single message of a `send_many` batch.
+
+        Args:
+            entry (Dict[str, Any]): The recipient entry containing the `"to"` and optional `"context"` keys.
+            connection_pool (EmailConnectionPool, optional): The pool the batch is delivered through.
+            connection (optional): The connection shared by the batch when there is no pool.
+            shared_templates (tuple, optional): The text and HTML `PersonalisedTemplate` of a personalised
+                                                batch, of which only the personalise blocks are rendered.
+            outbox_model (class, optional): The outbox the message is written to instead of being delivered.
+
+        Returns:
+            EmailSendResult: The outcome of the delivery for this recipient.
+        """
+        to_email           = entry["to"]
+        recipient_context  = entry.get("context") or {}
+        self.stage_timings = {}
+
+        try:
+            with self._start_send_span("email_sender.send"), self._record_failed_send():
+                messages = self._build_recipient_messages(to_email, recipient_context, connection, shared_templates)
+
+                if outbox_model:
+                    rows = self._enqueue_messages(outbox_model, messages)
+                    return EmailSendResult(to_email=to_email, sent_count=len(rows), is_sent=bool(rows), error=None)
+
+                self._throttle(messages)
+
+                if connection is not None:
+                    # reopens the connection if the previous message closed it, otherwise does nothing
+                    connection.open()
+
+                sent = self._deliver_and_record(messages, connection_pool, connection, close_connection=False)
+
+        except Exception as e:
+            # the server may have dropped the connection, so the next message starts with a new one
+            self._close_connection(connection)
+            return EmailSendResult(to_email=to_email, sent_count=0, is_sent=False, error=str(e))
+        
+        return EmailSendResult(to_email=to_email, sent_count=sent, is_sent=sent > 0, error=None)
+
+    def _build_recipient_messages(self, to_email: str, recipient_context: Dict[str, Any], connection=None,
+                                  shared_templates: tuple = None) -> List[EmailMultiAlternatives]:
+        """Renders the templates for a single recipient of a `send_many` batch and builds its message."""
+        if shared_templates is None:
+            return self._build_messages([to_email], {**self.context, **recipient_context}, connection=connection)
+
+        text_template, html_template = shared_templates
+
+        with self._measure_stage(EmailSenderConstants.Stages.RENDER):
+            text_content = text_template.render(recipient_context)
+            html_content = html_template.render(recipient_context)
+
+        with self._measure_stage(EmailSenderConstants.Stages.BUILD):
+            return [self._create_message([to_email], text_content, html_content, connection=connection)]
+
+    def _validate_recipient_contexts(self, recipient_contexts: List[Dict[str, Any]]) -> None:
+        """
+        Ensures every entry passed to `send_many` has a recipient and a dictionary context.
+
+        Raises:
+            EmailSenderBaseException: If the entries are not a list or an entry is malformed.
+            ContextIsNotADictionary: If the context of an entry is not a dictionary.
+        """
+        if not isinstance(recipient_contexts, (list, tuple)):
+            error_msg = _("'recipient_contexts' must be a list but got type '{contexts_type}' instead")
+            raise EmailSenderBaseException(error_msg.format(contexts_type=type(recipient_contexts).__name__))
+        
+        for entry in recipient_contexts:
+            
+            if not isinstance(entry, dict) or not isinstance(entry.get("to"), str) or not entry.get("to"):
+                error_msg = _("Each recipient entry must be a dictionary with a 'to' email address. Got '{entry}'")
+                raise EmailSenderBaseException(error_msg.format(entry=entry))
+
+            context = entry.get("context")
+            
+            if context is not None and not isinstance(context, dict):
+                raise ContextIsNotADictionary(ContextMessages.format_message(msg=ContextMessages.CONTEXT_ERROR, 
+                                                                             context=context, 
+                                                                             context_type=type(context)
+                                                                             ))
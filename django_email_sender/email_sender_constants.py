@@ -49,6 +49,16 @@ class EmailSenderConstants:
         CREATE        = "create"
         ADD_RECIPIENT = "add_new_recipient"
 
+    class Stages(Enum):
+        """Enum representing the timed stages of sending an email, in the order they run."""
+        PREPARE  = "prepare"
+        VALIDATE = "validate"
+        RENDER   = "render"
+        BUILD    = "build"
+        THROTTLE = "throttle"
+        DELIVER  = "deliver"
+        ENQUEUE  = "enqueue"
+
 
 @dataclass(frozen=True)
 class LoggerType:
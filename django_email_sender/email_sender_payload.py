@@ -1,25 +1,33 @@
-from dataclasses import dataclass, asdict
-import json
-from typing import Any
-from dataclasses import asdict
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional
 
-from django_email_sender.utils import sanitize_for_json
+from django_email_sender.utils import dumps_json
 
 
 class EmailBase:
-    def to_json(self):
-    
-        email_payload_dict = asdict(self)
-        cleaned_payload    = sanitize_for_json(email_payload_dict)
-        return json.dumps(cleaned_payload, indent=4)
+    def to_dict(self) -> dict:
+        """Returns the fields as a dictionary, without copying their values."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """
+        Serializes the fields to JSON in a single pass (see `utils.dumps_json`).
+
+        Args:
+            indent (int, optional): Pretty-prints with this indentation. By default the output is compact.
+        """
+        return dumps_json(self.to_dict(), indent=indent)
 
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmailPayload(EmailBase):
     """
     Represents the full payload of an email before it is sent.
 
+    The payload is immutable, so it can be used as a snapshot of the email that is
+    safe to hand over to another thread, e.g. the workers of the delivery queue.
+
     Attributes:
         from_email (str): The sender's email address.
         to_email (str): The recipient's email address.
@@ -28,6 +36,8 @@ class EmailPayload(EmailBase):
         body_text (str): The plain text content of the email body.
         context (dict): Context data used for template rendering.
         headers (dict): Custom headers to include with the email.
+        recipients (tuple): The additional recipients of the email.
+        email_id (str): The unique id of the email.
     """
 
     from_email: str
@@ -37,6 +47,8 @@ class EmailPayload(EmailBase):
     body_text: str
     context: dict
     headers: dict
+    recipients: tuple = ()
+    email_id: str = None
 
     def is_valid(self):
         """
@@ -59,6 +71,9 @@ class EmailMetaData(EmailBase):
         status (str): The result status of the send attempt (e.g., "success", "failed").
         timestamp (str): The timestamp of the attempt, typically in ISO format.
         errors (Any): Any error details captured during the send attempt.
+        attempts (int): The number of delivery attempts made, more than 1 when transient failures were retried.
+        stage_timings (dict): The seconds spent in each stage of the send (prepare, validate, render,
+                              build, throttle, deliver or enqueue), in the order they ran.
     """
 
     to_email: str
@@ -66,6 +81,8 @@ class EmailMetaData(EmailBase):
     status: str
     timestamp: str
     errors: Any
+    attempts: int = 1
+    stage_timings: dict = field(default_factory=dict)
 
     def is_valid(self):
         """
@@ -75,3 +92,21 @@ class EmailMetaData(EmailBase):
             bool: True if all required fields are present and non-empty, False otherwise.
         """
         return bool(self.to_email and self.subject and self.status and self.timestamp)
+
+
+@dataclass(frozen=True)
+class EmailSendResult(EmailBase):
+    """
+    Captures the outcome of delivering a single message as part of a batch send.
+
+    Attributes:
+        to_email (str): The recipient's email address.
+        sent_count (int): The number of messages the backend reported as delivered.
+        is_sent (bool): Whether the message was successfully delivered.
+        error (Any): The error message if the delivery failed, otherwise None.
+    """
+
+    to_email: str
+    sent_count: int
+    is_sent: bool
+    error: Any
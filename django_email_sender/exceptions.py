@@ -120,6 +120,35 @@ class MissingFieldsInClass(BaseException):
 class IncorrectEmailModelAddedError(BaseException):
     pass
 
+class EmailQueueFullError(BaseException):
+    """Raised when an email can't be queued because the delivery queue is full"""
+    pass
+
+
+class EmailQueueClosedError(BaseException):
+    """Raised when an email is queued after the delivery queue has been shut down"""
+    pass
+
+
+class EmailConnectionPoolExhausted(BaseException):
+    """Raised when no pooled connection became free in time"""
+    pass
+
+
+class EmailConnectionPoolClosed(BaseException):
+    """Raised when a connection is requested from a connection pool that has been closed"""
+    pass
+
+
+class EmailRateLimitExceeded(BaseException):
+    """Raised when an email would have to wait longer than the rate limiter's timeout to be sent"""
+    pass
+
+
+class EmailDeliveryAttemptsExhausted(EmailSendError):
+    """Raised when an email still couldn't be delivered after every attempt allowed by the retry policy"""
+    pass
+
 class MethodNotFoundError(EmailSenderBaseException):
     """Raised when a method is not found in a given class"""
     pass
@@ -0,0 +1,271 @@
+import atexit
+import logging
+
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Dict, List, Optional, Type
+
+from django.conf import settings
+from django.db import close_old_connections, router, transaction
+
+from django_email_sender.models import EmailBaseLog
+
+
+logger = logging.getLogger(__name__)
+
+class BufferedLogWriter:
+    """
+    Collects `EmailBaseLog` records in memory and writes them to the database in batches
+    with a single `bulk_create` call, instead of one INSERT and one transaction per email.
+
+    The batches are written by a background thread of the writer, when either:
+        - the buffer holds `batch_size` records, or
+        - `flush_interval` seconds have passed since the last write.
+
+    A record is never written by the thread that adds it, so a request that rolls back its
+    transaction (e.g. with `ATOMIC_REQUESTS`) can't take the records of other requests in the
+    same batch with it.
+
+    Failure handling:
+        If the `bulk_create` fails, the records of the batch are saved one at a time so a single
+        bad record doesn't sink the rest. Records that still can't be saved are put back in the
+        buffer and retried on the next flush, up to `max_write_attempts` times, after which they
+        are logged and dropped so a record that can never be saved doesn't stay at the head of
+        the buffer forever. The number of failed saves and of dropped records are available from
+        `failed_records` and `dropped_records`. Every write runs in its own savepoint, so a failed
+        `bulk_create` doesn't break a transaction `flush()` is called in.
+
+    Any records left in the buffer are written when `close()` is called or when the interpreter exits.
+    Records added after `close()` (e.g. by queued deliveries drained at exit) are written straight away,
+    or once the transaction commits if they are added inside one.
+
+    Example:
+        writer = BufferedLogWriter(CustomLogModel, batch_size=500, flush_interval=2)
+
+        EmailSenderLogger.create()\
+            .add_log_model(CustomLogModel)\
+            .enable_email_meta_data_save()\
+            .enable_buffered_db_logging(writer)
+    """
+
+    def __init__(self, log_model: Type[EmailBaseLog], batch_size: int = 100, flush_interval: Optional[float] = 5.0,
+                 max_write_attempts: int = 3):
+        """
+        Args:
+            log_model (EmailBaseLog): The model class the records are instances of.
+            batch_size (int): The number of buffered records that triggers a write.
+            flush_interval (float, optional): The maximum time in seconds a record waits in the buffer.
+                                              None disables the time-based writes.
+            max_write_attempts (int): The number of failed saves after which a record is dropped.
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("The batch size must be a positive integer")
+
+        if not isinstance(max_write_attempts, int) or max_write_attempts < 1:
+            raise ValueError("The maximum number of write attempts must be a positive integer")
+
+        self.log_model                   = log_model
+        self.batch_size: int             = batch_size
+        self.flush_interval              = flush_interval
+        self.max_write_attempts: int     = max_write_attempts
+        self.failed_records: int         = 0
+        self.dropped_records: int        = 0
+        self._buffer: List[EmailBaseLog] = []
+        self._write_attempts: Dict[int, int] = {}
+        self._is_closed: bool            = False
+        self._buffer_lock                = Lock()
+        self._flush_lock                 = Lock()
+        self._last_flush: float          = monotonic()
+        self._stop_event                 = Event()
+        self._flush_event                = Event()
+        self._flush_thread: Optional[Thread] = None
+
+    def add(self, log_record: EmailBaseLog) -> None:
+        """
+        Adds an unsaved record to the buffer. Once the buffer has reached the batch size, the
+        background thread is woken up to write it.
+
+        Args:
+            log_record (EmailBaseLog): The unsaved model instance.
+        """
+        with self._buffer_lock:
+            self._buffer.append(log_record)
+            is_full = len(self._buffer) >= self.batch_size
+
+        if self._is_closed:
+            self._flush_after_close()
+            return
+
+        self._start_flush_thread()
+
+        if is_full:
+            self._flush_event.set()
+
+    def _flush_after_close(self) -> None:
+        """
+        Writes the buffer once the writer is closed and its thread has stopped. Inside a transaction
+        the write waits for the commit. If the transaction rolls back, the records stay in the buffer
+        and are written by the next flush.
+        """
+        connection = transaction.get_connection(router.db_for_write(self.log_model))
+
+        if connection.in_atomic_block:
+            transaction.on_commit(self.flush, using=connection.alias)
+        else:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Writes every buffered record to the database.
+
+        Returns:
+            int: The number of records written.
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                records, self._buffer = self._buffer, []
+
+            self._last_flush = monotonic()
+
+            if not records:
+                return 0
+
+            try:
+                with transaction.atomic(using=router.db_for_write(self.log_model)):
+                    self.log_model.objects.bulk_create(records, batch_size=self.batch_size)
+
+            except Exception:
+                logger.warning("Failed to write %d email log records in bulk, saving them one at a time",
+                               len(records), exc_info=True)
+                return self._save_individually(records)
+
+            if self._write_attempts:
+                for record in records:
+                    self._write_attempts.pop(id(record), None)
+            return len(records)
+
+    def _save_individually(self, records: List[EmailBaseLog]) -> int:
+        """
+        Saves the records one at a time after a failed `bulk_create`, putting back in the
+        buffer the ones that still can't be saved and dropping those that have failed
+        `max_write_attempts` times.
+
+        Returns:
+            int: The number of records written.
+        """
+        failed  = []
+        dropped = 0
+
+        for record in records:
+            try:
+                with transaction.atomic(using=router.db_for_write(self.log_model)):
+                    record.save()
+
+            except Exception:
+                attempts = self._write_attempts.get(id(record), 0) + 1
+
+                if attempts < self.max_write_attempts:
+                    self._write_attempts[id(record)] = attempts
+                    failed.append(record)
+                    continue
+
+                logger.error("Dropping an email log record after %d failed write attempts", attempts, exc_info=True)
+                dropped += 1
+
+            self._write_attempts.pop(id(record), None)
+
+        with self._buffer_lock:
+            self._buffer[:0]      = failed
+            self.failed_records  += len(failed)
+            self.dropped_records += dropped
+
+        return len(records) - len(failed) - dropped
+
+    def _start_flush_thread(self) -> None:
+        """Starts the background thread that writes the buffer."""
+        if self._flush_thread is not None or self._is_closed:
+            return
+
+        with self._buffer_lock:
+            if self._flush_thread is None:
+                flush_thread = Thread(target=self._flush_periodically, name="email-log-writer", daemon=True)
+                flush_thread.start()
+                # only published once started, so `close()` can join it
+                self._flush_thread = flush_thread
+
+    def _flush_periodically(self) -> None:
+        """
+        Writes the buffer when it reaches the batch size, or whenever `flush_interval`
+        seconds have passed since the last write.
+        """
+        while not self._stop_event.is_set():
+            is_full = self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+
+            if self._stop_event.is_set():
+                break
+
+            if self._buffer and (is_full or monotonic() - self._last_flush >= self.flush_interval):
+                try:
+                    self.flush()
+                finally:
+                    close_old_connections()
+
+    def close(self) -> None:
+        """
+        Stops the background thread and writes the remaining records. Records added
+        afterwards are written as soon as they are added.
+        """
+        self._is_closed = True
+        self._stop_event.set()
+        self._flush_event.set()
+
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+        self.flush()
+
+    @property
+    def pending_records(self) -> int:
+        """Returns the number of records waiting in the buffer."""
+        return len(self._buffer)
+
+
+_log_writers: Dict[Type[EmailBaseLog], BufferedLogWriter] = {}
+_log_writers_lock = Lock()
+
+
+def get_log_writer(log_model: Type[EmailBaseLog]) -> BufferedLogWriter:
+    """
+    Returns the process-wide buffered writer for the given log model, creating it on first use.
+
+    The writer is shared by every `EmailSenderLogger` using the same model, so records from
+    different requests end up in the same batch. It is configured with the optional
+    `EMAIL_SENDER_LOG_WRITER` setting, which accepts the same keyword arguments as
+    `BufferedLogWriter` (apart from the model), e.g.
+
+        EMAIL_SENDER_LOG_WRITER = {"batch_size": 500, "flush_interval": 2}
+
+    Args:
+        log_model (EmailBaseLog): The model class the records are saved to.
+
+    Returns:
+        BufferedLogWriter: The writer for the model.
+    """
+    with _log_writers_lock:
+        writer = _log_writers.get(log_model)
+
+        if writer is None:
+            options                = getattr(settings, "EMAIL_SENDER_LOG_WRITER", {})
+            writer                 = BufferedLogWriter(log_model, **options)
+            _log_writers[log_model] = writer
+            atexit.register(writer.close)
+    return writer
+
+
+def flush_log_writers() -> None:
+    """Writes the buffered records of every process-wide writer to the database."""
+    with _log_writers_lock:
+        writers = list(_log_writers.values())
+
+    for writer in writers:
+        writer.flush()
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from django_email_sender.metrics import get_metrics_registry
+
+
+class Command(BaseCommand):
+    """
+    Prints the email metrics in the Prometheus text exposition format, or writes them to a file.
+
+    The metrics live in the memory of the process that sent the emails, so the command is
+    only useful when run inside that process with `call_command()`, e.g. at the end of a batch
+    job or cron script that sends emails, writing to the directory of the node_exporter
+    textfile collector:
+
+        call_command("email_sender_metrics", output="/var/lib/node_exporter/textfile/emails.prom")
+
+    Run with `python manage.py` it starts a new process that hasn't sent anything, so every
+    metric is empty. Web workers should expose their metrics with `views.metrics_view` instead.
+    """
+
+    help = ("Prints the email metrics recorded by the current process in the Prometheus text format, or writes "
+            "them to --output. Call it with call_command() from the process that sent the emails: "
+            "run from the shell it starts a new process and every metric is empty.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=None,
+                            help="Write the metrics to this file (replaced atomically) instead of printing them.")
+
+    def handle(self, *args, **options):
+        registry = get_metrics_registry()
+
+        if options["output"]:
+            registry.write_to_file(options["output"])
+        else:
+            self.stdout.write(registry.render(), ending="")
@@ -0,0 +1,66 @@
+import signal
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from django_email_sender.messages import OutboxMessages
+from django_email_sender.outbox import OutboxWorker, get_outbox_model
+from django_email_sender.retry import RetryPolicy
+
+
+class Command(BaseCommand):
+    """
+    Delivers the emails waiting in the outbox table.
+
+    Rows are claimed with `SELECT ... FOR UPDATE SKIP LOCKED`, so the command can be run
+    in as many processes and on as many nodes as needed to keep up with the outbox.
+    SIGTERM and SIGINT stop the worker once the current batch has been recorded.
+
+    Usage:
+        python manage.py process_email_outbox
+        python manage.py process_email_outbox --model emails.Outbox --batch-size 200 --lease 120
+        python manage.py process_email_outbox --once
+    """
+
+    help = "Delivers the emails waiting in the outbox table (EMAIL_SENDER_OUTBOX_MODEL)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", default=None,
+                            help="The 'app_label.ModelName' of the outbox model. Defaults to EMAIL_SENDER_OUTBOX_MODEL.")
+        parser.add_argument("--batch-size", type=int, default=50,
+                            help="The maximum number of emails claimed at a time.")
+        parser.add_argument("--lease", type=float, default=300,
+                            help="How long, in seconds, a claimed email is reserved before another worker may claim it.")
+        parser.add_argument("--max-attempts", type=int, default=5,
+                            help="The maximum number of delivery attempts per email.")
+        parser.add_argument("--poll-interval", type=float, default=1.0,
+                            help="How long, in seconds, to wait before looking again when the outbox is empty.")
+        parser.add_argument("--once", action="store_true",
+                            help="Exit once no email is due instead of waiting for new ones.")
+
+    def handle(self, *args, **options):
+        try:
+            outbox_model = apps.get_model(options["model"]) if options["model"] else get_outbox_model()
+        except (LookupError, ValueError) as error:
+            raise CommandError(str(error))
+
+        if outbox_model is None:
+            raise CommandError(OutboxMessages.OUTBOX_NOT_CONFIGURED)
+
+        worker = OutboxWorker(outbox_model,
+                              batch_size=options["batch_size"],
+                              lease_seconds=options["lease"],
+                              retry_policy=RetryPolicy(max_attempts=options["max_attempts"]),
+                              )
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: worker.stop())
+
+        self.stdout.write(OutboxMessages.format_message(OutboxMessages.WORKER_STARTED,
+                                                        worker_id=worker.worker_id,
+                                                        model=outbox_model._meta.label,
+                                                        ))
+
+        count = worker.run(poll_interval=options["poll_interval"], until_empty=options["once"])
+
+        self.stdout.write(OutboxMessages.format_message(OutboxMessages.WORKER_STOPPED, worker_id=worker.worker_id, count=count))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_email_sender.messages import TemplateMessages
+from django_email_sender.template_cache import warm_up_templates
+
+
+class Command(BaseCommand):
+    """
+    Compiles every email template and caches its preview.
+
+    The caches live in the process running the command, so the command is mainly a
+    start-up check that every template compiles (and it warms the filesystem cache).
+    To warm the caches of the web workers themselves, set `EMAIL_SENDER_WARM_UP_TEMPLATES = True`
+    or call `template_cache.warm_up_templates()` from the worker start-up code.
+
+    Usage:
+        python manage.py warm_email_templates
+        python manage.py warm_email_templates --dir /path/to/emails_templates --strict
+    """
+
+    help = "Compiles every email template under EMAIL_TEMPLATES_DIR and caches its preview."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", dest="templates_dir", default=None,
+                            help="The directory to walk. Defaults to EMAIL_TEMPLATES_DIR.")
+        parser.add_argument("--preview-chars", type=int, default=100,
+                            help="The length of the cached previews.")
+        parser.add_argument("--strict", action="store_true",
+                            help="Exit with an error if any template fails to compile.")
+
+    def handle(self, *args, **options):
+        report = warm_up_templates(templates_dir=options["templates_dir"], preview_chars=options["preview_chars"])
+
+        for path, error in report.errors.items():
+            self.stderr.write(TemplateMessages.format_message(TemplateMessages.TEMPLATE_WARM_UP_FAILED, path=path, error=error))
+
+        self.stdout.write(TemplateMessages.format_message(TemplateMessages.TEMPLATES_WARMED_UP,
+                                                          count=len(report.warmed),
+                                                          failed=len(report.errors),
+                                                          path=report.templates_dir,
+                                                          ))
+
+        if options["strict"] and not report.is_successful:
+            raise CommandError(TemplateMessages.format_message(TemplateMessages.TEMPLATES_WARM_UP_INCOMPLETE, failed=len(report.errors)))
@@ -55,6 +55,9 @@ class TemplateMessages(BaseFormatter):
     HTML_TEMPLATE_PATH        : str = _("HTML file path: {html}. | category=TEMPLATE | action=TEMPLATE_PATH")
     TEXT_TEMPLATE_PATH        : str = _("Text file path: {text}. | category=TEMPLATE | action=TEMPLATE_PATH")
     TEMPLATE_RETREIVED        : str = _("Successfully retrieved HTML and text file paths. | category=TEMPLATE | action=TEMPLATE_PATH")
+    TEMPLATES_WARMED_UP       : str = _("Warmed up {count} email template(s) in '{path}', {failed} failed. | category=TEMPLATE | action=WARM_UP")
+    TEMPLATE_WARM_UP_FAILED   : str = _("Failed to warm up the email template '{path}': {error} | category=TEMPLATE | action=WARM_UP_FAILED")
+    TEMPLATES_WARM_UP_INCOMPLETE : str = _("{failed} email template(s) failed to warm up. | category=TEMPLATE | action=WARM_UP_FAILED")
 
     def __str__(self) -> str:
         return _("TemplateMessages: A collection of email template-related message templates.")
@@ -80,6 +83,7 @@ class EmailMessages(BaseFormatter):
     TEXT_TEMPLATE_USED                : str = _("Text template used: '{text_template_path}'. | category=EMAIL | action=TEMPLATE_TEXT")
     EMAIL_SEND_COMPLETE               : str = _("Email sent successfully. | category=EMAIL | action=SEND_COMPLETE")
     FAILED_TO_SEND_EMAIL              : str = _("Failed to send email from '{from_user}' to '{to_user}': {error}. | category=EMAIL | action=SEND_FAIL")
+    FAILED_AFTER_ATTEMPTS             : str = _("Failed to deliver the email after {attempts} attempt(s): {error}. | category=EMAIL | action=SEND_FAIL")
     ERROR_OCCURED                     : str = _("An error occurred; email was not sent. Ensure all fields are filled. | category=EMAIL | action=ERROR")
     EMAIL_LOG_METADATA                : str = _("Recipient='{recipient}' | Subject='{subject}' | Status='{status}' | Timestamp='{timestamp}'. | category=EMAIL | action=METADATA")
     EMAIL_LOG_PAYLOAD                 : str = _("From='{from_email}' | To='{recipient}' | Subject='{subject}' | Body='{body_summary}' | Attachments={attachments}. | category=EMAIL | action=PAYLOAD")
@@ -88,12 +92,70 @@ class EmailMessages(BaseFormatter):
     START_DB_SAVE                     : str = _("Attempting to save to the database... | category=EMAIL | action=DATABASE_START")
     FAILED_TO_START_DB_SAVE           : str = _("Failed to start database save. sender='{class_name}', model='{log_model}', processed='{processed}'. | category=EMAIL | action=DATABASE_FAILED")
     MISSING_EMAIL_FIELDS              : str = _("'Subject' : {subject}, 'from_email' {from_email}, 'to_email' {to_email} | category=EMAIL | action=MISSING_FIELDS")
+    FAILED_TO_OPEN_CONNECTION         : str = _("Failed to open a connection to the email backend: {error}. | category=EMAIL | action=CONNECTION_FAIL")
+    EMAIL_BUFFERED_FOR_DB             : str = _("Email log record buffered for a batched database save ({pending} waiting). | category=EMAIL | action=DATABASE_BUFFERED")
+    LOG_MODEL_REQUIRED_FOR_BUFFERING  : str = _("A log model must be added with 'add_log_model()' before enabling buffered database logging. | category=EMAIL | action=DATABASE_CONFIG")
+    LOG_WRITER_MODEL_MISMATCH         : str = _("The log writer saves to '{writer_model}' but the log model added is '{log_model}'. | category=EMAIL | action=DATABASE_CONFIG")
     
     def __str__(self) -> str:
         return _("EmailMessages: A collection of email operation-related message templates.")
 
 
 
+# ────────────────────────────────
+# QueueMessages
+# ────────────────────────────────
+@dataclass(frozen=True)
+class QueueMessages(BaseFormatter):
+    QUEUE_FULL        : str = _("The delivery queue is full ({max_size} emails waiting); the email was not queued. | category=QUEUE | action=FULL")
+    QUEUE_CLOSED      : str = _("The delivery queue has been shut down; the email was not queued. | category=QUEUE | action=CLOSED")
+    EMAIL_QUEUED      : str = _("Email '{email_id}' to '{to_email}' has been queued for delivery. | category=QUEUE | action=QUEUED")
+    QUEUED_DELIVERY   : str = _("Queued delivery enabled using '{queue}'. | category=QUEUE | action=ENABLED")
+
+    def __str__(self) -> str:
+        return _("QueueMessages: A collection of delivery queue-related message templates.")
+
+
+
+# ────────────────────────────────
+# ConnectionPoolMessages
+# ────────────────────────────────
+@dataclass(frozen=True)
+class ConnectionPoolMessages(BaseFormatter):
+    POOL_EXHAUSTED    : str = _("All {size} pooled email connections are in use and none became free within {timeout} seconds. | category=CONNECTION_POOL | action=EXHAUSTED")
+    POOL_CLOSED       : str = _("The email connection pool has been closed. | category=CONNECTION_POOL | action=CLOSED")
+
+    def __str__(self) -> str:
+        return _("ConnectionPoolMessages: A collection of connection pool-related message templates.")
+
+
+
+# ────────────────────────────────
+# OutboxMessages
+# ────────────────────────────────
+@dataclass(frozen=True)
+class OutboxMessages(BaseFormatter):
+    OUTBOX_NOT_CONFIGURED : str = _("No outbox model given. Pass --model or set EMAIL_SENDER_OUTBOX_MODEL. | category=OUTBOX | action=NOT_CONFIGURED")
+    WORKER_STARTED        : str = _("Outbox worker '{worker_id}' started on '{model}'. | category=OUTBOX | action=STARTED")
+    WORKER_STOPPED        : str = _("Outbox worker '{worker_id}' stopped after processing {count} emails. | category=OUTBOX | action=STOPPED")
+
+    def __str__(self) -> str:
+        return _("OutboxMessages: A collection of outbox-related message templates.")
+
+
+
+# ────────────────────────────────
+# RateLimitMessages
+# ────────────────────────────────
+@dataclass(frozen=True)
+class RateLimitMessages(BaseFormatter):
+    RATE_LIMIT_EXCEEDED : str = _("Sending through '{key}' would wait {wait:.2f} seconds, more than the {timeout} seconds allowed. | category=RATE_LIMIT | action=EXCEEDED")
+
+    def __str__(self) -> str:
+        return _("RateLimitMessages: A collection of rate limiting-related message templates.")
+
+
+
 # ────────────────────────────────
 # TemplateResolutionMessages
 # ────────────────────────────────
@@ -311,12 +373,15 @@ class EmailLogSummary:
     ATTACHMENTS           = _("Attachments Added                 : '{attachments}'")
     ENVIRONMENT           = _("Environment                       : '{environment}'")
     TIME_TAKEN            = _("Time Taken                        : {time_taken:.2f} seconds")
+    STAGE_TIMINGS         = _("Stage Timings                     : {stage_timings}")
     STATUS                = _("Status                            : {status_message}")
     DELIVERED             = _("Emails delivered successfully     : {delivered}")
+    ENQUEUED              = _("Emails written to the outbox      : {enqueued}")
     TEXT_PREVIEW          = _("Text Preview                      : {text_preview}")
     HTML_PREVIEW          = _("HTML Preview                      : {html_preview}")
     EMAIL_FORMAT          = _("Email format                      : multipart/alternative (HTML + plain text)")
     BOTTOM_LINE           = _("________________________________________________________________________")
+    STRUCTURED_SUMMARY    = _("Email '{email_id}' to '{to_email}': {status_message} in {time_taken:.2f} seconds. | category=SUMMARY | action=STRUCTURED")
 
     @staticmethod
     def format_email_log_summary(message: str, **kwargs) -> str:
@@ -339,6 +404,7 @@ class MethodConstants(BaseFormatter):
     Method-related log messages for the EmailSender and method tracking system.
     Use `.format(**kwargs)` to inject dynamic values into the message template.
     """
+    CLASS_ALREADY_VALIDATED      : str = _("Class '{class_name}' has already been validated, skipping the field and method checks. | category=METHOD | status=CACHED")
     EVALUATING_FIELD_METHODS     : str = _("Evaluating field methods for class '{class_name}'. | category=METHOD | status=EVALUATING")
     EXCEPTION_ERRORS             : str = _("The method '{method}' returned an invalid field value: '{field}'. | category=METHOD | status=VALUE_ERROR")
     INVALID_EMAIL_INSTANCE       : str = _("Invalid email instance provided. | category=METHOD | status=INVALID_INSTANCE")
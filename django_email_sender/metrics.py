@@ -0,0 +1,290 @@
+import os
+
+from bisect import bisect_left
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+
+# The default histogram buckets in seconds, from a cached render to a slow SMTP server
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A value that only goes up, kept per combination of label values."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name                                = name
+        self.documentation                       = documentation
+        self.labelnames                          = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock                               = Lock()
+
+    def inc(self, amount: float = 1, *labelvalues: str) -> None:
+        """Adds `amount` to the counter of the given label values, in the order of `labelnames`."""
+        if amount < 0:
+            raise ValueError("A counter can only be increased")
+
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def get(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+
+        return [f"{self.name}{_format_labels(zip(self.labelnames, labelvalues))} {_format_value(value)}"
+                for labelvalues, value in values]
+
+
+class Histogram:
+    """
+    Counts observations into cumulative buckets, kept per combination of label values,
+    along with their sum and count.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name          = name
+        self.documentation = documentation
+        self.labelnames    = tuple(labelnames)
+        self.buckets       = tuple(sorted(buckets))
+
+        # maps the label values to [count per bucket (the last one being +Inf), sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock                                = Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Records an observation for the given label values, in the order of `labelnames`."""
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            entry = self._values.get(labelvalues)
+
+            if entry is None:
+                entry = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+
+            entry[0][index] += 1
+            entry[1]        += value
+
+    def get_count(self, *labelvalues: str) -> int:
+        entry = self._values.get(labelvalues)
+        return sum(entry[0]) if entry else 0
+
+    def get_sum(self, *labelvalues: str) -> float:
+        entry = self._values.get(labelvalues)
+        return entry[1] if entry else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            values = sorted((labelvalues, (list(counts), total)) for labelvalues, (counts, total) in self._values.items())
+
+        lines = []
+
+        for labelvalues, (counts, total) in values:
+            labels     = list(zip(self.labelnames, labelvalues))
+            cumulative = 0
+
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(labels + [('le', _format_value(bound))])} {cumulative}")
+
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    A process-wide collection of counters and histograms, rendered in the Prometheus text
+    exposition format.
+
+    Every metric has its own lock and an update is a dictionary lookup and an addition, so
+    recording the metrics of a send costs a few microseconds. The values live in the memory
+    of the process: each worker process exposes its own metrics, which Prometheus sums up
+    across the scraped targets.
+
+    Example:
+        registry = get_metrics_registry()
+        registry.counter("email_sender_emails_sent_total").get("emails/welcome.html")
+        print(registry.render())
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock                       = Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"The metric '{metric.name}' is already registered with a different type or labels")
+                return existing
+
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str = "", labelnames: Tuple[str, ...] = ()) -> Counter:
+        """Returns the counter with the given name, registering it on first use."""
+        metric = self._metrics.get(name)
+        return metric if isinstance(metric, Counter) else self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str = "", labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Returns the histogram with the given name, registering it on first use."""
+        metric = self._metrics.get(name)
+        return metric if isinstance(metric, Histogram) else self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def clear(self) -> None:
+        """Resets every metric to zero, keeping the registrations."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+
+        for name, metric in metrics:
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def write_to_file(self, path: str) -> None:
+        """
+        Writes the rendered metrics to a file, e.g. for the node_exporter textfile collector.
+        The file is replaced atomically, so a scrape never reads a partly written file.
+        """
+        path      = Path(path)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+        temp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+# Prometheus content type of `MetricsRegistry.render()`
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = Lock()
+
+
+def _register_email_metrics(registry: MetricsRegistry) -> None:
+    """Registers the metrics recorded by `EmailSender`, so they are rendered even before the first send."""
+    registry.counter("email_sender_emails_sent_total", "Emails delivered to the backend.", ("template",))
+    registry.counter("email_sender_emails_failed_total", "Emails that failed to be validated, rendered or delivered.", ("template", "error"))
+    registry.counter("email_sender_emails_enqueued_total", "Emails written to the outbox.", ("template",))
+    registry.counter("email_sender_messages_sent_total", "Messages delivered, more than one per email when the recipients are chunked.", ("template",))
+    registry.counter("email_sender_delivery_retries_total", "Delivery attempts after the first one.", ("template",))
+    registry.counter("email_sender_message_bytes_total", "Bytes of the rendered text and HTML bodies of the delivered messages.", ("template",))
+    registry.counter("email_sender_outbox_deliveries_total", "Outbox rows processed by the outbox workers, by outcome.", ("status",))
+    registry.histogram("email_sender_send_duration_seconds", "Time taken by EmailSender.send(), from validation to delivery.", ("template",))
+    registry.histogram("email_sender_stage_duration_seconds", "Time taken by each stage of a send.", ("stage",))
+
+
+def is_metrics_enabled() -> bool:
+    """
+    Returns whether sends are recorded in the metrics registry.
+
+    Metrics are on by default and can be turned off by setting
+    `EMAIL_SENDER_METRICS = False` in settings.py.
+    """
+    return getattr(settings, "EMAIL_SENDER_METRICS", True)
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Returns the process-wide metrics registry, creating it on first use."""
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = MetricsRegistry()
+                _register_email_metrics(registry)
+                _registry = registry
+    return _registry
+
+
+def record_send(template: str, stage_timings: Dict[str, float], messages_sent: int = 0, message_bytes: int = 0,
+                retries: int = 0, error: Optional[Exception] = None) -> None:
+    """
+    Records the outcome of an `EmailSender.send()` in the process-wide registry.
+
+    Args:
+        template (str): The HTML template of the email, used as the `template` label.
+        stage_timings (dict): The seconds spent in each stage, see `EmailSender.stage_timings`.
+        messages_sent (int): The number of messages the backend delivered.
+        message_bytes (int): The size of the rendered bodies of the delivered messages.
+        retries (int): The number of delivery attempts after the first one, over all the messages.
+        error (Exception, optional): The error the send failed with.
+    """
+    registry = get_metrics_registry()
+
+    if error is None:
+        registry.counter("email_sender_emails_sent_total").inc(1, template)
+        registry.counter("email_sender_messages_sent_total").inc(messages_sent, template)
+        registry.counter("email_sender_message_bytes_total").inc(message_bytes, template)
+    else:
+        registry.counter("email_sender_emails_failed_total").inc(1, template, error.__class__.__name__)
+
+    if retries:
+        registry.counter("email_sender_delivery_retries_total").inc(retries, template)
+
+    record_stage_timings(template, stage_timings)
+
+
+def record_enqueue(template: str, stage_timings: Dict[str, float]) -> None:
+    """Records an email written to the outbox instead of being delivered."""
+    get_metrics_registry().counter("email_sender_emails_enqueued_total").inc(1, template)
+    record_stage_timings(template, stage_timings)
+
+
+def record_stage_timings(template: str, stage_timings: Dict[str, float]) -> None:
+    registry       = get_metrics_registry()
+    stage_duration = registry.histogram("email_sender_stage_duration_seconds")
+
+    for stage, seconds in stage_timings.items():
+        stage_duration.observe(seconds, stage)
+
+    registry.histogram("email_sender_send_duration_seconds").observe(sum(stage_timings.values()), template)
+
+
+def record_outbox_delivery(status: str) -> None:
+    """Records a row processed by an outbox worker with its final status for this attempt."""
+    get_metrics_registry().counter("email_sender_outbox_deliveries_total").inc(1, status)
@@ -1,4 +1,6 @@
+from django.core.mail import EmailMultiAlternatives
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -23,3 +25,65 @@ class EmailBaseLog(models.Model):
             self.subject
         )
 
+
+
+class EmailBaseOutbox(models.Model):
+    """
+    The base outbox class.
+
+    A row is a rendered message waiting to be delivered by `outbox.OutboxWorker`. Because the row
+    is written with the same database connection as the rest of the request, enqueuing inside
+    `transaction.atomic()` means the email exists if, and only if, the transaction commits.
+
+    `available_at` is both the time a pending row may be claimed (it is pushed into the future
+    between retries) and the end of the lease of a row being sent. A worker that dies while
+    sending leaves its rows in `SENDING`, and they are claimed again once the lease runs out.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        SENDING = "sending", _("Sending")
+        SENT    = "sent", _("Sent")
+        FAILED  = "failed", _("Failed")
+
+    email_id       = models.CharField(db_index=True, max_length=64)
+    from_email     = models.EmailField(max_length=100)
+    recipients     = models.JSONField(default=list)
+    subject        = models.CharField(max_length=255)
+    text_content   = models.TextField(blank=True)
+    html_content   = models.TextField(blank=True)
+    headers        = models.JSONField(default=dict, blank=True)
+    status         = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts       = models.PositiveIntegerField(default=0)
+    available_at   = models.DateTimeField(default=timezone.now)
+    locked_by      = models.CharField(max_length=100, blank=True)
+    last_error     = models.TextField(blank=True)
+    sent_on        = models.DateTimeField(null=True, blank=True)
+    created_on     = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        abstract = True
+        indexes  = [models.Index(fields=["status", "available_at"])]
+
+    def __str__(self):
+        return _("{} -> {} with subject {} ({})").format(
+            self.from_email,
+            ", ".join(self.recipients),
+            self.subject,
+            self.status
+        )
+
+    def to_message(self, connection=None) -> EmailMultiAlternatives:
+        """Rebuilds the email message from the stored content."""
+        msg = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.text_content,
+            from_email=self.from_email,
+            to=self.recipients,
+            headers=self.headers or {},
+            connection=connection,
+        )
+
+        if self.html_content:
+            msg.attach_alternative(self.html_content, "text/html")
+        return msg
@@ -0,0 +1,292 @@
+import os
+import socket
+
+from datetime import timedelta
+from threading import Event
+from typing import Any, List, Optional, Tuple, Type
+
+from django.apps import apps
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import close_old_connections, router, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from django_email_sender.connection_pool import EmailConnectionPool, PooledConnection
+from django_email_sender.metrics import is_metrics_enabled, record_outbox_delivery
+from django_email_sender.models import EmailBaseOutbox
+from django_email_sender.retry import RetryPolicy
+from django_email_sender.validation import validate_custom_email_model
+
+
+def get_outbox_model() -> Optional[Type[EmailBaseOutbox]]:
+    """
+    Returns the outbox model every `EmailSender` enqueues to, or None if the outbox isn't configured.
+
+    The outbox is enabled with the optional `EMAIL_SENDER_OUTBOX_MODEL` setting, the
+    "app_label.ModelName" of a model inheriting from `EmailBaseOutbox`, e.g.
+
+        EMAIL_SENDER_OUTBOX_MODEL = "emails.Outbox"
+
+    Raises:
+        IncorrectEmailModelAddedError: If the model doesn't inherit from `EmailBaseOutbox`.
+    """
+    model_name = getattr(settings, "EMAIL_SENDER_OUTBOX_MODEL", None)
+
+    if model_name is None:
+        return None
+
+    outbox_model = apps.get_model(model_name)
+    validate_custom_email_model(outbox_model, EmailBaseOutbox)
+    return outbox_model
+
+
+def enqueue_messages(outbox_model: Type[EmailBaseOutbox], messages: List[EmailMultiAlternatives],
+                     email_id: str = "") -> List[EmailBaseOutbox]:
+    """
+    Writes the rendered messages to the outbox, one row per message.
+
+    The rows are inserted in a single `bulk_create` inside a (nested) transaction, so either
+    every message of the email is enqueued or none is. Called inside the caller's
+    `transaction.atomic()` block, the email is only enqueued if that transaction commits.
+
+    Args:
+        outbox_model (EmailBaseOutbox): The outbox model class.
+        messages (List[EmailMultiAlternatives]): The rendered messages.
+        email_id (str): The id of the email the messages belong to.
+
+    Returns:
+        List[EmailBaseOutbox]: The created rows.
+    """
+    rows = []
+
+    for message in messages:
+        html_content = next((content for content, mimetype in message.alternatives if mimetype == "text/html"), "")
+        rows.append(outbox_model(email_id=email_id,
+                                 from_email=message.from_email,
+                                 recipients=list(message.to),
+                                 subject=message.subject,
+                                 text_content=message.body,
+                                 html_content=html_content,
+                                 headers=dict(message.extra_headers),
+                                 ))
+
+    with transaction.atomic(using=router.db_for_write(outbox_model)):
+        return outbox_model.objects.bulk_create(rows)
+
+
+class OutboxWorker:
+    """
+    Delivers the rows of an outbox table in batches.
+
+    Any number of workers, in any number of processes or on any number of nodes, can drain the
+    same outbox: a batch is claimed with `SELECT ... FOR UPDATE SKIP LOCKED`, so two workers never
+    claim the same row and neither waits for the rows the other has locked. Claiming a row sets
+    its status to `SENDING` and leases it to the worker for `lease_seconds`.
+
+    Delivery is at-least-once: a worker that dies after sending a message but before marking it
+    as sent leaves the row in `SENDING`, and it is sent again once the lease has run out. The
+    lease should therefore be longer than the time it takes to deliver a batch.
+
+    Failed deliveries:
+        A transient failure (see `RetryPolicy.is_transient`) puts the row back to `PENDING` and
+        delays its next claim by the backoff of the retry policy. A permanent failure, or a
+        transient one on the last allowed attempt, marks the row as `FAILED` with the error in
+        `last_error`.
+
+    Example:
+        worker = OutboxWorker(Outbox, batch_size=100, lease_seconds=120)
+        worker.run()  # or `python manage.py process_email_outbox`
+    """
+
+    def __init__(self, outbox_model: Type[EmailBaseOutbox], batch_size: int = 50, lease_seconds: float = 300,
+                 retry_policy: Optional[RetryPolicy] = None, connection_pool: Optional[EmailConnectionPool] = None,
+                 worker_id: Optional[str] = None):
+        """
+        Args:
+            outbox_model (EmailBaseOutbox): The outbox model class.
+            batch_size (int): The maximum number of rows claimed at a time.
+            lease_seconds (float): How long a claimed row is reserved for the worker.
+            retry_policy (RetryPolicy, optional): Decides which failures are retried, how often, and the
+                                                  backoff between attempts. Defaults to `RetryPolicy()`.
+            connection_pool (EmailConnectionPool, optional): The pool to deliver through. If None, a
+                                                             connection is opened per batch.
+            worker_id (str, optional): Recorded in `locked_by`. Defaults to "<hostname>:<pid>".
+        """
+        validate_custom_email_model(outbox_model, EmailBaseOutbox)
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("The batch size must be a positive integer")
+
+        self.outbox_model    = outbox_model
+        self.batch_size      = batch_size
+        self.lease_seconds   = lease_seconds
+        self.retry_policy    = retry_policy or RetryPolicy()
+        self.connection_pool = connection_pool
+        self.worker_id       = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._stop_event     = Event()
+
+    def claim_batch(self) -> List[EmailBaseOutbox]:
+        """
+        Claims up to `batch_size` rows that are due: pending rows whose retry delay has passed
+        and rows whose lease has run out.
+
+        Returns:
+            List[EmailBaseOutbox]: The claimed rows, with their status and attempts updated.
+        """
+        Status = self.outbox_model.Status
+        using  = router.db_for_write(self.outbox_model)
+        now    = timezone.now()
+
+        with transaction.atomic(using=using):
+            rows = list(self.outbox_model.objects.using(using)
+                        .select_for_update(skip_locked=True)
+                        .filter(status__in=[Status.PENDING, Status.SENDING], available_at__lte=now)
+                        .order_by("available_at", "pk")[:self.batch_size])
+
+            if not rows:
+                return []
+
+            self.outbox_model.objects.using(using).filter(pk__in=[row.pk for row in rows]).update(
+                status=Status.SENDING,
+                locked_by=self.worker_id,
+                available_at=now + timedelta(seconds=self.lease_seconds),
+                attempts=F("attempts") + 1,
+            )
+
+        for row in rows:
+            row.status    = Status.SENDING
+            row.locked_by = self.worker_id
+            row.attempts += 1
+        return rows
+
+    def process_batch(self) -> int:
+        """
+        Claims a batch, delivers it over a shared connection and records the result of every row.
+
+        Returns:
+            int: The number of rows claimed.
+        """
+        rows = self.claim_batch()
+
+        if not rows:
+            return 0
+
+        try:
+            self._deliver_rows(rows)
+        except Exception as error:
+            # a connection couldn't be opened, so the rows still in SENDING weren't sent
+            for row in rows:
+                if row.status == self.outbox_model.Status.SENDING:
+                    self._record_failure(row, error)
+
+        self.outbox_model.objects.using(router.db_for_write(self.outbox_model)).bulk_update(
+            rows, ["status", "available_at", "locked_by", "last_error", "sent_on"]
+        )
+
+        if is_metrics_enabled():
+            for row in rows:
+                record_outbox_delivery(row.status)
+        return len(rows)
+
+    def _deliver_rows(self, rows: List[EmailBaseOutbox]) -> None:
+        """
+        Sends every row and sets the outcome on the row.
+
+        The rows share one connection. After a transient failure the server may have dropped
+        it, so it is closed (or discarded from the pool) and the next row is sent over a new one.
+        """
+        Status     = self.outbox_model.Status
+        pooled     = None
+        connection = None
+
+        try:
+            for row in rows:
+                if connection is None:
+                    pooled, connection = self._open_connection()
+
+                try:
+                    connection.send_messages([row.to_message(connection)])
+
+                except Exception as error:
+                    self._record_failure(row, error)
+
+                    if self.retry_policy.is_transient(error):
+                        self._close_connection(pooled, connection, discard=True)
+                        pooled, connection = None, None
+                    continue
+
+                if pooled is not None:
+                    pooled.messages_sent += 1
+
+                row.status     = Status.SENT
+                row.sent_on    = timezone.now()
+                row.locked_by  = ""
+                row.last_error = ""
+        finally:
+            self._close_connection(pooled, connection)
+
+    def _open_connection(self) -> Tuple[Optional[PooledConnection], Any]:
+        """Returns an open connection, acquired from the connection pool when there is one."""
+        if self.connection_pool:
+            pooled = self.connection_pool.acquire()
+            return pooled, pooled.backend
+
+        connection = get_connection()
+        connection.open()
+        return None, connection
+
+    def _close_connection(self, pooled: Optional[PooledConnection], connection, discard: bool = False) -> None:
+        """Gives a pooled connection back to the pool, or closes the connection, ignoring the errors of a broken one."""
+        if pooled is not None:
+            self.connection_pool.release(pooled, discard=discard)
+            return
+
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _record_failure(self, row: EmailBaseOutbox, error: Exception) -> None:
+        """Puts the row back to `PENDING` with a backoff if the failure is transient, otherwise marks it as `FAILED`."""
+        Status         = self.outbox_model.Status
+        row.last_error = f"{error.__class__.__name__}: {error}"
+        row.locked_by  = ""
+
+        if row.attempts < self.retry_policy.max_attempts and self.retry_policy.is_transient(error):
+            row.status       = Status.PENDING
+            row.available_at = timezone.now() + timedelta(seconds=self.retry_policy.get_delay(row.attempts))
+        else:
+            row.status = Status.FAILED
+
+    def run(self, poll_interval: float = 1.0, until_empty: bool = False) -> int:
+        """
+        Processes batches until `stop()` is called, sleeping `poll_interval` seconds whenever no row is due.
+
+        Args:
+            poll_interval (float): How long to wait before looking again when there is nothing to send.
+            until_empty (bool): If True, returns as soon as no row is due instead of waiting for new ones.
+
+        Returns:
+            int: The number of rows processed.
+        """
+        processed = 0
+
+        while not self._stop_event.is_set():
+            try:
+                claimed = self.process_batch()
+            finally:
+                close_old_connections()
+
+            processed += claimed
+
+            if not claimed and (until_empty or self._stop_event.wait(poll_interval)):
+                break
+
+        return processed
+
+    def stop(self) -> None:
+        """Asks `run()` to return after the current batch."""
+        self._stop_event.set()
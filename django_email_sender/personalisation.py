@@ -0,0 +1,139 @@
+import re
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from django.template import Context
+
+from django_email_sender.template_cache import render_template
+
+
+# The key of the context entry that switches `{% personalise %}` blocks into collecting mode
+SEGMENTS_CONTEXT_KEY = "_django_email_sender_personalise_segments"
+
+# Stands in for a personalise block in the shared output. Uses a control character, which
+# doesn't appear in templates and isn't changed by escaping or case filters.
+_SEGMENT_MARKER    = "\x1f{index}\x1f"
+_SEGMENT_MARKER_RE = re.compile("\x1f(\\d+)\x1f")
+
+
+@dataclass(frozen=True)
+class PersonalisedSegment:
+    """
+    A `{% personalise %}` block collected while the shared parts of a template were rendered.
+
+    Attributes:
+        nodelist (NodeList): The compiled content of the block.
+        template (Template): The compiled template the block belongs to.
+        context (dict): The shared context as it was at the position of the block.
+        autoescape (bool): Whether autoescaping was on at the position of the block.
+    """
+    nodelist: Any
+    template: Any
+    context: Dict[str, Any]
+    autoescape: bool
+
+    def render(self, recipient_context: Dict[str, Any]) -> str:
+        """Renders the block with the recipient context merged over the shared context."""
+        context = Context({**self.context, **recipient_context}, autoescape=self.autoescape)
+
+        with context.bind_template(self.template):
+            return self.nodelist.render(context)
+
+
+class PersonalisedTemplate:
+    """
+    A template whose shared parts have been rendered once, leaving only its
+    `{% personalise %}` blocks to be rendered for each recipient.
+
+    Example:
+        {% load email_sender_tags %}
+        <h1>{{ newsletter_title }}</h1>
+        {% personalise %}<p>Hi {{ first_name }},</p>{% endpersonalise %}
+        {% for article in articles %} ... {% endfor %}
+
+        template = PersonalisedTemplate.render_shared(html_path, {"newsletter_title": ..., "articles": ...})
+        html     = template.render({"first_name": "Ada"})
+    """
+
+    def __init__(self, static_parts: List[str], segments: List[PersonalisedSegment]):
+        """
+        Args:
+            static_parts (List[str]): The shared output around the blocks, one more item than `segments`.
+            segments (List[PersonalisedSegment]): The blocks, in the order they appear in the output.
+        """
+        self._static_parts = static_parts
+        self._segments     = segments
+
+    @classmethod
+    def render_shared(cls, template_path: str, shared_context: Dict[str, Any] = None) -> "PersonalisedTemplate":
+        """
+        Renders the template once with the shared context, collecting its `{% personalise %}` blocks.
+
+        Args:
+            template_path (str): The absolute path to the template.
+            shared_context (dict): The context shared by every recipient.
+
+        Returns:
+            PersonalisedTemplate: The partly rendered template.
+        """
+        collected: List[PersonalisedSegment] = []
+        context = {**(shared_context or {}), SEGMENTS_CONTEXT_KEY: collected}
+        output  = render_template(template_path, context=context)
+
+        # re.split alternates the text between markers with the index captured by the marker
+        parts        = _SEGMENT_MARKER_RE.split(output)
+        static_parts = parts[::2]
+        segments     = [collected[int(index)] for index in parts[1::2]]
+        return cls(static_parts, segments)
+
+    def render(self, recipient_context: Dict[str, Any] = None) -> str:
+        """
+        Renders the personalise blocks with the recipient's context and joins them with the shared output.
+
+        Args:
+            recipient_context (dict): The context of the recipient.
+
+        Returns:
+            str: The fully rendered template.
+        """
+        recipient_context = recipient_context or {}
+        parts             = [self._static_parts[0]]
+
+        for segment, static_part in zip(self._segments, self._static_parts[1:]):
+            parts.append(segment.render(recipient_context))
+            parts.append(static_part)
+
+        return "".join(parts)
+
+    @property
+    def is_personalised(self) -> bool:
+        """Returns True if the template has at least one personalise block."""
+        return bool(self._segments)
+
+
+def collect_segment(context: Context, nodelist) -> str:
+    """
+    Called by the `{% personalise %}` tag when the template is rendered by `PersonalisedTemplate.render_shared`.
+
+    Records the block and a snapshot of the context, and returns the marker that stands in for the block.
+    """
+    collected = context[SEGMENTS_CONTEXT_KEY]
+    snapshot  = context.flatten()
+    snapshot.pop(SEGMENTS_CONTEXT_KEY, None)
+
+    collected.append(PersonalisedSegment(nodelist=nodelist,
+                                         template=context.template,
+                                         context=snapshot,
+                                         autoescape=context.autoescape,
+                                         ))
+    return _SEGMENT_MARKER.format(index=len(collected) - 1)
+
+
+def render_shared_templates(text_template: str, html_template: str,
+                            shared_context: Dict[str, Any]) -> Tuple[PersonalisedTemplate, PersonalisedTemplate]:
+    """Renders the shared parts of an email's text and HTML templates."""
+    return (
+        PersonalisedTemplate.render_shared(text_template, shared_context),
+        PersonalisedTemplate.render_shared(html_template, shared_context),
+    )
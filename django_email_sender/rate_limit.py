@@ -0,0 +1,228 @@
+import time
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+from django_email_sender.exceptions import EmailRateLimitExceeded
+from django_email_sender.messages import RateLimitMessages
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Counters describing how much a rate limit has slowed the sends down.
+
+    Attributes:
+        sends (int): The number of sends that went through the limiter.
+        delayed_sends (int): The number of sends that had to wait.
+        total_wait (float): The total time in seconds the sends waited.
+        max_wait (float): The longest time in seconds a single send waited.
+        rejected_sends (int): The number of sends that would have waited longer than the timeout.
+    """
+    sends: int          = 0
+    delayed_sends: int  = 0
+    total_wait: float   = 0.0
+    max_wait: float     = 0.0
+    rejected_sends: int = 0
+
+
+class TokenBucket:
+    """
+    A token bucket allowing `rate` messages per second on average and bursts of up to `burst` messages.
+
+    A send that finds the bucket empty reserves its tokens and waits until they have been
+    refilled, rather than failing, so bursts are smoothed out to the configured rate. Tokens
+    are handed out in the order they were requested.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            rate (float): The number of messages allowed per second.
+            burst (int, optional): The maximum number of messages that can be sent at once. Defaults to `rate` (at least 1).
+            timeout (float, optional): The longest a send may wait. A send that would wait longer raises
+                                       `EmailRateLimitExceeded`. None waits as long as needed.
+        """
+        if rate <= 0:
+            raise ValueError("The rate must be a positive number of messages per second")
+
+        self.rate                 = float(rate)
+        self.burst                = float(burst if burst is not None else max(rate, 1))
+        self.timeout              = timeout
+        self.stats                = RateLimitStats()
+        self._tokens: float       = self.burst
+        self._updated_at: float   = time.monotonic()
+        self._lock                = Lock()
+
+    def reserve(self, tokens: int = 1, key: str = "") -> float:
+        """
+        Takes the tokens from the bucket and returns how long the caller must wait before sending.
+
+        Args:
+            tokens (int): The number of messages about to be sent.
+            key (str): The name of the bucket, used in the error message.
+
+        Returns:
+            float: The number of seconds to wait, 0 if the tokens were available.
+
+        Raises:
+            EmailRateLimitExceeded: If the wait would be longer than `timeout`. No tokens are taken.
+        """
+        with self._lock:
+            now               = time.monotonic()
+            self._tokens      = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at  = now
+            wait              = max(0.0, (tokens - self._tokens) / self.rate)
+
+            if self.timeout is not None and wait > self.timeout:
+                self.stats.rejected_sends += 1
+                raise EmailRateLimitExceeded(RateLimitMessages.RATE_LIMIT_EXCEEDED, key=key, wait=wait, timeout=self.timeout)
+
+            # the balance may go negative: later callers then wait for the tokens reserved here too
+            self._tokens -= tokens
+            self._record_wait(wait)
+        return wait
+
+    def acquire(self, tokens: int = 1, key: str = "") -> float:
+        """
+        Blocks until the tokens are available.
+
+        Returns:
+            float: The number of seconds the caller waited.
+        """
+        wait = self.reserve(tokens, key)
+
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def _record_wait(self, wait: float) -> None:
+        self.stats.sends += 1
+
+        if wait:
+            self.stats.delayed_sends += 1
+            self.stats.total_wait    += wait
+            self.stats.max_wait       = max(self.stats.max_wait, wait)
+
+
+class EmailRateLimiter:
+    """
+    Limits the rate of outgoing emails with one token bucket per email backend and sender domain,
+    so emails sent through different providers or from different domains don't slow each other down.
+
+    The rate of a domain can be set in `domain_rates`; every other domain gets `rate`.
+
+    Example:
+        limiter = EmailRateLimiter(rate=10, burst=20, domain_rates={"newsletter.example.com": 2})
+
+        EmailSender.create()\\
+            .with_rate_limiter(limiter)\\
+            ...
+            .send()                 # waits if more than 10 emails per second are sent
+
+        limiter.stats()            # how long the sends waited, per backend and domain
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None, timeout: Optional[float] = None,
+                 domain_rates: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            rate (float): The number of messages allowed per second for each backend and domain.
+            burst (int, optional): The maximum number of messages that can be sent at once.
+            timeout (float, optional): The longest a send may wait before `EmailRateLimitExceeded` is raised.
+            domain_rates (dict, optional): Maps sender domains to their own rate (messages per second).
+        """
+        self.rate                                   = rate
+        self.burst                                  = burst
+        self.timeout                                = timeout
+        self.domain_rates: Dict[str, float]         = {domain.lower(): domain_rate for domain, domain_rate in (domain_rates or {}).items()}
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock                                  = Lock()
+
+    def get_bucket(self, from_email: Optional[str], backend: Optional[str] = None) -> TokenBucket:
+        """Returns the bucket for the backend and the domain of the sender, creating it on first use."""
+        key    = (backend or settings.EMAIL_BACKEND, self._get_domain(from_email))
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+
+                if bucket is None:
+                    rate   = self.domain_rates.get(key[1], self.rate)
+                    bucket = self._buckets[key] = TokenBucket(rate, self.burst, self.timeout)
+        return bucket
+
+    def reserve(self, from_email: Optional[str], tokens: int = 1, backend: Optional[str] = None) -> float:
+        """
+        Takes the tokens for the sender and returns how long to wait before sending,
+        for callers that wait themselves (e.g. with `asyncio.sleep`).
+        """
+        bucket = self.get_bucket(from_email, backend)
+        return bucket.reserve(tokens, key=self._format_key(from_email, backend))
+
+    def acquire(self, from_email: Optional[str], tokens: int = 1, backend: Optional[str] = None) -> float:
+        """
+        Blocks until `tokens` messages can be sent from the sender.
+
+        Args:
+            from_email (str): The sender's address. Its domain selects the bucket.
+            tokens (int): The number of messages about to be sent.
+            backend (str, optional): The dotted path of the email backend. Defaults to `EMAIL_BACKEND`.
+
+        Returns:
+            float: The number of seconds the caller waited.
+
+        Raises:
+            EmailRateLimitExceeded: If the wait would be longer than `timeout`.
+        """
+        bucket = self.get_bucket(from_email, backend)
+        return bucket.acquire(tokens, key=self._format_key(from_email, backend))
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Returns the counters of every bucket, keyed by '<backend>|<domain>'."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {f"{backend}|{domain}": bucket.stats for (backend, domain), bucket in buckets.items()}
+
+    def _format_key(self, from_email: Optional[str], backend: Optional[str]) -> str:
+        return f"{backend or settings.EMAIL_BACKEND}|{self._get_domain(from_email)}"
+
+    @staticmethod
+    def _get_domain(from_email: Optional[str]) -> str:
+        """Returns the lowercased domain of the address, ignoring any display name."""
+        if not from_email:
+            return ""
+        return from_email.rpartition("@")[2].strip(" >").lower()
+
+
+_rate_limiter: Optional[EmailRateLimiter] = None
+_rate_limiter_lock = Lock()
+
+
+def get_rate_limiter() -> Optional[EmailRateLimiter]:
+    """
+    Returns the process-wide rate limiter, or None if rate limiting isn't configured.
+
+    The limiter is enabled with the optional `EMAIL_SENDER_RATE_LIMIT` setting, which accepts
+    the same keyword arguments as `EmailRateLimiter`, e.g.
+
+        EMAIL_SENDER_RATE_LIMIT = {"rate": 10, "burst": 20, "domain_rates": {"newsletter.example.com": 2}}
+
+    The limit applies per process, so with several workers the relay sees up to `rate`
+    messages per second from each of them.
+    """
+    global _rate_limiter
+
+    options = getattr(settings, "EMAIL_SENDER_RATE_LIMIT", None)
+
+    if options is None:
+        return None
+
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = EmailRateLimiter(**options)
+    return _rate_limiter
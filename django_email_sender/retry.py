@@ -0,0 +1,145 @@
+import asyncio
+import random
+import smtplib
+import time
+
+from threading import Lock
+from typing import Any, Awaitable, Callable, Optional
+
+from django.conf import settings
+
+
+# Errors that say nothing about the message itself, so the same message may succeed on another attempt
+TRANSIENT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed delivery is attempted again.
+
+    Only transient failures are retried:
+        - SMTP replies with a 4xx code (e.g. 421 "too many connections", 451 "try again later"),
+        - recipients refused with 4xx codes only,
+        - dropped connections, refused connections and timeouts.
+    Permanent failures (5xx replies such as 550 "mailbox unavailable" or 535 "authentication
+    failed") and any other error are raised straight away.
+
+    The delay before attempt `n + 1` is `base_delay * multiplier ** (n - 1)`, capped at `max_delay`.
+    With `jitter` the actual delay is a random value between 0 and that ("full jitter"), so
+    workers that failed together don't all retry at the same moment.
+
+    Example:
+        EmailSender.create()\\
+            .with_retry_policy(RetryPolicy(max_attempts=4, base_delay=0.5))\\
+            ...
+            .send()
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 multiplier: float = 2.0, jitter: bool = True):
+        """
+        Args:
+            max_attempts (int): The maximum number of attempts, including the first one.
+            base_delay (float): The delay in seconds before the second attempt.
+            max_delay (float): The longest delay in seconds between two attempts.
+            multiplier (float): The factor the delay grows by after each attempt.
+            jitter (bool): Whether the delays are randomised.
+        """
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("The maximum number of attempts must be a positive integer")
+
+        self.max_attempts = max_attempts
+        self.base_delay   = base_delay
+        self.max_delay    = max_delay
+        self.multiplier   = multiplier
+        self.jitter       = jitter
+
+    def is_transient(self, error: Exception) -> bool:
+        """Returns True if the delivery failed for a reason that may go away on another attempt."""
+        if isinstance(error, smtplib.SMTPRecipientsRefused):
+            codes = [code for code, _ in error.recipients.values()]
+            return bool(codes) and all(400 <= code < 500 for code in codes)
+
+        if isinstance(error, smtplib.SMTPResponseException):
+            return 400 <= error.smtp_code < 500
+
+        return isinstance(error, TRANSIENT_ERRORS)
+
+    def get_delay(self, attempt: int) -> float:
+        """Returns the number of seconds to wait after the given (1-based) failed attempt."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def call(self, func: Callable[[], Any], on_attempt: Optional[Callable[[int], None]] = None) -> Any:
+        """
+        Calls `func` until it succeeds, fails permanently or runs out of attempts.
+
+        Args:
+            func (Callable): Makes one delivery attempt.
+            on_attempt (Callable, optional): Called with the attempt number before each attempt.
+
+        Returns:
+            The value returned by the successful attempt.
+
+        Raises:
+            Exception: The error of the last attempt.
+        """
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if on_attempt:
+                on_attempt(attempt)
+
+            try:
+                return func()
+            except Exception as error:
+                if attempt >= self.max_attempts or not self.is_transient(error):
+                    raise
+
+            time.sleep(self.get_delay(attempt))
+
+    async def acall(self, func: Callable[[], Awaitable[Any]], on_attempt: Optional[Callable[[int], None]] = None) -> Any:
+        """The async version of `call`, for a coroutine function. Waits with `asyncio.sleep`."""
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if on_attempt:
+                on_attempt(attempt)
+
+            try:
+                return await func()
+            except Exception as error:
+                if attempt >= self.max_attempts or not self.is_transient(error):
+                    raise
+
+            await asyncio.sleep(self.get_delay(attempt))
+
+
+_retry_policy: Optional[RetryPolicy] = None
+_retry_policy_lock = Lock()
+
+
+def get_retry_policy() -> Optional[RetryPolicy]:
+    """
+    Returns the process-wide retry policy, or None if retries aren't configured.
+
+    Retries are enabled with the optional `EMAIL_SENDER_RETRY` setting, which accepts the
+    same keyword arguments as `RetryPolicy`, e.g.
+
+        EMAIL_SENDER_RETRY = {"max_attempts": 4, "base_delay": 0.5, "max_delay": 10}
+    """
+    global _retry_policy
+
+    options = getattr(settings, "EMAIL_SENDER_RETRY", None)
+
+    if options is None:
+        return None
+
+    with _retry_policy_lock:
+        if _retry_policy is None:
+            _retry_policy = RetryPolicy(**options)
+    return _retry_policy
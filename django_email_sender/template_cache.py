@@ -0,0 +1,391 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from os import stat
+from os.path import exists
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.template import engines
+from django.template.loader import get_template
+
+from django_email_sender.messages import TemplateMessages
+from django_email_sender.utils import get_html_preview, get_safe_text_preview, get_template_dirs
+
+
+# The file extensions of the templates compiled by `warm_up_templates`
+TEMPLATE_EXTENSIONS: Tuple[str, ...] = (".html", ".txt")
+
+
+# Maps the absolute template path to its compiled template and the mtime it was compiled at.
+_compiled_templates: Dict[str, Tuple[Any, Optional[float]]] = {}
+_compiled_templates_lock = Lock()
+
+# Maps a template or directory path to the monotonic time its existence was last confirmed.
+_validated_paths: Dict[str, float] = {}
+_validated_paths_lock = Lock()
+
+
+class _LRUCache:
+    """A thread-safe mapping that drops its least recently used entries once it is full."""
+
+    def __init__(self):
+        self._entries: OrderedDict = OrderedDict()
+        self._lock                 = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self._entries[key]
+
+    def set(self, key, value, max_size: int) -> None:
+        if max_size < 1:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Maps (template path, mtime, preview length, is html) to the preview of the template.
+# The mtime is only part of the key when DEBUG is True, otherwise it is None.
+_template_previews = _LRUCache()
+
+
+def is_template_cache_enabled() -> bool:
+    """
+    Returns whether the compiled-template cache is enabled.
+
+    The cache is on by default and can be turned off by setting
+    `EMAIL_SENDER_TEMPLATE_CACHE = False` in settings.py.
+    """
+    return getattr(settings, "EMAIL_SENDER_TEMPLATE_CACHE", True)
+
+
+def _get_mtime(template_path: str) -> Optional[float]:
+    """Returns the modification time of the template or None if it can't be read."""
+    try:
+        return stat(template_path).st_mtime
+    except OSError:
+        return None
+
+
+def _evict_from_cached_loaders(template_name: str) -> None:
+    """
+    Removes a template from the cache of Django's cached template loaders, leaving every
+    other cached template in place, so the next lookup reads and compiles the file again.
+    """
+    for backend in engines.all():
+        # only the Django template backend has an `engine` with cached loaders
+        engine = getattr(backend, "engine", None)
+
+        for loader in getattr(engine, "template_loaders", ()):
+            loader_cache = getattr(loader, "get_template_cache", None)
+
+            if loader_cache is not None:
+                loader_cache.pop(loader.cache_key(template_name), None)
+
+
+def get_compiled_template(template_path: str):
+    """
+    Returns the compiled template for the given path, compiling it only once per process.
+
+    The template is looked up and parsed through Django's template engine the first time it
+    is requested and the compiled template is kept for the lifetime of the worker.
+
+    When `DEBUG` is True the modification time of the file is checked on every call, and the
+    template is recompiled if the file has changed, so edits are picked up during development.
+    Only that template is evicted from Django's cached loaders, the rest of the site's
+    templates stay cached.
+    When `DEBUG` is False the cached template is never invalidated.
+
+    Args:
+        template_path (str): The absolute path to the template, as built by `EmailSender._create_path`.
+
+    Returns:
+        Template: The compiled template, ready to be rendered with a context dictionary.
+    """
+    key    = str(template_path)
+    cached = _compiled_templates.get(key)
+    debug  = settings.DEBUG
+
+    if cached is not None:
+        template, compiled_mtime = cached
+
+        if not debug or _get_mtime(key) == compiled_mtime:
+            return template
+
+        # Django's cached loader would hand back the stale template
+        _evict_from_cached_loaders(key)
+
+    mtime    = _get_mtime(key) if debug else None
+    template = get_template(key)
+
+    with _compiled_templates_lock:
+        _compiled_templates[key] = (template, mtime)
+    return template
+
+
+def render_template(template_path: str, context: Dict = None) -> str:
+    """
+    Renders the template at the given path with the context.
+
+    Uses the compiled-template cache when it is enabled, otherwise the template is
+    loaded and compiled through Django's template loader on every call.
+
+    Args:
+        template_path (str): The absolute path to the template.
+        context (dict): The context used to render the template.
+
+    Returns:
+        str: The rendered template.
+    """
+    if not is_template_cache_enabled():
+        return get_template(str(template_path)).render(context)
+    return get_compiled_template(template_path).render(context)
+
+
+def clear_template_cache() -> None:
+    """Removes every compiled template from the cache, forcing them to be recompiled on next use."""
+    with _compiled_templates_lock:
+        _compiled_templates.clear()
+
+
+def get_path_cache_ttl() -> Optional[float]:
+    """
+    Returns how long, in seconds, a confirmed template or directory path is trusted before it is checked again.
+
+    Configured with `EMAIL_SENDER_PATH_CACHE_TTL` in settings.py:
+        - None (default): a path is checked once per worker and trusted afterwards.
+        - 0: the cache is disabled and the path is checked on every call.
+        - Any positive number: the path is checked again once that many seconds have passed.
+    """
+    return getattr(settings, "EMAIL_SENDER_PATH_CACHE_TTL", None)
+
+
+def path_exists(path: str) -> bool:
+    """
+    Checks whether a template or directory path exists, caching the positive result.
+
+    Only paths that exist are cached, so a missing template is looked up again on the next
+    call and is found as soon as it is added.
+
+    Args:
+        path (str): The path of the template file or directory to check.
+
+    Returns:
+        bool: True if the path exists, False otherwise.
+    """
+    key = str(path)
+    ttl = get_path_cache_ttl()
+
+    if ttl != 0:
+        validated_at = _validated_paths.get(key)
+
+        if validated_at is not None and (ttl is None or monotonic() - validated_at < ttl):
+            return True
+
+    if not exists(key):
+        return False
+
+    if ttl != 0:
+        with _validated_paths_lock:
+            _validated_paths[key] = monotonic()
+    return True
+
+
+def clear_validated_path_cache(path: str = None) -> None:
+    """
+    Invalidates the cached existence checks.
+
+    Should be called after templates or template directories are moved or deleted
+    while the worker is running.
+
+    Args:
+        path (str, optional): The path to invalidate. If None, every cached path is invalidated.
+    """
+    with _validated_paths_lock:
+        if path is None:
+            _validated_paths.clear()
+        else:
+            _validated_paths.pop(str(path), None)
+
+
+def get_preview_cache_size() -> int:
+    """
+    Returns the maximum number of template previews kept in the cache.
+
+    Configured with `EMAIL_SENDER_PREVIEW_CACHE_SIZE` in settings.py (default 256).
+    Once the cache is full the least recently used previews are dropped. 0 disables the cache.
+
+    Raises:
+        ImproperlyConfigured: If the setting is not a non-negative integer.
+    """
+    cache_size = getattr(settings, "EMAIL_SENDER_PREVIEW_CACHE_SIZE", 256)
+
+    if isinstance(cache_size, bool) or not isinstance(cache_size, int) or cache_size < 0:
+        raise ImproperlyConfigured("EMAIL_SENDER_PREVIEW_CACHE_SIZE must be a non-negative integer, "
+                                   f"got {cache_size!r}.")
+    return cache_size
+
+
+def get_template_preview(template_path: str, preview_chars: int = 100, is_html: bool = None) -> str:
+    """
+    Returns a text preview of the source of a template, reading and parsing the file only once per process.
+
+    The previews are kept in a bounded LRU cache keyed by the path, the preview length and,
+    when `DEBUG` is True, the modification time of the file, so an edited template gets a new
+    preview. When `DEBUG` is False a cached preview is returned without touching the file system.
+
+    Args:
+        template_path (str): The absolute path to the template.
+        preview_chars (int): The maximum length of the preview.
+        is_html (bool, optional): Whether the preview is extracted from HTML. If None, it is
+                                  inferred from the file extension.
+
+    Returns:
+        str: The preview of the template.
+
+    Raises:
+        OSError: If the template can't be read.
+    """
+    key = str(template_path)
+
+    if is_html is None:
+        is_html = key.lower().endswith((".html", ".htm"))
+
+    mtime     = _get_mtime(key) if settings.DEBUG else None
+    cache_key = (key, mtime, preview_chars, is_html)
+    preview   = _template_previews.get(cache_key)
+
+    if preview is not None:
+        return preview
+
+    with open(key, encoding="utf-8") as f:
+        content = f.read()
+
+    preview = get_html_preview(content, preview_chars) if is_html else get_safe_text_preview(content, preview_chars)
+
+    _template_previews.set(cache_key, preview, get_preview_cache_size())
+    return preview
+
+
+def get_template_previews(html_path: str, text_path: str, preview_chars: int = 100) -> Tuple[str, str]:
+    """
+    Returns the `(html_preview, text_preview)` of an email's pair of templates from the preview cache.
+
+    Each template is cached on its own, so templates shared by several emails (and the previews
+    cached by `warm_up_templates`, which doesn't know how templates are paired) are only read once.
+
+    Raises:
+        OSError: If either template can't be read.
+    """
+    return (
+        get_template_preview(html_path, preview_chars, is_html=True),
+        get_template_preview(text_path, preview_chars, is_html=False),
+    )
+
+
+def clear_template_preview_cache() -> None:
+    """Removes every template preview from the cache."""
+    _template_previews.clear()
+
+
+@dataclass(frozen=True)
+class TemplateWarmUpReport:
+    """
+    The outcome of `warm_up_templates`.
+
+    Attributes:
+        templates_dir (str): The directory that was walked.
+        warmed (tuple): The paths of the templates that were compiled and cached.
+        errors (dict): Maps the path of every template that failed to the error it raised.
+    """
+    templates_dir: str
+    warmed: Tuple[str, ...]    = ()
+    errors: Dict[str, str]     = field(default_factory=dict)
+
+    @property
+    def is_successful(self) -> bool:
+        return not self.errors
+
+
+def warm_up_templates(templates_dir: str = None, preview_chars: int = 100,
+                      extensions: Tuple[str, ...] = TEMPLATE_EXTENSIONS) -> TemplateWarmUpReport:
+    """
+    Loads every email template into the process caches, so the first emails sent by
+    a new worker don't pay for the template lookups, compilation and file checks.
+
+    Every template under the email templates directory (`EMAIL_TEMPLATES_DIR` from
+    `utils.get_template_dirs()`) is:
+        - compiled into the compiled-template cache,
+        - recorded as an existing path in the validated-path cache,
+        - read once to cache its preview.
+
+    A template that fails (e.g. a syntax error) is recorded in the report and
+    the remaining templates are still warmed up.
+
+    Args:
+        templates_dir (str, optional): The directory to walk. Defaults to `EMAIL_TEMPLATES_DIR`.
+        preview_chars (int): The length of the cached previews, as used by `EmailSenderLogger`.
+        extensions (tuple): The file extensions of the templates to warm up.
+
+    Returns:
+        TemplateWarmUpReport: The templates that were warmed up and the ones that failed.
+
+    Example:
+        # e.g. in AppConfig.ready() or a container start hook
+        report = warm_up_templates()
+        if not report.is_successful:
+            logger.warning("Some email templates failed to compile: %s", report.errors)
+    """
+    template_dirs = get_template_dirs()
+    root          = Path(templates_dir or template_dirs["EMAIL_TEMPLATES_DIR"])
+    warmed        = []
+    errors        = {}
+
+    path_exists(template_dirs["TEMPLATES_DIR"])
+    path_exists(template_dirs["EMAIL_TEMPLATES_DIR"])
+
+    if not root.is_dir():
+        errors[str(root)] = str(TemplateMessages.format_message(TemplateMessages.EMAIL_TEMPLATE_NOT_FOUND, path=root))
+        return TemplateWarmUpReport(templates_dir=str(root), errors=errors)
+
+    for path in sorted(root.rglob("*")):
+        if not path.is_file() or path.suffix.lower() not in extensions:
+            continue
+
+        key = str(path)
+
+        try:
+            if is_template_cache_enabled():
+                get_compiled_template(key)
+            else:
+                get_template(key)
+
+            path_exists(key)
+            get_template_preview(key, preview_chars, is_html=path.suffix.lower() != ".txt")
+
+        except Exception as error:
+            errors[key] = f"{error.__class__.__name__}: {error}"
+            continue
+
+        warmed.append(key)
+
+    return TemplateWarmUpReport(templates_dir=str(root), warmed=tuple(warmed), errors=errors)
@@ -0,0 +1,36 @@
+from django import template
+
+from django_email_sender.personalisation import SEGMENTS_CONTEXT_KEY, collect_segment
+
+
+register = template.Library()
+
+
+class PersonaliseNode(template.Node):
+    """
+    Marks the part of an email template that differs per recipient.
+
+    When the template is sent with `EmailSender.send_many(..., personalise=True)`, the rest of
+    the template is rendered once for the whole batch and only this block is rendered per recipient.
+    In any other render the block is rendered in place like plain template content.
+    """
+
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        if context.get(SEGMENTS_CONTEXT_KEY) is None:
+            return self.nodelist.render(context)
+        return collect_segment(context, self.nodelist)
+
+
+@register.tag("personalise")
+def personalise(parser, token):
+    """
+    Usage:
+        {% load email_sender_tags %}
+        {% personalise %}<p>Hi {{ first_name }}, <a href="{{ unsubscribe_url }}">unsubscribe</a></p>{% endpersonalise %}
+    """
+    nodelist = parser.parse(("endpersonalise",))
+    parser.delete_first_token()
+    return PersonaliseNode(nodelist)
@@ -0,0 +1,154 @@
+from threading import Lock
+from typing import Any, ContextManager, Dict, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+
+class Span:
+    """
+    The interface of the span yielded by `Tracer.start_span`.
+
+    OpenTelemetry spans already provide both methods, so they are used as they are.
+    """
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+class _NoOpSpan(Span):
+    """A span that records nothing. A single instance is shared, so starting one allocates nothing."""
+
+    def __enter__(self) -> "_NoOpSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+
+class Tracer:
+    """
+    The interface `EmailSender` and `EmailSenderLogger` report their spans through.
+
+    `start_span` returns a context manager that yields a `Span`. The span ends when the block
+    exits, and a span whose block raised must record the exception and re-raise it.
+
+    A tracer for any tracing system can be plugged in by subclassing this class, e.g.
+
+        class DatadogTracer(Tracer):
+            def start_span(self, name, attributes=None):
+                return ddtrace.tracer.trace(name, tags=attributes)
+
+        EmailSender.create().with_tracer(DatadogTracer())
+
+    The base class traces nothing, see `NoOpTracer`.
+    """
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Span]:
+        return _NO_OP_SPAN
+
+
+class NoOpTracer(Tracer):
+    """
+    The default tracer, used when no tracer is configured.
+
+    Starting a span returns a shared do-nothing context manager, so tracing costs a method
+    call per stage when it is disabled.
+    """
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Reports the spans to OpenTelemetry, as children of the span that is current when the
+    email is sent (e.g. the span of the Django request).
+
+    Needs the `opentelemetry-api` package. Exporting the spans is configured by the
+    application through the OpenTelemetry SDK as usual.
+
+    Example:
+        EMAIL_SENDER_TRACER = "opentelemetry"
+    """
+
+    def __init__(self, tracer_provider=None, instrumentation_name: str = "django_email_sender"):
+        """
+        Args:
+            tracer_provider (TracerProvider, optional): The provider to take the tracer from.
+                                                        Defaults to the global provider.
+            instrumentation_name (str): The name of the instrumentation library the spans are reported under.
+
+        Raises:
+            ImproperlyConfigured: If the `opentelemetry-api` package isn't installed.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImproperlyConfigured("The OpenTelemetry tracer needs the 'opentelemetry-api' package. "
+                                       "Install it with 'pip install opentelemetry-api'.")
+
+        self._tracer = trace.get_tracer(instrumentation_name, tracer_provider=tracer_provider)
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Span]:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+def is_opentelemetry_available() -> bool:
+    """Returns True if the `opentelemetry-api` package can be imported."""
+    try:
+        import opentelemetry.trace  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# The names `EMAIL_SENDER_TRACER` accepts besides a dotted path
+TRACERS = {
+    "noop": NoOpTracer,
+    "opentelemetry": OpenTelemetryTracer,
+}
+
+_tracer: Optional[Tracer] = None
+_tracer_setting: Any      = None
+_tracer_lock              = Lock()
+
+
+def _create_tracer(setting: Any) -> Tracer:
+    if setting is None:
+        return NoOpTracer()
+
+    if setting == "auto":
+        return OpenTelemetryTracer() if is_opentelemetry_available() else NoOpTracer()
+
+    if isinstance(setting, Tracer):
+        return setting
+
+    tracer_class = TRACERS.get(setting) or import_string(setting)
+    return tracer_class()
+
+
+def get_tracer() -> Tracer:
+    """
+    Returns the process-wide tracer, used by every `EmailSender` without a tracer of its own.
+
+    The tracer is configured with the optional `EMAIL_SENDER_TRACER` setting:
+        - None (default): nothing is traced (`NoOpTracer`).
+        - "opentelemetry": the spans are reported to OpenTelemetry.
+        - "auto": OpenTelemetry if the `opentelemetry-api` package is installed, otherwise nothing.
+        - The dotted path of a `Tracer` subclass, or a `Tracer` instance.
+    """
+    global _tracer, _tracer_setting
+
+    setting = getattr(settings, "EMAIL_SENDER_TRACER", None)
+
+    if _tracer is None or setting is not _tracer_setting:
+        with _tracer_lock:
+            if _tracer is None or setting is not _tracer_setting:
+                _tracer         = _create_tracer(setting)
+                _tracer_setting = setting
+    return _tracer
@@ -1,5 +1,5 @@
 import json
-import inspect
+import sys
 
 
 from django.utils.encoding import force_str
@@ -8,8 +8,9 @@ from time import perf_counter
 from pathlib import Path
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from dataclasses import dataclass, fields, is_dataclass
+from html.parser import HTMLParser
+from typing import Iterable, List, Optional
 
 from django_email_sender.translation import translate_message
 
@@ -79,7 +80,8 @@ def mark_method_for_debugging(depth: int = 1) -> MethodForDebug:
             - LINE_NUMBER: The line number in the source where this function was called.
 
     Notes:
-        - This function introspects the call stack to extract runtime context using `inspect`.
+        - This function introspects the call stack to extract runtime context using `sys._getframe`,
+          which jumps straight to the requested frame instead of walking back one frame at a time.
         
         - It must be called from within the method whose debug info is required,
           or with appropriate `depth` if used in wrappers.
@@ -134,12 +136,13 @@ def mark_method_for_debugging(depth: int = 1) -> MethodForDebug:
             def use_debug(self):
                 return mark_method_for_debugging()
     """
-    frame = inspect.currentframe()
     try:
-        for _ in range(depth):
-            if frame is not None:
-                frame = frame.f_back
+        frame = sys._getframe(max(depth, 0))
+    except ValueError:
+        # the call stack is not as deep as requested
+        frame = None
 
+    try:
         if frame is None:
             return MethodForDebug(CURRENT_METHOD="Unknown", CLASS_NAME="Unknown", LINE_NUMBER=-1)
 
@@ -157,6 +160,69 @@ def mark_method_for_debugging(depth: int = 1) -> MethodForDebug:
         del frame
 
 
+def normalise_email_address(email: str) -> str:
+    """
+    Normalises an email address so the same mailbox is always written the same way.
+
+    Surrounding whitespace is removed and the domain is lowercased. The local part
+    (before the '@') is kept as it is, because it may be case-sensitive.
+
+    Args:
+        email (str): The email address, e.g. " John.Smith@Example.COM ".
+
+    Returns:
+        str: The normalised address, e.g. "John.Smith@example.com".
+    """
+    email = email.strip()
+    local_part, at, domain = email.rpartition("@")
+
+    if not at:
+        return email
+    return f"{local_part}@{domain.lower()}"
+
+
+def dedupe_recipients(recipients: Iterable[str]) -> List[str]:
+    """
+    Normalises the recipients and removes the duplicates and empty values, keeping the
+    first occurrence of each address in its original position.
+
+    Args:
+        recipients (Iterable[str]): The email addresses.
+
+    Returns:
+        List[str]: The unique, normalised addresses.
+    """
+    seen   = set()
+    unique = []
+
+    for recipient in recipients:
+        if not recipient:
+            continue
+
+        address = normalise_email_address(recipient)
+
+        if address not in seen:
+            seen.add(address)
+            unique.append(address)
+    return unique
+
+
+def chunk_recipients(recipients: List[str], chunk_size: Optional[int]) -> List[List[str]]:
+    """
+    Splits the recipients into consecutive chunks of at most `chunk_size` addresses.
+
+    Args:
+        recipients (List[str]): The email addresses.
+        chunk_size (int, optional): The maximum number of addresses per chunk. None or 0 means a single chunk.
+
+    Returns:
+        List[List[str]]: The chunks, always at least one.
+    """
+    if not chunk_size or len(recipients) <= chunk_size:
+        return [recipients]
+    return [recipients[start:start + chunk_size] for start in range(0, len(recipients), chunk_size)]
+
+
 def get_safe_text_preview(body: str, length: int = 100) -> str:
     """
     Generates a safe preview of a plain text email body.
@@ -172,18 +238,145 @@ def get_safe_text_preview(body: str, length: int = 100) -> str:
     return (preview[:length] + '...') if len(preview) > length else preview
 
 
-def get_html_preview(html: str, length: int = 100) -> str:
+class _PreviewComplete(Exception):
+    """Raised by `_HTMLPreviewParser` to stop parsing once the preview has enough text."""
+
+
+class _HTMLPreviewParser(HTMLParser):
+    """
+    Collects the visible text of an HTML document, stopping as soon as it has more
+    than `length` characters instead of parsing the whole document.
+
+    The text of `<style>`, `<script>` and `<template>` elements is skipped. Adjacent
+    text is joined before it is stripped, and text separated by a tag or a comment is
+    joined with a single space, which matches `BeautifulSoup.get_text(separator=' ', strip=True)`.
+
+    Unlike BeautifulSoup, the text of `<![CDATA[...]]>` sections is skipped like a comment.
+    CDATA is only valid inside SVG and MathML, where its text isn't part of the visible body.
+    """
+
+    SKIPPED_TAGS = frozenset({"style", "script", "template"})
+
+    def __init__(self, length: int):
+        super().__init__(convert_charrefs=True)
+        self.length       = length
+        self.pieces       = []
+        self._text_length = 0
+        self._skip_depth  = 0
+        self._text_buffer = []
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in self.SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in self.SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush_text()
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def handle_decl(self, decl):
+        self._flush_text()
+
+    def handle_pi(self, data):
+        self._flush_text()
+
+    def unknown_decl(self, data):
+        # `<![CDATA[...]]>` sections
+        self._flush_text()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._text_buffer.append(data)
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+    def _flush_text(self):
+        """Adds the buffered text to the preview, stopping the parser once the preview is long enough."""
+        if not self._text_buffer:
+            return
+
+        text              = "".join(self._text_buffer).strip()
+        self._text_buffer = []
+
+        if not text:
+            return
+
+        self.pieces.append(text)
+        self._text_length += len(text) + 1
+
+        if self._text_length > self.length + 1:
+            raise _PreviewComplete
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.pieces)
+
+
+def _get_streamed_html_text(html: str, length: int, chunk_size: int = 4096) -> str:
+    """
+    Extracts the visible text of the HTML, reading it in chunks and stopping once
+    there is enough text for a preview of `length` characters.
+    """
+    parser = _HTMLPreviewParser(length)
+
+    try:
+        for start in range(0, len(html), chunk_size):
+            parser.feed(html[start:start + chunk_size])
+        parser.close()
+    except _PreviewComplete:
+        pass
+    
+    return parser.text
+
+
+def _get_bs4_html_text(html: str) -> str:
+    """Extracts the visible text of the whole HTML document using BeautifulSoup."""
+    from bs4 import BeautifulSoup
+    
+    return BeautifulSoup(html, "html.parser").get_text(separator=' ', strip=True)
+
+
+HTML_PREVIEW_ENGINES = {
+    "stream": _get_streamed_html_text,
+    "bs4": lambda html, length: _get_bs4_html_text(html),
+}
+
+
+def get_html_preview(html: str, length: int = 100, engine: str = None) -> str:
     """
     Extracts and generates a safe preview of an HTML email body.
 
     Args:
         html (str): The HTML email content.
         length (int): Maximum length of the text preview extracted from HTML.
+        engine (str, optional): The engine used to extract the text:
+            - "stream" (default): an incremental `html.parser` based extractor that stops
+              once it has `length` visible characters, so the cost doesn't grow with the
+              size of the template.
+            - "bs4": parses the whole document with BeautifulSoup.
+            If omitted, the `EMAIL_SENDER_PREVIEW_ENGINE` setting is used, or "stream" if it isn't set.
 
     Returns:
         str: A text-only preview derived from the HTML body.
     """
-    text = BeautifulSoup(html, "html.parser").get_text(separator=' ', strip=True)
+    if engine is None:
+        engine = getattr(settings, "EMAIL_SENDER_PREVIEW_ENGINE", "stream")
+
+    try:
+        get_text = HTML_PREVIEW_ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"Unknown HTML preview engine '{engine}'. Expected one of: {', '.join(HTML_PREVIEW_ENGINES)}")
+
+    text = get_text(html, length)
     return (text[:length] + '...') if len(text) > length else text
 
 
@@ -199,6 +392,131 @@ def measure_duration(func, *args, **kwargs):
     return result, elapsed_time
 
 
+def format_stage_timings(stage_timings: dict) -> str:
+    """
+    Formats the seconds spent in each stage of a send for the log summary.
+
+    Example:
+        >>> format_stage_timings({"render": 0.0042, "deliver": 0.31})
+        'render 4.20 ms, deliver 310.00 ms'
+    """
+    return ", ".join(f"{stage} {seconds * 1000:.2f} ms" for stage, seconds in stage_timings.items())
+
+
+async def ameasure_duration(func, *args, **kwargs):
+    """
+    The asynchronous version of `measure_duration`, used to time coroutine functions.
+
+    Returns:
+        tuple: The awaited result of the coroutine function and the time it took in seconds.
+    """
+    if not callable(func):
+        raise TypeError("The function must be callable")
+
+    start  = perf_counter()
+    result = await func(*args, **kwargs)
+    end    = perf_counter()
+
+    elapsed_time = end - start
+    return result, elapsed_time
+
+
+
+
+def _json_default(obj):
+    """
+    Converts the values the JSON encoders can't serialize, giving the same output as
+    `sanitize_for_json` followed by `json.dumps`:
+        - lazy translation strings and any other object become their string,
+        - sets become lists,
+        - dataclasses become dictionaries of their fields.
+
+    Only the values the encoder doesn't know are passed here, so the common values
+    (strings, numbers, lists, dictionaries) are never checked.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    return force_str(obj)
+
+
+def _dumps_json_stdlib(obj, indent: Optional[int] = None) -> str:
+    separators = None if indent else (",", ":")
+    return json.dumps(obj, default=_json_default, ensure_ascii=False, indent=indent, separators=separators)
+
+
+_orjson = None
+
+
+def _get_orjson():
+    """Imports orjson on first use, returning False if it isn't installed."""
+    global _orjson
+
+    if _orjson is None:
+        try:
+            import orjson
+        except ImportError:
+            orjson = False
+        _orjson = orjson
+    return _orjson
+
+
+def _dumps_json_orjson(obj, indent: Optional[int] = None) -> str:
+    """
+    Serializes with orjson when it is installed and no indentation is asked for.
+
+    Datetimes and dataclasses are handed to `_json_default`, so the output matches the
+    standard library engine. Values orjson refuses (e.g. integers wider than 64 bits) fall
+    back to the standard library.
+    """
+    orjson = _get_orjson()
+
+    if not orjson or indent:
+        return _dumps_json_stdlib(obj, indent)
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    try:
+        return orjson.dumps(obj, default=_json_default, option=options).decode()
+    except orjson.JSONEncodeError:
+        return _dumps_json_stdlib(obj, indent)
+
+
+JSON_ENGINES = {
+    "json": _dumps_json_stdlib,
+    "orjson": _dumps_json_orjson,
+}
+
+
+def dumps_json(obj, indent: Optional[int] = None, engine: str = None) -> str:
+    """
+    Serializes an object to JSON in a single pass.
+
+    Values the encoder can't serialize are converted by `_json_default` as they are met,
+    instead of walking and copying the whole object beforehand, so the cost is one pass of
+    the encoder however large the object (e.g. a template context) is.
+
+    Args:
+        obj: The object to serialize.
+        indent (int, optional): Pretty-prints with this indentation. By default the output is compact.
+        engine (str, optional): The encoder to use:
+            - "orjson" (default): orjson when it is installed, otherwise the standard library.
+            - "json": the standard library.
+            If omitted, the `EMAIL_SENDER_JSON_ENGINE` setting is used, or "orjson" if it isn't set.
+
+    Returns:
+        str: The JSON document.
+    """
+    if engine is None:
+        engine = getattr(settings, "EMAIL_SENDER_JSON_ENGINE", "orjson")
+
+    try:
+        dumps = JSON_ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"Unknown JSON engine '{engine}'. Expected one of: {', '.join(JSON_ENGINES)}")
+
+    return dumps(obj, indent)
 
 
 def sanitize_for_json(obj):
@@ -124,7 +124,8 @@ def validate_custom_email_model(custom_model, model_to_validate_against):
         raise IncorrectEmailModelAddedError(_("You cannot add the instance of the model. Add the model without '()' "))
     
     if not issubclass(custom_model, model_to_validate_against):
-        raise IncorrectEmailModelAddedError(_("Model added is not a subclass of EmailBaseLog. Model must inherit from EmailBaseLog"))
+        raise IncorrectEmailModelAddedError(_("Model added is not a subclass of {base_model}. Model must inherit from {base_model}"),
+                                            base_model=model_to_validate_against.__name__)
     
     class_name = custom_model.__class__.__name__
     
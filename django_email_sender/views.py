@@ -0,0 +1,24 @@
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from django_email_sender.metrics import CONTENT_TYPE, get_metrics_registry
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Returns the email metrics of the serving process in the Prometheus text exposition format.
+
+    The view isn't protected, so it should only be routed where the metrics scraper can reach
+    it, or wrapped in the project's own access check, e.g.
+
+        # urls.py
+        from django.contrib.admin.views.decorators import staff_member_required
+        from django_email_sender.views import metrics_view
+
+        urlpatterns = [
+            path("metrics/email/", metrics_view),
+            # or path("metrics/email/", staff_member_required(metrics_view)),
+        ]
+    """
+    return HttpResponse(get_metrics_registry().render(), content_type=CONTENT_TYPE)
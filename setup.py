@@ -11,6 +11,10 @@ setup(
         "beautifulsoup4>=4.13",
         "nh3>=0.2.21",
     ],
+    extras_require={
+        "opentelemetry": ["opentelemetry-api>=1.20"],
+        "orjson": ["orjson>=3.6"],
+    },
     author="Egbie Uku",
     author_email="egbieuku@hotmail.com",
     description="A chainable Django email sender utility.",
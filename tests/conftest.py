@@ -0,0 +1,42 @@
+import sys
+
+from pathlib import Path
+
+import django
+
+from django.conf import settings
+
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+
+def pytest_configure(config):
+    """Configures a minimal Django project with the test app and creates the test database."""
+    sys.path.insert(0, str(TESTS_DIR.parent))
+
+    settings.configure(
+        BASE_DIR=TESTS_DIR,
+        SECRET_KEY="django-email-sender-tests",
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django_email_sender",
+            "testapp",
+        ],
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+        DEFAULT_AUTO_FIELD="django.db.models.AutoField",
+        EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+        TEMPLATES=[{
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": [str(TESTS_DIR / "templates")],
+        }],
+        MYAPP_TEMPLATES_DIR=TESTS_DIR / "templates",
+        LANGUAGE_CODE="en",
+        USE_TZ=True,
+    )
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
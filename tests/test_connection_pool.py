@@ -0,0 +1,197 @@
+from threading import Event, Thread
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from django_email_sender import connection_pool as connection_pool_module
+from django_email_sender.connection_pool import EmailConnectionPool, get_connection_pool
+from django_email_sender.exceptions import EmailConnectionPoolClosed, EmailConnectionPoolExhausted
+
+
+class FakeSMTPConnection:
+    """Stands in for the `smtplib.SMTP` connection of an SMTP backend, answering NOOP with `status`."""
+
+    def __init__(self, status: int = 250, error: Exception = None):
+        self.status = status
+        self.error  = error
+        self.noops  = 0
+
+    def noop(self):
+        self.noops += 1
+
+        if self.error:
+            raise self.error
+        return self.status, b"OK"
+
+
+class Clock:
+    """A `monotonic` replacement that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestEmailConnectionPool(SimpleTestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        patcher    = mock.patch.object(connection_pool_module, "monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_pool(self, **kwargs) -> EmailConnectionPool:
+        kwargs.setdefault("health_check_after", None)
+        pool = EmailConnectionPool(**kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_reuses_a_released_connection(self):
+        pool   = self.create_pool(size=2)
+        pooled = pool.acquire()
+        pool.release(pooled)
+
+        self.assertIs(pool.acquire(), pooled)
+        self.assertEqual(pool.connections_opened, 1)
+
+    def test_reuses_an_idle_connection_that_answers_the_health_check(self):
+        pool       = self.create_pool(health_check_after=10)
+        pooled     = pool.acquire()
+        smtp       = pooled.backend.connection = FakeSMTPConnection(status=250)
+        pool.release(pooled)
+
+        self.clock.advance(5)
+        self.assertIs(pool.acquire(), pooled)
+        self.assertEqual(smtp.noops, 0)
+        pool.release(pooled)
+
+        self.clock.advance(11)
+        self.assertIs(pool.acquire(), pooled)
+        self.assertEqual(smtp.noops, 1)
+
+    def test_discards_an_idle_connection_that_fails_the_health_check(self):
+        for smtp in (FakeSMTPConnection(status=421), FakeSMTPConnection(error=ConnectionResetError("reset"))):
+            with self.subTest(smtp=smtp):
+                pool   = self.create_pool(health_check_after=0)
+                pooled = pool.acquire()
+                pooled.backend.connection = smtp
+                pool.release(pooled)
+
+                replacement = pool.acquire()
+
+                self.assertIsNot(replacement, pooled)
+                self.assertEqual(smtp.noops, 1)
+                self.assertEqual((pool.connections_opened, pool.connections_retired), (2, 1))
+
+    def test_retires_a_connection_once_it_reaches_the_maximum_age(self):
+        pool   = self.create_pool(max_age=60)
+        pooled = pool.acquire()
+        pool.release(pooled)
+
+        self.clock.advance(59)
+        self.assertIs(pool.acquire(), pooled)
+        pool.release(pooled)
+
+        self.clock.advance(1)
+        self.assertIsNot(pool.acquire(), pooled)
+        self.assertEqual((pool.connections_opened, pool.connections_retired), (2, 1))
+
+    def test_retires_a_connection_once_it_has_sent_the_maximum_number_of_messages(self):
+        pool = self.create_pool(max_messages=2)
+
+        pool.send_messages([mock.Mock()])
+        self.assertEqual(pool.idle_connections, 1)
+
+        pool.send_messages([mock.Mock()])
+        self.assertEqual(pool.idle_connections, 0)
+        self.assertEqual(pool.connections_retired, 1)
+
+        pool.send_messages([mock.Mock()])
+        self.assertEqual(pool.connections_opened, 2)
+
+    def test_discards_a_connection_that_raised(self):
+        pool = self.create_pool()
+
+        with self.assertRaises(RuntimeError):
+            with pool.connection():
+                raise RuntimeError("Sending failed")
+
+        self.assertEqual((pool.idle_connections, pool.connections_retired), (0, 1))
+
+    def test_raises_when_no_connection_becomes_free_within_the_timeout(self):
+        pool = self.create_pool(size=1, timeout=0.01)
+        pool.acquire()
+
+        with self.assertRaises(EmailConnectionPoolExhausted):
+            pool.acquire()
+
+        self.assertEqual(pool.connections_opened, 1)
+
+    def test_waits_for_a_connection_to_be_released(self):
+        pool     = self.create_pool(size=1, timeout=None)
+        pooled   = pool.acquire()
+        started  = Event()
+        acquired = []
+
+        def acquire():
+            started.set()
+            acquired.append(pool.acquire())
+
+        thread = Thread(target=acquire)
+        thread.start()
+        started.wait(5)
+        thread.join(0.05)
+        self.assertEqual(acquired, [])
+
+        pool.release(pooled)
+        thread.join(5)
+
+        self.assertEqual(acquired, [pooled])
+        self.assertEqual(pool.connections_opened, 1)
+
+    def test_rejects_acquire_once_closed(self):
+        pool   = self.create_pool()
+        pooled = pool.acquire()
+        pool.close()
+
+        with self.assertRaises(EmailConnectionPoolClosed):
+            pool.acquire()
+
+        pool.release(pooled)
+        self.assertEqual((pool.idle_connections, pool.connections_retired), (0, 1))
+
+
+@override_settings(EMAIL_SENDER_CONNECTION_POOL={"size": 2})
+class TestGetConnectionPool(SimpleTestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(connection_pool_module, "_connection_pool", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_returns_the_same_pool_in_a_process(self):
+        self.assertIs(get_connection_pool(), get_connection_pool())
+        self.assertEqual(get_connection_pool().size, 2)
+
+    @override_settings(EMAIL_SENDER_CONNECTION_POOL=None)
+    def test_returns_none_when_pooling_is_not_configured(self):
+        self.assertIsNone(get_connection_pool())
+
+    def test_a_forked_child_gets_a_pool_of_its_own_without_closing_the_parents(self):
+        parent_pool = get_connection_pool()
+        pooled      = parent_pool.acquire()
+        parent_pool.release(pooled)
+
+        with mock.patch.object(pooled.backend, "close") as close:
+            connection_pool_module._forget_connection_pool_after_fork()
+            child_pool = get_connection_pool()
+
+        self.assertIsNot(child_pool, parent_pool)
+        self.assertEqual(child_pool.idle_connections, 0)
+        self.assertEqual(parent_pool.idle_connections, 1)
+        close.assert_not_called()
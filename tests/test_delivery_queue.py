@@ -0,0 +1,183 @@
+from threading import Event, Thread
+from time import monotonic, sleep
+from unittest import mock
+
+from django.core import mail
+from django.test import SimpleTestCase, TransactionTestCase
+
+from django_email_sender.delivery_queue import EmailDeliveryQueue
+from django_email_sender.email_logger import EmailSenderLogger
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.exceptions import EmailQueueClosedError, EmailQueueFullError
+
+from testapp.models import EmailLog
+
+
+def create_email_logger(delivery_queue: EmailDeliveryQueue) -> EmailSenderLogger:
+    return EmailSenderLogger.create()\
+        .add_email_sender_instance(EmailSender())\
+        .add_log_model(EmailLog)\
+        .enable_email_meta_data_save()\
+        .enable_queued_delivery(delivery_queue)\
+        .from_address("no-reply@example.com")\
+        .with_subject("Welcome")\
+        .with_html_template("welcome.html", folder_name="emails")\
+        .with_text_template("welcome.txt", folder_name="emails")
+
+
+class TestEmailDeliveryQueue(SimpleTestCase):
+
+    def test_runs_every_job_before_shutting_down_when_draining(self):
+        delivery_queue = EmailDeliveryQueue(workers=2)
+        release        = Event()
+        results        = []
+
+        delivery_queue.submit(release.wait)
+        for index in range(10):
+            delivery_queue.submit(lambda index=index: results.append(index))
+
+        release.set()
+        delivery_queue.shutdown(drain=True)
+
+        self.assertEqual(sorted(results), list(range(10)))
+        self.assertEqual(delivery_queue.completed_jobs, 11)
+
+    def test_discards_pending_jobs_when_not_draining(self):
+        delivery_queue = EmailDeliveryQueue(workers=1)
+        started        = Event()
+        release        = Event()
+        results        = []
+
+        delivery_queue.submit(lambda: (started.set(), release.wait()))
+        started.wait(5)
+
+        for index in range(5):
+            delivery_queue.submit(lambda index=index: results.append(index))
+
+        release.set()
+        delivery_queue.shutdown(drain=False)
+
+        self.assertEqual(results, [])
+
+    def test_counts_failed_jobs(self):
+        delivery_queue = EmailDeliveryQueue(workers=1)
+
+        delivery_queue.submit(lambda: 1 / 0)
+        delivery_queue.shutdown(drain=True)
+
+        self.assertEqual(delivery_queue.failed_jobs, 1)
+
+    def test_rejects_jobs_once_shut_down(self):
+        delivery_queue = EmailDeliveryQueue(workers=1)
+        delivery_queue.shutdown()
+
+        with self.assertRaises(EmailQueueClosedError):
+            delivery_queue.submit(lambda: None)
+
+    def test_runs_a_job_submitted_while_shutting_down(self):
+        delivery_queue = EmailDeliveryQueue(workers=1)
+        put_started    = Event()
+        release        = Event()
+        results        = []
+        original_put   = delivery_queue._queue.put
+
+        def job():
+            results.append("job")
+
+        def put(item, *args, **kwargs):
+            if item is job:
+                put_started.set()
+                release.wait(5)
+            return original_put(item, *args, **kwargs)
+
+        with mock.patch.object(delivery_queue._queue, "put", put):
+            submitter = Thread(target=delivery_queue.submit, args=(job,))
+            submitter.start()
+            put_started.wait(5)
+
+            shutdown = Thread(target=delivery_queue.shutdown, kwargs={"drain": True})
+            shutdown.start()
+
+            deadline = monotonic() + 5
+            while not delivery_queue.is_closed and monotonic() < deadline:
+                sleep(0.01)
+            sleep(0.05)
+
+            release.set()
+            submitter.join(5)
+            shutdown.join(5)
+
+        self.assertEqual(results, ["job"])
+        self.assertEqual(delivery_queue.completed_jobs, 1)
+
+    def test_raises_when_full_and_not_blocking(self):
+        delivery_queue = EmailDeliveryQueue(workers=1, max_size=1, block=False)
+        started        = Event()
+        release        = Event()
+        self.addCleanup(delivery_queue.shutdown, drain=False)
+        self.addCleanup(release.set)
+
+        delivery_queue.submit(lambda: (started.set(), release.wait()))
+        started.wait(5)
+        delivery_queue.submit(lambda: None)
+
+        with self.assertRaises(EmailQueueFullError):
+            delivery_queue.submit(lambda: None)
+
+
+class TestQueuedDelivery(TransactionTestCase):
+
+    available_apps = ["django_email_sender", "testapp"]
+
+    def test_delivers_and_logs_every_queued_email_when_drained(self):
+        # the in-memory SQLite test database locks its tables against concurrent writers
+        delivery_queue = EmailDeliveryQueue(workers=1)
+        email_logger   = create_email_logger(delivery_queue)
+
+        for index in range(10):
+            email_logger.to(f"user{index}@example.com").with_context({"username": f"user{index}"}).send()
+
+        delivery_queue.shutdown(drain=True)
+
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), sorted(f"user{index}@example.com" for index in range(10)))
+        self.assertEqual(EmailLog.objects.count(), 10)
+        self.assertEqual(email_logger.email_delivery_count, 10)
+        self.assertTrue(email_logger.is_email_sent)
+
+    def test_delivers_the_email_as_it_was_when_queued(self):
+        delivery_queue = EmailDeliveryQueue(workers=1)
+        release        = Event()
+        email_logger   = create_email_logger(delivery_queue)
+
+        delivery_queue.submit(release.wait)
+
+        email_logger.to("first@example.com").with_context({"username": "First"}).send()
+        email_logger.to("second@example.com").with_subject("Changed").with_context({"username": "Second"})
+
+        release.set()
+        delivery_queue.shutdown(drain=True)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["first@example.com"])
+        self.assertEqual(mail.outbox[0].subject, "Welcome")
+        self.assertIn("Welcome First", mail.outbox[0].body)
+
+    def test_publishes_the_outcome_under_the_lock_of_the_queuing_state(self):
+        delivery_queue = EmailDeliveryQueue(workers=1)
+        email_logger   = create_email_logger(delivery_queue)
+        send_state     = email_logger._get_send_state()
+
+        with send_state._lock:
+            email_logger.to("user@example.com").with_context({"username": "Ada"}).send()
+
+            deadline = monotonic() + 5
+            while not mail.outbox and monotonic() < deadline:
+                sleep(0.01)
+
+            self.assertEqual(len(mail.outbox), 1)
+            self.assertEqual(send_state._email_delivery_count, 0)
+
+        delivery_queue.shutdown(drain=True)
+
+        self.assertEqual(email_logger.email_delivery_count, 1)
+        self.assertTrue(email_logger.is_email_sent)
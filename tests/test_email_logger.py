@@ -0,0 +1,350 @@
+import gc
+import json
+import logging
+import weakref
+
+from contextvars import copy_context
+from threading import Thread
+from unittest import mock
+
+from django.core import mail
+from django.test import SimpleTestCase, TestCase
+
+from django_email_sender import email_logger as email_logger_module
+from django_email_sender.connection_pool import EmailConnectionPool
+from django_email_sender.email_logger import EmailSenderLogger, clear_email_sender_validation_cache
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.email_sender_constants import LoggerType
+from django_email_sender.exceptions import EmailSendError, MissingFieldsInClass
+from django_email_sender.rate_limit import EmailRateLimiter
+from django_email_sender.retry import RetryPolicy
+
+from testapp.models import EmailLog, EmailOutbox
+
+
+class RecordCollector(logging.Handler):
+    """Collects the records emitted by the `EmailSenderLogger`."""
+
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        if record.module == "email_logger":
+            self.records.append(record)
+
+
+def create_email_logger(logger: logging.Logger, email_sender: EmailSender = None) -> EmailSenderLogger:
+    return EmailSenderLogger.create()\
+        .add_email_sender_instance(email_sender or EmailSender())\
+        .config_logger(logger, LoggerType.DEBUG)\
+        .start_logging_session()\
+        .from_address("no-reply@example.com")\
+        .to("user@example.com")\
+        .with_subject("Welcome")\
+        .with_context({"username": "Ada"})\
+        .with_html_template("welcome.html", folder_name="emails")\
+        .with_text_template("welcome.txt", folder_name="emails")
+
+
+class TestEmailSenderLoggerMessages(SimpleTestCase):
+
+    def setUp(self):
+        self.logger    = logging.getLogger("tests.email_sender")
+        self.collector = RecordCollector()
+        self.logger.addHandler(self.collector)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.addCleanup(self.logger.removeHandler, self.collector)
+
+    def test_passes_plain_string_messages_to_the_logger(self):
+        create_email_logger(self.logger).enable_verbose().send()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertTrue(self.collector.records)
+        self.assertEqual([record for record in self.collector.records if not isinstance(record.msg, str)], [])
+
+    def test_passes_a_plain_string_structured_summary_to_the_logger(self):
+        create_email_logger(self.logger).enable_structured_summary().send()
+
+        summaries = [record for record in self.collector.records if hasattr(record, "email_summary")]
+        self.assertEqual(len(summaries), 1)
+        self.assertIsInstance(summaries[0].msg, str)
+        self.assertIn("user@example.com", summaries[0].getMessage())
+
+    def test_skips_messages_below_the_logger_level(self):
+        email_logger = create_email_logger(self.logger).enable_verbose()
+        self.collector.records.clear()
+        self.logger.setLevel(logging.ERROR)
+
+        email_logger.send()
+
+        self.assertEqual(self.collector.records, [])
+
+
+class TestMethodTracing(SimpleTestCase):
+
+    def setUp(self):
+        self.logger    = logging.getLogger("tests.email_sender")
+        self.collector = RecordCollector()
+        self.logger.addHandler(self.collector)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.addCleanup(self.logger.removeHandler, self.collector)
+
+    def get_traces(self) -> list:
+        return [record.getMessage() for record in self.collector.records if "'Debug trace:'" in record.getMessage()]
+
+    def send_and_watch_the_call_stack(self, email_logger: EmailSenderLogger) -> mock.Mock:
+        with mock.patch("django_email_sender.email_logger.mark_method_for_debugging",
+                        wraps=email_logger_module.mark_method_for_debugging) as mark_method_for_debugging:
+            email_logger.with_subject("Hello").send()
+        return mark_method_for_debugging
+
+    def test_does_not_look_at_the_call_stack_without_method_tracing(self):
+        email_logger = create_email_logger(self.logger).enable_verbose()
+
+        mark_method_for_debugging = self.send_and_watch_the_call_stack(email_logger)
+
+        self.assertEqual(len(mail.outbox), 1)
+        mark_method_for_debugging.assert_not_called()
+        self.assertEqual(self.get_traces(), [])
+
+    def test_does_not_look_at_the_call_stack_without_verbose_mode(self):
+        email_logger = create_email_logger(self.logger).set_traceback(method_tracing=True)
+
+        mark_method_for_debugging = self.send_and_watch_the_call_stack(email_logger)
+
+        mark_method_for_debugging.assert_not_called()
+        self.assertEqual(self.get_traces(), [])
+
+    def test_does_not_look_at_the_call_stack_when_debug_messages_are_filtered_out(self):
+        email_logger = create_email_logger(self.logger).enable_verbose().set_traceback(method_tracing=True)
+        self.logger.setLevel(logging.INFO)
+
+        mark_method_for_debugging = self.send_and_watch_the_call_stack(email_logger)
+
+        mark_method_for_debugging.assert_not_called()
+        self.assertEqual(self.get_traces(), [])
+
+    def test_logs_a_trace_of_each_method_called_when_tracing_is_on(self):
+        email_logger = create_email_logger(self.logger).enable_verbose().set_traceback(method_tracing=True)
+
+        email_logger.with_subject("Hello").send()
+
+        traces = self.get_traces()
+        self.assertTrue(any("'EmailSenderLogger.with_subject'" in trace for trace in traces))
+        self.assertTrue(any("'EmailSenderLogger._prepare_send'" in trace for trace in traces))
+
+
+class TestStructuredSummary(TestCase):
+
+    def setUp(self):
+        self.logger    = logging.getLogger("tests.email_sender")
+        self.collector = RecordCollector()
+        self.logger.addHandler(self.collector)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.addCleanup(self.logger.removeHandler, self.collector)
+
+    def get_summary(self) -> dict:
+        summaries = [record.email_summary for record in self.collector.records if hasattr(record, "email_summary")]
+        self.assertEqual(len(summaries), 1)
+        return summaries[0]
+
+    def test_reports_the_sent_email(self):
+        email_logger = create_email_logger(self.logger).enable_structured_summary()
+        email_logger.send()
+
+        summary = self.get_summary()
+        self.assertEqual(summary["email_id"], email_logger._email_sender.email_id)
+        self.assertEqual((summary["from_email"], summary["to_email"], summary["subject"]),
+                         ("no-reply@example.com", "user@example.com", "Welcome"))
+        self.assertEqual((summary["status"], summary["delivered"], summary["enqueued"]), ("sent", 1, 0))
+        self.assertEqual((summary["additional_recipients"], summary["total_recipients"]), ([], 1))
+        self.assertEqual(list(summary["stage_timings"]), ["prepare", "validate", "render", "build", "deliver"])
+        self.assertTrue(summary["text_preview"].startswith("Welcome"))
+
+    def test_counts_each_distinct_recipient_once(self):
+        email_logger = create_email_logger(self.logger, EmailSender().with_recipient_chunk_size(3)).enable_structured_summary()
+
+        for recipient in [f"user{index}@example.com" for index in range(7)] + ["user0@EXAMPLE.com", "primary@example.com"]:
+            email_logger.add_new_recipient(recipient)
+
+        email_logger.to("primary@example.com").send(auto_reset=True)
+
+        summary = self.get_summary()
+        self.assertEqual(sum(len(message.to) for message in mail.outbox), 8)
+        self.assertEqual(summary["total_recipients"], 8)
+        self.assertEqual(summary["delivered"], 3)
+
+    def test_records_the_stage_timings_in_the_metadata(self):
+        email_logger = create_email_logger(self.logger).enable_structured_summary()
+        email_logger.send()
+
+        stage_timings = json.loads(email_logger.email_meta_data)["stage_timings"]
+        self.assertEqual(list(stage_timings), ["prepare", "validate", "render", "build", "deliver"])
+        self.assertTrue(all(isinstance(seconds, float) and seconds >= 0 for seconds in stage_timings.values()))
+        self.assertEqual(stage_timings, self.get_summary()["stage_timings"])
+
+    def test_reports_an_email_written_to_the_outbox_as_enqueued(self):
+        email_logger = create_email_logger(self.logger, EmailSender().with_outbox(EmailOutbox)).enable_structured_summary()
+        email_logger.send()
+
+        summary = self.get_summary()
+        self.assertEqual((summary["status"], summary["delivered"], summary["enqueued"]), ("enqueued", 0, 1))
+        self.assertIn("Enqueued in the outbox", self.collector.records[-1].getMessage())
+        self.assertEqual(mail.outbox, [])
+
+    def test_reports_an_email_written_to_the_outbox_in_the_banner(self):
+        email_logger = create_email_logger(self.logger, EmailSender().with_outbox(EmailOutbox)).enable_structured_summary(False)
+        email_logger.send()
+
+        messages = [record.getMessage() for record in self.collector.records]
+        self.assertTrue(any("Enqueued in the outbox" in message for message in messages))
+        self.assertTrue(any("Emails written to the outbox      : 1" in message for message in messages))
+
+
+class TestAsyncSend(TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger("tests.email_sender")
+        self.logger.propagate = False
+
+    async def test_asend_delivers_the_email_and_records_the_outcome(self):
+        email_logger = create_email_logger(self.logger)
+
+        await email_logger.asend()
+
+        self.assertEqual([message.to for message in mail.outbox], [["user@example.com"]])
+        self.assertTrue(email_logger.is_email_sent)
+        self.assertEqual(email_logger.email_delivery_count, 1)
+
+    async def test_asend_saves_the_log_record(self):
+        email_logger = create_email_logger(self.logger).add_log_model(EmailLog).enable_email_meta_data_save()
+
+        await email_logger.asend()
+
+        log_record = await EmailLog.objects.aget()
+        self.assertEqual((log_record.to_email, log_record.subject), ("user@example.com", "Welcome"))
+
+    async def test_asend_raises_when_the_delivery_fails(self):
+        email_logger = create_email_logger(self.logger)
+        email_logger.clear_from_email()
+
+        with self.assertRaises(EmailSendError):
+            await email_logger.asend()
+
+        self.assertEqual(mail.outbox, [])
+        self.assertFalse(email_logger.is_email_sent)
+
+
+class RenamedRecipientEmailSender(EmailSender):
+    """Breaks the contract of `EmailSender.to` by renaming its parameter."""
+
+    def to(self, address: str) -> "EmailSender":
+        return super().to(address)
+
+
+class TestEmailSenderValidation(SimpleTestCase):
+
+    def setUp(self):
+        clear_email_sender_validation_cache()
+        self.addCleanup(clear_email_sender_validation_cache)
+
+        patcher = mock.patch.object(EmailSenderLogger, "_validate_email_sender_public_methods", autospec=True,
+                                    side_effect=EmailSenderLogger._validate_email_sender_public_methods)
+        self.validate_methods = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_validates_each_class_only_once(self):
+        EmailSenderLogger.create().add_email_sender_instance(EmailSender())
+        EmailSenderLogger.create().add_email_sender_instance(EmailSender())
+
+        self.assertEqual(self.validate_methods.call_count, 1)
+
+    def test_validates_a_subclass_even_when_its_parent_has_passed(self):
+        EmailSenderLogger.create().add_email_sender_instance(EmailSender())
+
+        with self.assertRaises(MissingFieldsInClass):
+            EmailSenderLogger.create().add_email_sender_instance(RenamedRecipientEmailSender())
+
+        with self.assertRaises(MissingFieldsInClass):
+            EmailSenderLogger.create().add_email_sender_instance(RenamedRecipientEmailSender())
+
+        self.assertEqual(self.validate_methods.call_count, 3)
+
+
+class TestEmailSenderDeliverySettings(SimpleTestCase):
+
+    def setUp(self):
+        self.connection_pool = EmailConnectionPool(size=1)
+        self.rate_limiter    = EmailRateLimiter(rate=1000)
+        self.retry_policy    = RetryPolicy(max_attempts=2, base_delay=0, jitter=False)
+        self.email_sender    = EmailSender.create()\
+            .with_connection_pool(self.connection_pool)\
+            .with_rate_limiter(self.rate_limiter)\
+            .with_retry_policy(self.retry_policy)\
+            .with_recipient_chunk_size(10)
+
+    def assert_delivery_settings_kept(self, email_sender: EmailSender):
+        self.assertIs(email_sender.connection_pool, self.connection_pool)
+        self.assertIs(email_sender.rate_limiter, self.rate_limiter)
+        self.assertIs(email_sender.retry_policy, self.retry_policy)
+        self.assertEqual(email_sender.recipient_chunk_size, 10)
+
+    def test_add_email_sender_instance_keeps_the_delivery_settings(self):
+        email_logger = EmailSenderLogger.create().add_email_sender_instance(self.email_sender)
+
+        self.assert_delivery_settings_kept(email_logger._email_sender)
+
+    def test_thread_safe_mode_keeps_the_delivery_settings_in_every_thread(self):
+        email_logger   = EmailSenderLogger.create().add_email_sender_instance(self.email_sender).enable_thread_safe_mode()
+        thread_senders = []
+
+        thread = Thread(target=lambda: thread_senders.append(email_logger._email_sender))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(thread_senders[0], email_logger._email_sender)
+        self.assert_delivery_settings_kept(thread_senders[0])
+        self.assert_delivery_settings_kept(email_logger._email_sender)
+
+    def test_a_new_thread_inherits_the_delivery_settings_of_the_sender_added_to_the_logger(self):
+        email_logger   = EmailSenderLogger.create().add_email_sender_instance(self.email_sender).enable_thread_safe_mode()
+        thread_senders = []
+        retry_policy   = RetryPolicy(max_attempts=5)
+        email_logger._email_sender.with_retry_policy(retry_policy)
+
+        def change_the_rate_limiter():
+            email_logger._email_sender.with_rate_limiter(EmailRateLimiter(rate=1))
+            thread_senders.append(email_logger._email_sender)
+
+        for target in (change_the_rate_limiter, lambda: thread_senders.append(email_logger._email_sender)):
+            thread = Thread(target=target)
+            thread.start()
+            thread.join()
+
+        self.assertIsNot(thread_senders[0].rate_limiter, self.rate_limiter)
+        self.assert_delivery_settings_kept(thread_senders[1])
+        self.assertIs(email_logger._email_sender.retry_policy, retry_policy)
+
+    def test_forgets_the_email_of_every_thread_once_the_logger_is_garbage_collected(self):
+        email_logger     = EmailSenderLogger.create().add_email_sender_instance(self.email_sender).enable_thread_safe_mode()
+        email_sender     = weakref.ref(email_logger._email_sender)
+        email_logger_ref = weakref.ref(email_logger)
+
+        del email_logger
+        gc.collect()
+
+        self.assertIsNone(email_logger_ref())
+        self.assertIsNone(email_sender())
+
+    def test_starts_a_new_email_in_every_thread_when_thread_safe_mode_is_turned_on_again(self):
+        email_logger = EmailSenderLogger.create().add_email_sender_instance(self.email_sender).enable_thread_safe_mode()
+        context      = copy_context()
+        first_sender = context.run(lambda: email_logger._email_sender)
+
+        email_logger.disable_thread_safe_mode().enable_thread_safe_mode()
+
+        self.assertIsNot(context.run(lambda: email_logger._email_sender), first_sender)
@@ -1,23 +1,303 @@
-from django.test import TestCase
-from email_sender.email_sender import EmailSender
-
-
-class TestEmailSender(TestCase):
-    def test_email_sender_creates_and_sends_email(self):
-        
-        # Example test for email sending logic
-        email_sender = EmailSender.create()\
-            .from_address("no-reply@example.com")\
-            .to(["test@example.com"])\
-            .with_subject("Test Email")\
-            .with_context({"username": "testuser"})\
-            .with_text_template("emails/test.txt")\
-            .with_html_template("emails/test.html")
-        
-        # Test if the sender was set correctly
-        self.assertEqual(email_sender.from_address, "no-reply@example.com")
-        self.assertEqual(email_sender.subject, "Test Email")
-
-        # Here, you can mock `send_mail` to ensure it gets called
-        with self.assertRaises("SomeMockException"):
+import re
+import smtplib
+
+from django.core import mail
+from django.test import SimpleTestCase, override_settings
+
+from django_email_sender.connection_pool import EmailConnectionPool
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.exceptions import (EmailDeliveryAttemptsExhausted, EmailRateLimitExceeded, EmailSendError,
+                                            EmailSenderBaseException)
+from django_email_sender.rate_limit import EmailRateLimiter
+from django_email_sender.retry import RetryPolicy
+from django_email_sender.utils import format_stage_timings
+
+from testapp.backends import FlakyEmailBackend
+
+
+FLAKY_BACKEND = "testapp.backends.FlakyEmailBackend"
+
+
+def create_email_sender():
+    return EmailSender.create()\
+        .from_address("no-reply@example.com")\
+        .with_subject("Welcome")\
+        .with_context({"site_name": "Example"})\
+        .with_html_template("welcome.html", folder_name="emails")\
+        .with_text_template("welcome.txt", folder_name="emails")
+
+
+class TestEmailSender(SimpleTestCase):
+
+    def test_send_renders_the_templates_and_delivers_the_email(self):
+        sent, is_sent = create_email_sender().to("user@example.com").with_context({"username": "Ada"}).send()
+
+        self.assertEqual((sent, is_sent), (1, True))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["user@example.com"])
+        self.assertEqual(mail.outbox[0].subject, "Welcome")
+        self.assertIn("Welcome Ada", mail.outbox[0].body)
+        self.assertIn("<h1>Welcome Ada</h1>", mail.outbox[0].alternatives[0][0])
+
+    def test_send_raises_when_a_field_is_missing(self):
+        with self.assertRaises(EmailSenderBaseException):
+            create_email_sender().send()
+
+        self.assertEqual(mail.outbox, [])
+
+    def test_auto_reset_clears_the_fields(self):
+        email_sender = create_email_sender().to("user@example.com")
+        email_sender.send(auto_reset=True)
+
+        self.assertIsNone(email_sender.from_email)
+        self.assertIsNone(email_sender.subject)
+        self.assertEqual(email_sender.context, {})
+
+    def test_splits_the_recipients_into_chunks_in_the_order_they_were_added(self):
+        recipients   = [f"user{index}@example.com" for index in range(7)]
+        email_sender = create_email_sender().to("primary@example.com").with_recipient_chunk_size(3)
+
+        for recipient in recipients + ["user0@EXAMPLE.com", "primary@example.com"]:
+            email_sender.add_new_recipient(recipient)
+
+        sent, is_sent = email_sender.with_context({"username": "Ada"}).send()
+
+        self.assertEqual((sent, is_sent), (3, True))
+        self.assertEqual([message.to for message in mail.outbox], [
+            ["primary@example.com", "user0@example.com", "user1@example.com"],
+            ["user2@example.com", "user3@example.com", "user4@example.com"],
+            ["user5@example.com", "user6@example.com"],
+        ])
+
+
+class TestStageTimings(SimpleTestCase):
+
+    def test_records_every_stage_of_send_in_the_order_they_ran(self):
+        email_sender = create_email_sender().to("user@example.com").with_rate_limiter(EmailRateLimiter(rate=1000))
+        email_sender.send()
+
+        self.assertEqual(list(email_sender.stage_timings), ["validate", "render", "build", "throttle", "deliver"])
+        for stage, seconds in email_sender.stage_timings.items():
+            with self.subTest(stage=stage):
+                self.assertIsInstance(seconds, float)
+                self.assertGreaterEqual(seconds, 0.0)
+
+    def test_leaves_out_the_throttle_stage_without_a_rate_limiter(self):
+        email_sender = create_email_sender().to("user@example.com")
+        email_sender.send()
+
+        self.assertEqual(list(email_sender.stage_timings), ["validate", "render", "build", "deliver"])
+
+    def test_starts_each_send_with_new_timings(self):
+        email_sender = create_email_sender().to("user@example.com").with_rate_limiter(EmailRateLimiter(rate=1000))
+        email_sender.send()
+        email_sender.with_rate_limiter(None).send()
+
+        self.assertNotIn("throttle", email_sender.stage_timings)
+
+    def test_format_stage_timings_formats_the_timings_in_milliseconds(self):
+        email_sender = create_email_sender().to("user@example.com")
+        email_sender.send()
+
+        self.assertRegex(format_stage_timings(email_sender.stage_timings),
+                         r"^validate \d+\.\d{2} ms, render \d+\.\d{2} ms, build \d+\.\d{2} ms, deliver \d+\.\d{2} ms$")
+        self.assertEqual(format_stage_timings({"render": 0.0042, "deliver": 0.31}), "render 4.20 ms, deliver 310.00 ms")
+
+
+@override_settings(EMAIL_BACKEND=FLAKY_BACKEND)
+class TestDeliveryRetries(SimpleTestCase):
+
+    def setUp(self):
+        FlakyEmailBackend.reset()
+
+    def create_email_sender(self, max_attempts: int = 3):
+        return create_email_sender()\
+            .to("first@example.com")\
+            .add_new_recipient("second@example.com")\
+            .with_recipient_chunk_size(1)\
+            .with_context({"username": "Ada"})\
+            .with_retry_policy(RetryPolicy(max_attempts=max_attempts, base_delay=0, jitter=False))
+
+    def test_counts_the_attempts_of_each_message(self):
+        email_sender = self.create_email_sender()
+
+        self.assertEqual(email_sender.send(), (2, True))
+        self.assertEqual((email_sender.delivery_attempts, email_sender.delivery_retries), (1, 0))
+
+    def test_reports_the_most_attempts_of_any_message_and_the_total_retries(self):
+        disconnected = smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        FlakyEmailBackend.reset({"first@example.com": [disconnected], "second@example.com": [disconnected, disconnected]})
+        email_sender = self.create_email_sender()
+
+        self.assertEqual(email_sender.send(), (2, True))
+        self.assertEqual((email_sender.delivery_attempts, email_sender.delivery_retries), (3, 3))
+
+    def test_raises_attempts_exhausted_when_a_transient_error_persists(self):
+        disconnected = smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        FlakyEmailBackend.reset({"second@example.com": [disconnected, disconnected]})
+        email_sender = self.create_email_sender(max_attempts=2)
+
+        with self.assertRaises(EmailDeliveryAttemptsExhausted):
             email_sender.send()
+
+        self.assertEqual((email_sender.delivery_attempts, email_sender.delivery_retries), (2, 1))
+
+    def test_raises_a_permanent_error_unchanged(self):
+        refused = smtplib.SMTPRecipientsRefused({"second@example.com": (550, b"unknown")})
+        FlakyEmailBackend.reset({"second@example.com": [refused]})
+
+        with self.assertRaises(smtplib.SMTPRecipientsRefused) as raised:
+            self.create_email_sender().send()
+
+        self.assertIs(raised.exception, refused)
+        self.assertEqual(len(mail.outbox), 1)
+
+
+@override_settings(EMAIL_BACKEND=FLAKY_BACKEND)
+class TestAsyncSend(SimpleTestCase):
+
+    def setUp(self):
+        FlakyEmailBackend.reset()
+
+    async def test_asend_renders_the_templates_and_delivers_the_email(self):
+        email_sender = create_email_sender().to("user@example.com").with_context({"username": "Ada"})
+
+        self.assertEqual(await email_sender.asend(), (1, True))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["user@example.com"])
+        self.assertIn("Welcome Ada", mail.outbox[0].body)
+        self.assertEqual(list(email_sender.stage_timings), ["validate", "render", "build", "deliver"])
+
+    async def test_asend_splits_the_recipients_into_chunks(self):
+        email_sender = create_email_sender()\
+            .to("first@example.com")\
+            .add_new_recipient("second@example.com")\
+            .add_new_recipient("third@example.com")\
+            .with_recipient_chunk_size(2)
+
+        self.assertEqual(await email_sender.asend(), (2, True))
+        self.assertEqual([message.to for message in mail.outbox],
+                         [["first@example.com", "second@example.com"], ["third@example.com"]])
+
+    async def test_asend_retries_a_transient_failure(self):
+        FlakyEmailBackend.reset({"user@example.com": [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]})
+        email_sender = create_email_sender()\
+            .to("user@example.com")\
+            .with_retry_policy(RetryPolicy(max_attempts=2, base_delay=0, jitter=False))
+
+        self.assertEqual(await email_sender.asend(), (1, True))
+        self.assertEqual((email_sender.delivery_attempts, email_sender.delivery_retries), (2, 1))
+        self.assertEqual(len(mail.outbox), 1)
+
+    async def test_asend_waits_on_the_rate_limiter_and_raises_past_its_timeout(self):
+        rate_limiter = EmailRateLimiter(rate=1, burst=1, timeout=0)
+        email_sender = create_email_sender().to("user@example.com").with_rate_limiter(rate_limiter)
+
+        self.assertEqual(await email_sender.asend(), (1, True))
+        self.assertIn("throttle", email_sender.stage_timings)
+
+        with self.assertRaises(EmailRateLimitExceeded):
+            await email_sender.asend()
+
+        stats = next(iter(rate_limiter.stats().values()))
+        self.assertEqual((stats.sends, stats.rejected_sends), (1, 1))
+        self.assertEqual(len(mail.outbox), 1)
+
+    async def test_asend_raises_the_same_error_as_send_for_a_library_error(self):
+        error = EmailSenderBaseException("Something broke")
+        FlakyEmailBackend.reset({"user@example.com": [error, error]})
+
+        with self.assertRaises(EmailSendError):
+            create_email_sender().to("user@example.com").send()
+
+        with self.assertRaises(EmailSendError):
+            await create_email_sender().to("user@example.com").asend()
+
+
+class TestSendMany(SimpleTestCase):
+
+    def setUp(self):
+        FlakyEmailBackend.reset()
+
+    def test_returns_one_result_per_recipient_in_order(self):
+        results = create_email_sender().send_many([
+            {"to": "first@example.com", "context": {"username": "First"}},
+            {"to": "second@example.com", "context": {"username": "Second", "site_name": "Other"}},
+            {"to": "third@example.com"},
+        ])
+
+        self.assertEqual([result.to_email for result in results], ["first@example.com", "second@example.com", "third@example.com"])
+        self.assertTrue(all(result.is_sent and result.sent_count == 1 and result.error is None for result in results))
+
+        self.assertEqual([message.to for message in mail.outbox], [["first@example.com"], ["second@example.com"], ["third@example.com"]])
+        self.assertIn("Welcome First, thanks for joining Example", mail.outbox[0].body)
+        self.assertIn("Welcome Second, thanks for joining Other", mail.outbox[1].body)
+
+    def test_validates_the_entries(self):
+        with self.assertRaises(EmailSenderBaseException):
+            create_email_sender().send_many([{"context": {}}])
+
+        with self.assertRaises(EmailSenderBaseException):
+            create_email_sender().send_many({"to": "user@example.com"})
+
+    @override_settings(EMAIL_BACKEND=FLAKY_BACKEND)
+    def test_a_failed_recipient_does_not_stop_the_batch(self):
+        FlakyEmailBackend.reset({"second@example.com": [smtplib.SMTPRecipientsRefused({"second@example.com": (550, b"unknown")})]})
+
+        results = create_email_sender().send_many([{"to": "first@example.com"}, {"to": "second@example.com"}, {"to": "third@example.com"}])
+
+        self.assertEqual([result.is_sent for result in results], [True, False, True])
+        self.assertIn("second@example.com", results[1].error)
+        self.assertEqual(results[1].sent_count, 0)
+        self.assertEqual(len(mail.outbox), 2)
+
+    @override_settings(EMAIL_BACKEND=FLAKY_BACKEND)
+    def test_reuses_one_connection_for_the_batch(self):
+        create_email_sender().send_many([{"to": f"user{index}@example.com"} for index in range(5)])
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(FlakyEmailBackend.opened, 1)
+
+    @override_settings(EMAIL_BACKEND=FLAKY_BACKEND)
+    def test_reopens_the_connection_after_it_was_dropped(self):
+        FlakyEmailBackend.reset({"second@example.com": [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]})
+
+        results = create_email_sender().send_many([{"to": "first@example.com"}, {"to": "second@example.com"},
+                                                   {"to": "third@example.com"}, {"to": "fourth@example.com"}])
+
+        self.assertEqual([result.is_sent for result in results], [True, False, True, True])
+        self.assertEqual(FlakyEmailBackend.opened, 2)
+
+    @override_settings(EMAIL_BACKEND=FLAKY_BACKEND)
+    def test_retries_a_transient_failure_with_the_retry_policy(self):
+        FlakyEmailBackend.reset({"second@example.com": [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]})
+
+        results = create_email_sender()\
+            .with_retry_policy(RetryPolicy(max_attempts=2, base_delay=0, jitter=False))\
+            .send_many([{"to": "first@example.com"}, {"to": "second@example.com"}])
+
+        self.assertEqual([result.is_sent for result in results], [True, True])
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_delivers_through_the_connection_pool(self):
+        pool = EmailConnectionPool(size=1)
+
+        results = create_email_sender().with_connection_pool(pool).send_many([{"to": "first@example.com"}, {"to": "second@example.com"}])
+
+        self.assertTrue(all(result.is_sent for result in results))
+        self.assertEqual(pool.connections_opened, 1)
+        self.assertEqual(pool.idle_connections, 1)
+
+    def test_waits_on_the_rate_limiter_for_every_message(self):
+        rate_limiter = EmailRateLimiter(rate=1000)
+
+        create_email_sender().with_rate_limiter(rate_limiter).send_many([{"to": "first@example.com"}, {"to": "second@example.com"}])
+
+        stats = next(iter(rate_limiter.stats().values()))
+        self.assertEqual(stats.sends, 2)
+
+    def test_records_the_stage_timings_of_each_message(self):
+        email_sender = create_email_sender()
+        email_sender.send_many([{"to": "first@example.com"}])
+
+        self.assertEqual(list(email_sender.stage_timings), ["render", "build", "deliver"])
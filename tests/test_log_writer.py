@@ -0,0 +1,197 @@
+from time import monotonic, sleep
+from unittest import mock
+
+from django.core import mail
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+
+from django_email_sender.delivery_queue import EmailDeliveryQueue
+from django_email_sender.email_logger import EmailSenderLogger
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.log_writer import BufferedLogWriter
+
+from testapp.models import EmailLog
+
+
+def create_log_record(to_email: str = "user@example.com") -> EmailLog:
+    return EmailLog(from_email="no-reply@example.com", to_email=to_email, subject="Welcome",
+                    email_body="Welcome", status="sent")
+
+
+def wait_for_flush(writer: BufferedLogWriter, timeout: float = 5) -> None:
+    """Waits until the background thread of the writer has written its buffer."""
+    deadline = monotonic() + timeout
+
+    while (writer.pending_records or writer._flush_lock.locked()) and monotonic() < deadline:
+        sleep(0.01)
+
+
+class TestBufferedLogWriter(TestCase):
+
+    def test_close_writes_the_remaining_records(self):
+        writer = BufferedLogWriter(EmailLog, batch_size=100, flush_interval=None)
+        writer.add(create_log_record())
+
+        writer.close()
+
+        self.assertEqual(EmailLog.objects.count(), 1)
+
+    def test_writes_records_added_after_close_once_the_transaction_commits(self):
+        writer = BufferedLogWriter(EmailLog, batch_size=100, flush_interval=None)
+        writer.close()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            writer.add(create_log_record())
+            self.assertEqual(EmailLog.objects.count(), 0)
+
+        self.assertEqual(EmailLog.objects.count(), 1)
+        self.assertEqual(writer.pending_records, 0)
+
+    def test_saves_the_records_one_at_a_time_when_the_bulk_write_breaks_the_transaction(self):
+        writer = BufferedLogWriter(EmailLog, batch_size=100, flush_interval=None)
+        writer.add(create_log_record("good@example.com"))
+        writer.add(EmailLog(from_email="no-reply@example.com", to_email=None, subject="Welcome",
+                            email_body="Welcome", status="sent"))
+
+        self.assertEqual(writer.flush(), 1)
+
+        self.assertEqual(list(EmailLog.objects.values_list("to_email", flat=True)), ["good@example.com"])
+        self.assertEqual(writer.pending_records, 1)
+
+    def test_saves_the_records_one_at_a_time_when_the_bulk_write_fails(self):
+        writer = BufferedLogWriter(EmailLog, batch_size=100, flush_interval=None)
+        bad    = create_log_record("bad@example.com")
+        writer.add(create_log_record("good@example.com"))
+        writer.add(bad)
+
+        original_save = EmailLog.save
+
+        def save(record, *args, **kwargs):
+            if record is bad:
+                raise RuntimeError("Cannot save the record")
+            return original_save(record, *args, **kwargs)
+
+        with mock.patch.object(EmailLog.objects, "bulk_create", side_effect=RuntimeError("Bulk write failed")), \
+                mock.patch.object(EmailLog, "save", save):
+            self.assertEqual(writer.flush(), 1)
+
+        self.assertEqual(list(EmailLog.objects.values_list("to_email", flat=True)), ["good@example.com"])
+        self.assertEqual(writer.failed_records, 1)
+        self.assertEqual(writer.pending_records, 1)
+
+        writer.flush()
+        self.assertEqual(EmailLog.objects.count(), 2)
+        self.assertEqual(writer.pending_records, 0)
+
+    def test_drops_a_record_after_the_maximum_number_of_write_attempts(self):
+        writer = BufferedLogWriter(EmailLog, batch_size=100, flush_interval=None, max_write_attempts=2)
+        writer.add(create_log_record())
+
+        with mock.patch.object(EmailLog.objects, "bulk_create", side_effect=RuntimeError("Bulk write failed")), \
+                mock.patch.object(EmailLog, "save", side_effect=RuntimeError("Cannot save the record")):
+            writer.flush()
+            self.assertEqual((writer.pending_records, writer.dropped_records), (1, 0))
+
+            writer.flush()
+            self.assertEqual((writer.pending_records, writer.dropped_records), (0, 1))
+
+        self.assertEqual(EmailLog.objects.count(), 0)
+
+    def test_counts_every_failed_save(self):
+        writer = BufferedLogWriter(EmailLog, batch_size=100, flush_interval=None, max_write_attempts=3)
+        writer.add(create_log_record())
+
+        with mock.patch.object(EmailLog.objects, "bulk_create", side_effect=RuntimeError("Bulk write failed")), \
+                mock.patch.object(EmailLog, "save", side_effect=RuntimeError("Cannot save the record")):
+            writer.flush()
+            writer.flush()
+
+        self.assertEqual((writer.failed_records, writer.dropped_records), (2, 0))
+
+    def test_rejects_an_invalid_number_of_write_attempts(self):
+        with self.assertRaises(ValueError):
+            BufferedLogWriter(EmailLog, max_write_attempts=0)
+
+
+class TestBufferedLogWriterThread(TransactionTestCase):
+
+    available_apps = ["django_email_sender", "testapp"]
+
+    def create_writer(self, **kwargs) -> BufferedLogWriter:
+        writer = BufferedLogWriter(EmailLog, **kwargs)
+        self.addCleanup(writer.close)
+        return writer
+
+    def test_writes_the_buffer_in_the_background_once_it_reaches_the_batch_size(self):
+        writer = self.create_writer(batch_size=3, flush_interval=None)
+
+        writer.add(create_log_record("first@example.com"))
+        writer.add(create_log_record("second@example.com"))
+        sleep(0.05)
+        self.assertEqual(writer.pending_records, 2)
+
+        with mock.patch.object(EmailLog.objects, "bulk_create", wraps=EmailLog.objects.bulk_create) as bulk_create:
+            writer.add(create_log_record("third@example.com"))
+            wait_for_flush(writer)
+
+        self.assertEqual(EmailLog.objects.count(), 3)
+        self.assertEqual(bulk_create.call_count, 1)
+
+    def test_writes_the_buffer_once_the_flush_interval_has_passed(self):
+        writer = self.create_writer(batch_size=100, flush_interval=0.05)
+
+        writer.add(create_log_record())
+        wait_for_flush(writer)
+
+        self.assertEqual(EmailLog.objects.count(), 1)
+
+    def test_a_rolled_back_request_does_not_lose_the_records_of_other_requests(self):
+        writer = self.create_writer(batch_size=2, flush_interval=None)
+        writer.add(create_log_record("other@example.com"))
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                writer.add(create_log_record("rolled-back@example.com"))
+                wait_for_flush(writer)
+                raise RuntimeError("The request failed")
+
+        self.assertEqual(sorted(EmailLog.objects.values_list("to_email", flat=True)),
+                         ["other@example.com", "rolled-back@example.com"])
+
+    def test_writes_records_added_after_close_straight_away(self):
+        writer = self.create_writer(batch_size=100, flush_interval=None)
+        writer.close()
+
+        writer.add(create_log_record())
+
+        self.assertEqual(EmailLog.objects.count(), 1)
+        self.assertEqual(writer.pending_records, 0)
+
+
+class TestBufferedLoggingWithQueuedDelivery(TransactionTestCase):
+
+    available_apps = ["django_email_sender", "testapp"]
+
+    def test_logs_every_email_drained_after_the_writer_was_closed(self):
+        delivery_queue = EmailDeliveryQueue(workers=2)
+        writer         = BufferedLogWriter(EmailLog, batch_size=100, flush_interval=None)
+        email_logger   = EmailSenderLogger.create()\
+            .add_email_sender_instance(EmailSender())\
+            .add_log_model(EmailLog)\
+            .enable_email_meta_data_save()\
+            .enable_queued_delivery(delivery_queue)\
+            .enable_buffered_db_logging(writer)\
+            .from_address("no-reply@example.com")\
+            .with_subject("Welcome")\
+            .with_html_template("welcome.html", folder_name="emails")\
+            .with_text_template("welcome.txt", folder_name="emails")
+
+        for index in range(10):
+            email_logger.to(f"user{index}@example.com").with_context({"username": f"user{index}"}).send()
+
+        # The exit handlers run in reverse order of registration, so the writer is closed first.
+        writer.close()
+        delivery_queue.shutdown(drain=True)
+
+        self.assertEqual(len(mail.outbox), 10)
+        self.assertEqual(EmailLog.objects.count(), 10)
@@ -0,0 +1,140 @@
+import smtplib
+import tempfile
+
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.exceptions import EmailRateLimitExceeded, EmailSenderBaseException
+from django_email_sender.metrics import get_metrics_registry
+from django_email_sender.rate_limit import EmailRateLimiter
+from django_email_sender.retry import RetryPolicy
+
+from testapp.backends import FlakyEmailBackend
+
+
+FLAKY_BACKEND = "testapp.backends.FlakyEmailBackend"
+TEMPLATE      = "emails/welcome.html"
+
+
+def create_email_sender():
+    return EmailSender.create()\
+        .from_address("no-reply@example.com")\
+        .to("first@example.com")\
+        .with_subject("Welcome")\
+        .with_context({"username": "Ada"})\
+        .with_html_template("welcome.html", folder_name="emails")\
+        .with_text_template("welcome.txt", folder_name="emails")
+
+
+@override_settings(EMAIL_BACKEND=FLAKY_BACKEND)
+class TestSendMetrics(SimpleTestCase):
+
+    def setUp(self):
+        FlakyEmailBackend.reset()
+        self.registry = get_metrics_registry()
+        self.registry.clear()
+        self.addCleanup(self.registry.clear)
+
+    def get_count(self, name: str, *labelvalues: str) -> float:
+        return self.registry.counter(name).get(*labelvalues)
+
+    def test_records_a_delivered_email(self):
+        create_email_sender().send()
+
+        self.assertEqual(self.get_count("email_sender_emails_sent_total", TEMPLATE), 1)
+        self.assertEqual(self.get_count("email_sender_messages_sent_total", TEMPLATE), 1)
+        self.assertGreater(self.get_count("email_sender_message_bytes_total", TEMPLATE), 0)
+        self.assertEqual(self.registry.histogram("email_sender_send_duration_seconds").get_count(TEMPLATE), 1)
+
+    def test_does_not_count_the_messages_of_a_chunked_email_as_retries(self):
+        create_email_sender()\
+            .add_new_recipient("second@example.com")\
+            .with_recipient_chunk_size(1)\
+            .with_retry_policy(RetryPolicy(max_attempts=3, base_delay=0, jitter=False))\
+            .send()
+
+        self.assertEqual(self.get_count("email_sender_messages_sent_total", TEMPLATE), 2)
+        self.assertEqual(self.get_count("email_sender_delivery_retries_total", TEMPLATE), 0)
+
+    def test_counts_the_retries_of_every_message(self):
+        disconnected = smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        FlakyEmailBackend.reset({"first@example.com": [disconnected], "second@example.com": [disconnected]})
+
+        create_email_sender()\
+            .add_new_recipient("second@example.com")\
+            .with_recipient_chunk_size(1)\
+            .with_retry_policy(RetryPolicy(max_attempts=3, base_delay=0, jitter=False))\
+            .send()
+
+        self.assertEqual(self.get_count("email_sender_delivery_retries_total", TEMPLATE), 2)
+
+    def test_records_a_send_that_fails_validation(self):
+        with self.assertRaises(EmailSenderBaseException) as raised:
+            create_email_sender().with_subject(None).send()
+
+        self.assertEqual(self.get_count("email_sender_emails_failed_total", TEMPLATE, raised.exception.__class__.__name__), 1)
+        self.assertEqual(self.get_count("email_sender_emails_sent_total", TEMPLATE), 0)
+
+    def test_records_a_send_rejected_by_the_rate_limiter(self):
+        rate_limiter = EmailRateLimiter(rate=0.001, burst=1, timeout=0)
+        create_email_sender().with_rate_limiter(rate_limiter).send()
+
+        with self.assertRaises(EmailRateLimitExceeded):
+            create_email_sender().with_rate_limiter(rate_limiter).send()
+
+        self.assertEqual(self.get_count("email_sender_emails_sent_total", TEMPLATE), 1)
+        self.assertEqual(self.get_count("email_sender_emails_failed_total", TEMPLATE, "EmailRateLimitExceeded"), 1)
+
+    def test_records_a_failed_delivery_once(self):
+        FlakyEmailBackend.reset({"first@example.com": [smtplib.SMTPRecipientsRefused({"first@example.com": (550, b"unknown")})]})
+
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            create_email_sender().send()
+
+        self.assertEqual(self.get_count("email_sender_emails_failed_total", TEMPLATE, "SMTPRecipientsRefused"), 1)
+
+    def test_records_each_message_of_send_many(self):
+        FlakyEmailBackend.reset({"second@example.com": [smtplib.SMTPRecipientsRefused({"second@example.com": (550, b"unknown")})]})
+
+        create_email_sender().send_many([{"to": "first@example.com"}, {"to": "second@example.com"}])
+
+        self.assertEqual(self.get_count("email_sender_emails_sent_total", TEMPLATE), 1)
+        self.assertEqual(self.get_count("email_sender_emails_failed_total", TEMPLATE, "SMTPRecipientsRefused"), 1)
+
+    @override_settings(EMAIL_SENDER_METRICS=False)
+    def test_records_nothing_when_disabled(self):
+        create_email_sender().send()
+
+        with self.assertRaises(EmailSenderBaseException):
+            create_email_sender().with_subject(None).send()
+
+        self.assertNotIn(f'template="{TEMPLATE}"', self.registry.render())
+
+
+class TestMetricsCommand(SimpleTestCase):
+
+    def setUp(self):
+        get_metrics_registry().clear()
+        self.addCleanup(get_metrics_registry().clear)
+
+    def test_prints_the_metrics_of_the_current_process(self):
+        create_email_sender().send()
+        stdout = StringIO()
+
+        call_command("email_sender_metrics", stdout=stdout)
+
+        self.assertIn(f'email_sender_emails_sent_total{{template="{TEMPLATE}"}} 1', stdout.getvalue())
+
+    def test_writes_the_metrics_to_a_file(self):
+        create_email_sender().send()
+        output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(output_dir.cleanup)
+        output     = Path(output_dir.name) / "emails.prom"
+
+        call_command("email_sender_metrics", output=str(output))
+
+        self.assertIn(f'email_sender_emails_sent_total{{template="{TEMPLATE}"}} 1', output.read_text(encoding="utf-8"))
@@ -0,0 +1,202 @@
+import smtplib
+
+from datetime import timedelta
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from django_email_sender.connection_pool import EmailConnectionPool
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.exceptions import IncorrectEmailModelAddedError
+from django_email_sender.outbox import OutboxWorker, get_outbox_model
+from django_email_sender.retry import RetryPolicy
+
+from testapp.backends import FlakyEmailBackend
+from testapp.models import EmailLog, EmailOutbox
+
+
+FLAKY_BACKEND = "testapp.backends.FlakyEmailBackend"
+
+
+def create_email_sender():
+    return EmailSender.create()\
+        .from_address("no-reply@example.com")\
+        .with_subject("Welcome")\
+        .with_html_template("welcome.html", folder_name="emails")\
+        .with_text_template("welcome.txt", folder_name="emails")
+
+
+def create_worker(**kwargs) -> OutboxWorker:
+    kwargs.setdefault("retry_policy", RetryPolicy(max_attempts=3, base_delay=60, max_delay=60, jitter=False))
+    return OutboxWorker(EmailOutbox, worker_id="worker-1", **kwargs)
+
+
+class TestEnqueue(TestCase):
+
+    def test_send_writes_the_rendered_email_to_the_outbox(self):
+        email_sender = create_email_sender().with_outbox(EmailOutbox)
+
+        result = email_sender.to("user@example.com").with_context({"username": "Ada"}).send()
+
+        self.assertEqual(result, (1, True))
+        self.assertEqual(mail.outbox, [])
+
+        row = EmailOutbox.objects.get()
+        self.assertEqual(row.status, EmailOutbox.Status.PENDING)
+        self.assertEqual((row.email_id, row.from_email, row.recipients), (email_sender.email_id, "no-reply@example.com", ["user@example.com"]))
+        self.assertEqual(row.subject, "Welcome")
+        self.assertIn("Welcome Ada", row.text_content)
+        self.assertIn("<h1>Welcome Ada</h1>", row.html_content)
+
+    def test_writes_one_row_per_chunk_of_recipients(self):
+        email_sender = create_email_sender()\
+            .with_outbox(EmailOutbox)\
+            .with_recipient_chunk_size(1)\
+            .to("first@example.com")\
+            .add_new_recipient("second@example.com")
+
+        self.assertEqual(email_sender.send(), (2, True))
+        self.assertEqual(list(EmailOutbox.objects.order_by("pk").values_list("recipients", flat=True)),
+                         [["first@example.com"], ["second@example.com"]])
+
+    async def test_asend_writes_the_rendered_email_to_the_outbox(self):
+        email_sender = create_email_sender().with_outbox(EmailOutbox)
+
+        result = await email_sender.to("user@example.com").with_context({"username": "Ada"}).asend()
+
+        self.assertEqual(result, (1, True))
+        self.assertEqual(mail.outbox, [])
+
+        row = await EmailOutbox.objects.aget()
+        self.assertEqual((row.status, row.email_id, row.recipients), (EmailOutbox.Status.PENDING, email_sender.email_id, ["user@example.com"]))
+        self.assertIn("Welcome Ada", row.text_content)
+
+    @override_settings(EMAIL_SENDER_OUTBOX_MODEL="testapp.EmailOutbox", EMAIL_BACKEND=FLAKY_BACKEND)
+    def test_send_many_enqueues_to_the_configured_outbox(self):
+        FlakyEmailBackend.reset()
+
+        results = create_email_sender().send_many([
+            {"to": "first@example.com", "context": {"username": "First"}},
+            {"to": "second@example.com", "context": {"username": "Second"}},
+        ])
+
+        self.assertEqual([(result.to_email, result.sent_count, result.is_sent) for result in results],
+                         [("first@example.com", 1, True), ("second@example.com", 1, True)])
+        self.assertEqual(FlakyEmailBackend.opened, 0)
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(EmailOutbox.objects.count(), 2)
+
+    @override_settings(EMAIL_SENDER_OUTBOX_MODEL="testapp.EmailOutbox")
+    def test_get_outbox_model_returns_the_configured_model(self):
+        self.assertIs(get_outbox_model(), EmailOutbox)
+
+    @override_settings(EMAIL_SENDER_OUTBOX_MODEL="testapp.EmailLog")
+    def test_get_outbox_model_rejects_a_model_that_is_not_an_outbox(self):
+        with self.assertRaises(IncorrectEmailModelAddedError):
+            get_outbox_model()
+
+    def test_with_outbox_rejects_a_model_that_is_not_an_outbox(self):
+        with self.assertRaises(IncorrectEmailModelAddedError):
+            create_email_sender().with_outbox(EmailLog)
+
+
+@override_settings(EMAIL_BACKEND=FLAKY_BACKEND)
+class TestOutboxWorker(TestCase):
+
+    def setUp(self):
+        FlakyEmailBackend.reset()
+
+    def enqueue(self, *recipients):
+        for recipient in recipients:
+            create_email_sender().with_outbox(EmailOutbox).to(recipient).with_context({"username": "Ada"}).send()
+
+    def test_claim_batch_leases_the_due_rows_to_the_worker(self):
+        self.enqueue("first@example.com", "second@example.com", "third@example.com")
+        worker = create_worker(batch_size=2, lease_seconds=120)
+
+        rows = worker.claim_batch()
+
+        self.assertEqual([row.recipients for row in rows], [["first@example.com"], ["second@example.com"]])
+        for row in EmailOutbox.objects.filter(pk__in=[row.pk for row in rows]):
+            self.assertEqual((row.status, row.locked_by, row.attempts), (EmailOutbox.Status.SENDING, "worker-1", 1))
+            self.assertGreater(row.available_at, timezone.now() + timedelta(seconds=100))
+
+        self.assertEqual([row.recipients for row in worker.claim_batch()], [["third@example.com"]])
+        self.assertEqual(worker.claim_batch(), [])
+
+    def test_claims_a_row_again_once_its_lease_has_run_out(self):
+        self.enqueue("user@example.com")
+        worker = create_worker(lease_seconds=120)
+        row    = worker.claim_batch()[0]
+
+        EmailOutbox.objects.filter(pk=row.pk).update(available_at=timezone.now() - timedelta(seconds=1))
+
+        reclaimed = worker.claim_batch()
+        self.assertEqual([claimed.pk for claimed in reclaimed], [row.pk])
+        self.assertEqual(EmailOutbox.objects.get(pk=row.pk).attempts, 2)
+
+    def test_process_batch_delivers_the_rows_and_marks_them_as_sent(self):
+        self.enqueue("first@example.com", "second@example.com")
+
+        self.assertEqual(create_worker().process_batch(), 2)
+
+        self.assertEqual([message.to for message in mail.outbox], [["first@example.com"], ["second@example.com"]])
+        self.assertEqual(FlakyEmailBackend.opened, 1)
+        for row in EmailOutbox.objects.all():
+            self.assertEqual((row.status, row.locked_by, row.last_error), (EmailOutbox.Status.SENT, "", ""))
+            self.assertIsNotNone(row.sent_on)
+
+    def test_puts_a_row_back_to_pending_after_a_transient_failure(self):
+        FlakyEmailBackend.reset({"user@example.com": [smtplib.SMTPResponseException(451, b"try again later")]})
+        self.enqueue("user@example.com")
+
+        create_worker().process_batch()
+
+        row = EmailOutbox.objects.get()
+        self.assertEqual((row.status, row.attempts, row.locked_by), (EmailOutbox.Status.PENDING, 1, ""))
+        self.assertIn("try again later", row.last_error)
+        self.assertGreater(row.available_at, timezone.now() + timedelta(seconds=50))
+        self.assertEqual(create_worker().claim_batch(), [])
+
+    def test_marks_a_row_as_failed_after_a_permanent_failure(self):
+        FlakyEmailBackend.reset({"first@example.com": [smtplib.SMTPRecipientsRefused({"first@example.com": (550, b"unknown")})]})
+        self.enqueue("first@example.com", "second@example.com")
+
+        create_worker().process_batch()
+
+        self.assertEqual(EmailOutbox.objects.get(status=EmailOutbox.Status.FAILED).recipients, ["first@example.com"])
+        self.assertEqual(EmailOutbox.objects.get(status=EmailOutbox.Status.SENT).recipients, ["second@example.com"])
+
+    def test_marks_a_row_as_failed_when_a_transient_failure_uses_the_last_attempt(self):
+        FlakyEmailBackend.reset({"user@example.com": [smtplib.SMTPResponseException(451, b"try again later")]})
+        self.enqueue("user@example.com")
+
+        create_worker(retry_policy=RetryPolicy(max_attempts=1)).process_batch()
+
+        self.assertEqual(EmailOutbox.objects.get().status, EmailOutbox.Status.FAILED)
+
+    def test_reopens_the_connection_after_the_server_drops_it(self):
+        recipients = [f"user{index}@example.com" for index in range(1, 6)]
+        FlakyEmailBackend.reset({"user2@example.com": [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]})
+        self.enqueue(*recipients)
+
+        create_worker(retry_policy=RetryPolicy(max_attempts=1)).process_batch()
+
+        self.assertEqual(FlakyEmailBackend.opened, 2)
+        self.assertEqual([message.to[0] for message in mail.outbox], recipients[:1] + recipients[2:])
+        self.assertEqual(EmailOutbox.objects.get(status=EmailOutbox.Status.FAILED).recipients, ["user2@example.com"])
+        self.assertEqual(EmailOutbox.objects.filter(status=EmailOutbox.Status.SENT).count(), 4)
+
+    def test_discards_a_pooled_connection_after_the_server_drops_it(self):
+        FlakyEmailBackend.reset({"user2@example.com": [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]})
+        self.enqueue("user1@example.com", "user2@example.com", "user3@example.com")
+        connection_pool = EmailConnectionPool(size=1, backend=FLAKY_BACKEND)
+        self.addCleanup(connection_pool.close)
+
+        create_worker(connection_pool=connection_pool).process_batch()
+
+        self.assertEqual(FlakyEmailBackend.opened, 2)
+        self.assertEqual((connection_pool.connections_opened, connection_pool.connections_retired), (2, 1))
+        self.assertEqual([message.to[0] for message in mail.outbox], ["user1@example.com", "user3@example.com"])
+        self.assertEqual(EmailOutbox.objects.get(status=EmailOutbox.Status.PENDING).recipients, ["user2@example.com"])
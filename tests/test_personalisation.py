@@ -0,0 +1,82 @@
+from unittest import mock
+
+from django.core import mail
+from django.test import SimpleTestCase
+
+from django_email_sender import personalisation
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.personalisation import PersonalisedTemplate
+from django_email_sender.utils import get_template_dirs
+
+
+def create_email_sender(template: str = "digest"):
+    return EmailSender.create()\
+        .from_address("no-reply@example.com")\
+        .with_subject("Digest")\
+        .with_context({"site_name": "Example"})\
+        .with_html_template(f"{template}.html", folder_name="emails")\
+        .with_text_template(f"{template}.txt", folder_name="emails")
+
+
+def get_template_path(name: str) -> str:
+    return str(get_template_dirs()["EMAIL_TEMPLATES_DIR"] / "emails" / name)
+
+
+class TestPersonalisedTemplate(SimpleTestCase):
+
+    def test_renders_the_shared_parts_once_and_the_blocks_per_recipient(self):
+        template = PersonalisedTemplate.render_shared(get_template_path("digest.txt"), {"site_name": "Example"})
+
+        self.assertTrue(template.is_personalised)
+        self.assertEqual(template.render({"username": "Ada"}), "Example digest\nHi Ada\nThe same for everyone.\n")
+        self.assertEqual(template.render({"username": "Grace"}), "Example digest\nHi Grace\nThe same for everyone.\n")
+
+    def test_escapes_the_recipient_context_in_html_templates(self):
+        template = PersonalisedTemplate.render_shared(get_template_path("digest.html"), {"site_name": "Example"})
+
+        self.assertIn("<p>Hi &lt;b&gt;Ada&lt;/b&gt;</p>", template.render({"username": "<b>Ada</b>"}))
+
+    def test_a_template_without_blocks_is_not_personalised(self):
+        template = PersonalisedTemplate.render_shared(get_template_path("welcome.txt"), {"username": "Ada"})
+
+        self.assertFalse(template.is_personalised)
+        self.assertEqual(template.render({"username": "Grace"}), "Welcome Ada, thanks for joining Example.\n")
+
+
+class TestSendManyPersonalised(SimpleTestCase):
+
+    def test_renders_each_template_once_for_the_batch(self):
+        with mock.patch.object(personalisation, "render_template", wraps=personalisation.render_template) as render_template:
+            results = create_email_sender().send_many([
+                {"to": "first@example.com", "context": {"username": "First"}},
+                {"to": "second@example.com", "context": {"username": "Second"}},
+                {"to": "third@example.com", "context": {"username": "Third"}},
+            ], personalise=True)
+
+        self.assertTrue(all(result.is_sent for result in results))
+        self.assertEqual(render_template.call_count, 2)
+        self.assertEqual([message.body for message in mail.outbox], [
+            "Example digest\nHi First\nThe same for everyone.\n",
+            "Example digest\nHi Second\nThe same for everyone.\n",
+            "Example digest\nHi Third\nThe same for everyone.\n",
+        ])
+        self.assertIn("<p>Hi Second</p>", mail.outbox[1].alternatives[0][0])
+
+    def test_the_recipient_context_only_applies_inside_the_blocks(self):
+        create_email_sender().send_many([
+            {"to": "first@example.com", "context": {"username": "First", "site_name": "Other"}},
+        ], personalise=True)
+
+        self.assertEqual(mail.outbox[0].body, "Example digest\nHi First\nThe same for everyone.\n")
+
+    def test_renders_the_blocks_in_place_without_personalise_mode(self):
+        create_email_sender().send_many([
+            {"to": "first@example.com", "context": {"username": "First", "site_name": "Other"}},
+        ])
+
+        self.assertEqual(mail.outbox[0].body, "Other digest\nHi First\nThe same for everyone.\n")
+
+    def test_renders_the_blocks_in_place_in_a_single_send(self):
+        create_email_sender().to("user@example.com").with_context({"username": "Ada", "site_name": "Example"}).send()
+
+        self.assertEqual(mail.outbox[0].body, "Example digest\nHi Ada\nThe same for everyone.\n")
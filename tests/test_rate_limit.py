@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from django_email_sender import rate_limit
+from django_email_sender.exceptions import EmailRateLimitExceeded
+from django_email_sender.rate_limit import EmailRateLimiter, TokenBucket
+
+
+class Clock:
+    """Replaces the `time` module of the rate limiter: `sleep` records the wait and moves the clock on."""
+
+    def __init__(self):
+        self.now    = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class RateLimitTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        patcher    = mock.patch.object(rate_limit, "time", SimpleNamespace(monotonic=self.clock.monotonic, sleep=self.clock.sleep))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestTokenBucket(RateLimitTestCase):
+
+    def test_lets_a_burst_through_and_then_waits_for_the_refill(self):
+        bucket = TokenBucket(rate=2, burst=2)
+
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0.0, 0.0, 0.5, 1.0])
+
+        # the waiting sends took the tokens of the next second
+        self.clock.advance(1)
+        self.assertEqual(bucket.reserve(), 0.5)
+
+    def test_refills_up_to_the_burst(self):
+        bucket = TokenBucket(rate=2, burst=2)
+        bucket.reserve(2)
+
+        self.clock.advance(60)
+
+        self.assertEqual(bucket.reserve(3), 0.5)
+
+    def test_acquire_sleeps_for_the_wait(self):
+        bucket = TokenBucket(rate=4, burst=1)
+
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.25)
+        self.assertEqual(self.clock.sleeps, [0.25])
+
+        stats = bucket.stats
+        self.assertEqual((stats.sends, stats.delayed_sends, stats.total_wait, stats.max_wait), (2, 1, 0.25, 0.25))
+
+    def test_raises_without_taking_tokens_when_the_wait_exceeds_the_timeout(self):
+        bucket = TokenBucket(rate=1, burst=1, timeout=0.5)
+        bucket.reserve()
+
+        with self.assertRaises(EmailRateLimitExceeded):
+            bucket.acquire()
+
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual((bucket.stats.sends, bucket.stats.rejected_sends), (1, 1))
+
+        self.clock.advance(1)
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_rejects_a_rate_that_is_not_positive(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestEmailRateLimiter(RateLimitTestCase):
+
+    def test_keeps_a_bucket_per_backend_and_sender_domain(self):
+        limiter = EmailRateLimiter(rate=1, burst=1)
+
+        self.assertEqual(limiter.reserve("first@one.example.com", backend="smtp"), 0.0)
+        self.assertEqual(limiter.reserve("first@two.example.com", backend="smtp"), 0.0)
+        self.assertEqual(limiter.reserve("first@one.example.com", backend="ses"), 0.0)
+        self.assertEqual(limiter.reserve("Second <second@ONE.example.com>", backend="smtp"), 1.0)
+
+        self.assertEqual(sorted(limiter.stats()), ["ses|one.example.com", "smtp|one.example.com", "smtp|two.example.com"])
+        self.assertEqual(limiter.stats()["smtp|one.example.com"].delayed_sends, 1)
+
+    def test_uses_the_rate_of_the_sender_domain(self):
+        limiter = EmailRateLimiter(rate=10, burst=1, domain_rates={"Newsletter.example.com": 2})
+
+        limiter.reserve("news@newsletter.example.com", backend="smtp")
+        limiter.reserve("user@example.com", backend="smtp")
+
+        self.assertEqual(limiter.reserve("news@newsletter.example.com", backend="smtp"), 0.5)
+        self.assertEqual(limiter.reserve("user@example.com", backend="smtp"), 0.1)
+
+    def test_names_the_bucket_in_the_error(self):
+        limiter = EmailRateLimiter(rate=1, burst=1, timeout=0)
+        limiter.acquire("user@example.com", backend="smtp")
+
+        with self.assertRaises(EmailRateLimitExceeded) as raised:
+            limiter.acquire("user@example.com", backend="smtp")
+
+        self.assertIn("smtp|example.com", str(raised.exception))
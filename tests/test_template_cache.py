@@ -0,0 +1,271 @@
+import os
+import shutil
+import tempfile
+
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.template import engines
+from django.test import SimpleTestCase, override_settings
+
+from django_email_sender import template_cache
+from django_email_sender.template_cache import (
+    clear_template_cache,
+    clear_template_preview_cache,
+    clear_validated_path_cache,
+    get_compiled_template,
+    get_template_preview,
+    path_exists,
+    render_template,
+    warm_up_templates,
+)
+
+
+class TemplateDirTestCase(SimpleTestCase):
+    """Runs each test with an empty template directory and empty process caches."""
+
+    def setUp(self):
+        self.templates_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.templates_dir)
+
+        settings_override = override_settings(TEMPLATES=[{
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": [str(self.templates_dir)],
+        }])
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        for clear_cache in (clear_template_cache, clear_validated_path_cache, clear_template_preview_cache):
+            clear_cache()
+            self.addCleanup(clear_cache)
+
+    def write_template(self, name: str, content: str, mtime: float = None) -> str:
+        path = self.templates_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return str(path)
+
+
+class TestCompiledTemplateCache(TemplateDirTestCase):
+
+    def test_compiles_a_template_once(self):
+        path = self.write_template("welcome.html", "Hello {{ name }}")
+
+        with mock.patch.object(template_cache, "get_template", wraps=template_cache.get_template) as get_template:
+            self.assertEqual(render_template(path, {"name": "Ada"}), "Hello Ada")
+            self.assertEqual(render_template(path, {"name": "Grace"}), "Hello Grace")
+
+        get_template.assert_called_once_with(path)
+
+    def test_keeps_the_compiled_template_when_debug_is_off(self):
+        path = self.write_template("welcome.html", "Hello {{ name }}", mtime=1_000_000)
+        render_template(path, {"name": "Ada"})
+
+        self.write_template("welcome.html", "Goodbye {{ name }}", mtime=2_000_000)
+
+        self.assertEqual(render_template(path, {"name": "Ada"}), "Hello Ada")
+
+    @override_settings(DEBUG=True)
+    def test_recompiles_a_changed_template_when_debug_is_on(self):
+        path = self.write_template("welcome.html", "Hello {{ name }}", mtime=1_000_000)
+        self.assertEqual(render_template(path, {"name": "Ada"}), "Hello Ada")
+
+        self.write_template("welcome.html", "Goodbye {{ name }}", mtime=2_000_000)
+
+        self.assertEqual(render_template(path, {"name": "Ada"}), "Goodbye Ada")
+        self.assertIs(get_compiled_template(path), get_compiled_template(path))
+
+    @override_settings(DEBUG=True)
+    def test_recompiling_a_changed_template_keeps_the_other_templates_in_djangos_loader_cache(self):
+        changed   = self.write_template("welcome.html", "Hello {{ name }}", mtime=1_000_000)
+        unchanged = self.write_template("goodbye.html", "Goodbye {{ name }}", mtime=1_000_000)
+        get_compiled_template(changed)
+        get_compiled_template(unchanged)
+
+        loader        = engines["django"].engine.template_loaders[0]
+        cached_before = dict(loader.get_template_cache)
+
+        self.write_template("welcome.html", "Welcome {{ name }}", mtime=2_000_000)
+
+        self.assertEqual(render_template(changed, {"name": "Ada"}), "Welcome Ada")
+        self.assertIs(loader.get_template_cache[unchanged], cached_before[unchanged])
+        self.assertIsNot(loader.get_template_cache[changed], cached_before[changed])
+
+    def test_clear_template_cache_forces_a_recompile(self):
+        path = self.write_template("welcome.html", "Hello")
+        compiled = get_compiled_template(path)
+
+        clear_template_cache()
+
+        self.assertIsNot(get_compiled_template(path), compiled)
+
+    @override_settings(EMAIL_SENDER_TEMPLATE_CACHE=False)
+    def test_loads_the_template_on_every_render_when_the_cache_is_disabled(self):
+        path = self.write_template("welcome.html", "Hello {{ name }}")
+
+        with mock.patch.object(template_cache, "get_template", wraps=template_cache.get_template) as get_template:
+            render_template(path, {"name": "Ada"})
+            render_template(path, {"name": "Ada"})
+
+        self.assertEqual(get_template.call_count, 2)
+
+
+class TestPathExists(TemplateDirTestCase):
+
+    def test_checks_an_existing_path_on_disk_once(self):
+        path = self.write_template("welcome.html", "Hello")
+
+        with mock.patch.object(template_cache, "exists", wraps=template_cache.exists) as exists:
+            self.assertTrue(path_exists(path))
+            self.assertTrue(path_exists(path))
+
+        exists.assert_called_once_with(path)
+
+    def test_does_not_cache_a_missing_path(self):
+        path = str(self.templates_dir / "welcome.html")
+
+        self.assertFalse(path_exists(path))
+
+        self.write_template("welcome.html", "Hello")
+        self.assertTrue(path_exists(path))
+
+    @override_settings(EMAIL_SENDER_PATH_CACHE_TTL=0)
+    def test_checks_the_path_every_time_when_the_ttl_is_zero(self):
+        path = self.write_template("welcome.html", "Hello")
+
+        self.assertTrue(path_exists(path))
+        os.remove(path)
+        self.assertFalse(path_exists(path))
+
+    @override_settings(EMAIL_SENDER_PATH_CACHE_TTL=60)
+    def test_checks_the_path_again_once_the_ttl_has_passed(self):
+        path = self.write_template("welcome.html", "Hello")
+
+        with mock.patch.object(template_cache, "monotonic", return_value=1000):
+            self.assertTrue(path_exists(path))
+
+        os.remove(path)
+
+        with mock.patch.object(template_cache, "monotonic", return_value=1059):
+            self.assertTrue(path_exists(path))
+
+        with mock.patch.object(template_cache, "monotonic", return_value=1060):
+            self.assertFalse(path_exists(path))
+
+    def test_clear_validated_path_cache_forgets_a_single_path(self):
+        kept    = self.write_template("kept.html", "Hello")
+        removed = self.write_template("removed.html", "Hello")
+        path_exists(kept)
+        path_exists(removed)
+
+        os.remove(kept)
+        os.remove(removed)
+        clear_validated_path_cache(removed)
+
+        self.assertTrue(path_exists(kept))
+        self.assertFalse(path_exists(removed))
+
+
+class TestTemplatePreviewCache(TemplateDirTestCase):
+
+    def test_reads_the_template_once(self):
+        path = self.write_template("welcome.txt", "Hello there")
+
+        self.assertEqual(get_template_preview(path), "Hello there")
+        os.remove(path)
+
+        self.assertEqual(get_template_preview(path), "Hello there")
+
+    @override_settings(EMAIL_SENDER_PREVIEW_CACHE_SIZE=1)
+    def test_drops_the_least_recently_used_preview_once_full(self):
+        first  = self.write_template("first.txt", "First")
+        second = self.write_template("second.txt", "Second")
+        get_template_preview(first)
+        get_template_preview(second)
+
+        os.remove(first)
+        os.remove(second)
+
+        self.assertEqual(get_template_preview(second), "Second")
+        with self.assertRaises(OSError):
+            get_template_preview(first)
+
+    @override_settings(EMAIL_SENDER_PREVIEW_CACHE_SIZE=0)
+    def test_reads_the_template_every_time_when_the_cache_size_is_zero(self):
+        path = self.write_template("welcome.txt", "Hello there")
+
+        self.assertEqual(get_template_preview(path), "Hello there")
+        os.remove(path)
+
+        with self.assertRaises(OSError):
+            get_template_preview(path)
+
+    def test_rejects_an_invalid_cache_size(self):
+        path = self.write_template("welcome.txt", "Hello there")
+
+        for cache_size in (-1, "256", 1.5):
+            with self.subTest(cache_size=cache_size), override_settings(EMAIL_SENDER_PREVIEW_CACHE_SIZE=cache_size):
+                with self.assertRaises(ImproperlyConfigured):
+                    get_template_preview(path)
+
+
+class TestWarmUpTemplates(TemplateDirTestCase):
+
+    def test_compiles_and_caches_every_template(self):
+        html_path = self.write_template("emails/welcome.html", "<p>Hello {{ name }}</p>")
+        text_path = self.write_template("emails/welcome.txt", "Hello {{ name }}")
+        self.write_template("emails/notes.md", "Not a template")
+
+        report = warm_up_templates(templates_dir=str(self.templates_dir))
+
+        self.assertTrue(report.is_successful)
+        self.assertEqual(report.warmed, (html_path, text_path))
+
+        with mock.patch.object(template_cache, "get_template") as get_template, \
+                mock.patch.object(template_cache, "exists") as exists:
+            self.assertEqual(render_template(html_path, {"name": "Ada"}), "<p>Hello Ada</p>")
+            self.assertTrue(path_exists(text_path))
+
+        get_template.assert_not_called()
+        exists.assert_not_called()
+
+    def test_records_a_failing_template_and_warms_up_the_rest(self):
+        broken_path = self.write_template("emails/broken.html", "{% if %}")
+        text_path   = self.write_template("emails/welcome.txt", "Hello {{ name }}")
+
+        report = warm_up_templates(templates_dir=str(self.templates_dir))
+
+        self.assertFalse(report.is_successful)
+        self.assertEqual(report.warmed, (text_path,))
+        self.assertIn("TemplateSyntaxError", report.errors[broken_path])
+
+    def test_reports_a_missing_directory(self):
+        missing = str(self.templates_dir / "missing")
+
+        report = warm_up_templates(templates_dir=missing)
+
+        self.assertEqual(report.warmed, ())
+        self.assertIn(missing, report.errors)
+
+    def test_command_reports_the_warmed_up_templates(self):
+        self.write_template("emails/welcome.txt", "Hello {{ name }}")
+        stdout = StringIO()
+
+        call_command("warm_email_templates", "--dir", str(self.templates_dir), stdout=stdout)
+
+        self.assertIn(str(self.templates_dir), stdout.getvalue())
+
+    def test_command_fails_in_strict_mode_when_a_template_fails(self):
+        self.write_template("emails/broken.html", "{% if %}")
+
+        with self.assertRaises(CommandError):
+            call_command("warm_email_templates", "--dir", str(self.templates_dir), "--strict",
+                         stdout=StringIO(), stderr=StringIO())
+
+        call_command("warm_email_templates", "--dir", str(self.templates_dir), stdout=StringIO(), stderr=StringIO())
@@ -0,0 +1,147 @@
+import sys
+
+from contextlib import contextmanager
+from types import ModuleType, SimpleNamespace
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from django_email_sender import tracing
+from django_email_sender.email_sender import EmailSender
+from django_email_sender.tracing import NoOpTracer, OpenTelemetryTracer, Span, Tracer, get_tracer
+
+
+class RecordingTracer(Tracer):
+    """Records the name and attributes of every span, in the order the spans are started."""
+
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def start_span(self, name, attributes=None):
+        self.spans.append((name, attributes))
+        yield Span()
+
+
+def create_fake_opentelemetry() -> ModuleType:
+    """Returns a stand-in for the `opentelemetry` package whose tracer records its spans."""
+    recorded = []
+
+    @contextmanager
+    def start_as_current_span(name, attributes=None):
+        recorded.append((name, attributes))
+        yield Span()
+
+    opentelemetry       = ModuleType("opentelemetry")
+    opentelemetry.trace = SimpleNamespace(
+        get_tracer=lambda name, tracer_provider=None: SimpleNamespace(start_as_current_span=start_as_current_span),
+        recorded=recorded,
+    )
+    return opentelemetry
+
+
+class TestGetTracer(SimpleTestCase):
+
+    def setUp(self):
+        # the tracer is cached per setting, so a tracer created by another test could be reused
+        patcher = mock.patch.object(tracing, "_tracer", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_traces_nothing_by_default(self):
+        self.assertIsInstance(get_tracer(), NoOpTracer)
+
+    @override_settings(EMAIL_SENDER_TRACER="noop")
+    def test_returns_the_no_op_tracer_by_name(self):
+        self.assertIsInstance(get_tracer(), NoOpTracer)
+
+    def test_reuses_the_tracer_until_the_setting_changes(self):
+        tracer = get_tracer()
+        self.assertIs(get_tracer(), tracer)
+
+        with override_settings(EMAIL_SENDER_TRACER="test_tracing.RecordingTracer"):
+            self.assertIsInstance(get_tracer(), RecordingTracer)
+
+        self.assertIsInstance(get_tracer(), NoOpTracer)
+
+    @override_settings(EMAIL_SENDER_TRACER="test_tracing.RecordingTracer")
+    def test_creates_a_tracer_from_a_dotted_path(self):
+        self.assertIsInstance(get_tracer(), RecordingTracer)
+
+    def test_accepts_a_tracer_instance(self):
+        tracer = RecordingTracer()
+
+        with override_settings(EMAIL_SENDER_TRACER=tracer):
+            self.assertIs(get_tracer(), tracer)
+
+    @override_settings(EMAIL_SENDER_TRACER="auto")
+    def test_auto_traces_nothing_without_opentelemetry(self):
+        with mock.patch.dict(sys.modules, {"opentelemetry": None, "opentelemetry.trace": None}):
+            self.assertIsInstance(get_tracer(), NoOpTracer)
+
+    @override_settings(EMAIL_SENDER_TRACER="auto")
+    def test_auto_uses_opentelemetry_when_it_is_installed(self):
+        with mock.patch.object(tracing, "is_opentelemetry_available", return_value=True), \
+                mock.patch.dict(sys.modules, {"opentelemetry": create_fake_opentelemetry()}):
+            self.assertIsInstance(get_tracer(), OpenTelemetryTracer)
+
+    @override_settings(EMAIL_SENDER_TRACER="opentelemetry")
+    def test_opentelemetry_requires_the_package(self):
+        with mock.patch.dict(sys.modules, {"opentelemetry": None}):
+            with self.assertRaises(ImproperlyConfigured):
+                get_tracer()
+
+
+class TestOpenTelemetryTracer(SimpleTestCase):
+
+    def test_starts_the_spans_as_current_opentelemetry_spans(self):
+        opentelemetry = create_fake_opentelemetry()
+
+        with mock.patch.dict(sys.modules, {"opentelemetry": opentelemetry}):
+            tracer = OpenTelemetryTracer()
+
+        with tracer.start_span("email_sender.send", attributes={"email.id": "abc"}):
+            pass
+
+        self.assertEqual(opentelemetry.trace.recorded, [("email_sender.send", {"email.id": "abc"})])
+
+
+class TestEmailSenderSpans(SimpleTestCase):
+
+    def test_reports_a_span_for_the_send_and_each_stage(self):
+        tracer       = RecordingTracer()
+        email_sender = EmailSender.create()\
+            .with_tracer(tracer)\
+            .from_address("no-reply@example.com")\
+            .to("user@example.com")\
+            .with_subject("Welcome")\
+            .with_context({"username": "Ada"})\
+            .with_html_template("welcome.html", folder_name="emails")\
+            .with_text_template("welcome.txt", folder_name="emails")
+
+        email_sender.send()
+
+        self.assertEqual([name for name, _ in tracer.spans], [
+            "email_sender.send",
+            "email_sender.validate",
+            "email_sender.render",
+            "email_sender.build",
+            "email_sender.deliver",
+        ])
+        self.assertEqual(tracer.spans[0][1], {"email.id": email_sender.email_id, "email.template": "emails/welcome.html"})
+
+    def test_uses_the_process_wide_tracer_without_a_tracer_of_its_own(self):
+        tracer = RecordingTracer()
+
+        with override_settings(EMAIL_SENDER_TRACER=tracer):
+            EmailSender.create()\
+                .from_address("no-reply@example.com")\
+                .to("user@example.com")\
+                .with_subject("Welcome")\
+                .with_context({"username": "Ada"})\
+                .with_html_template("welcome.html", folder_name="emails")\
+                .with_text_template("welcome.txt", folder_name="emails")\
+                .send()
+
+        self.assertEqual(tracer.spans[0][0], "email_sender.send")
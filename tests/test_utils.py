@@ -0,0 +1,160 @@
+import json
+
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy as _
+
+from django_email_sender import utils
+from django_email_sender.utils import JSON_ENGINES, dumps_json, get_html_preview, mark_method_for_debugging, sanitize_for_json
+
+
+class Recipient:
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __str__(self):
+        return f"Recipient {self.name}"
+
+
+def create_context() -> dict:
+    return {
+        "username": "Ada",
+        "greeting": _("Welcome"),
+        "created_on": datetime(2024, 5, 1, 9, 30),
+        "amount": Decimal("9.99"),
+        "tags": {"new"},
+        "items": ("first", "second"),
+        "recipient": Recipient("Ada"),
+        "nested": {"count": 3, "ratio": 0.5, "active": True, "missing": None, "names": ["Ada", _("Grace")]},
+        "city": "Zürich",
+        1: "integer key",
+    }
+
+
+HTML_SAMPLES = {
+    "document": (
+        "<!DOCTYPE html><html><head><title>Welcome</title>"
+        "<style>p { color: red; }</style>"
+        "<script>var greeting = '<p>Hidden</p>';</script></head>"
+        "<body><h1>Hello Ada</h1><!-- tracking --><p>Thanks for joining Example</p>"
+        "<template><p>Not rendered</p></template></body></html>"
+    ),
+    "entities": "<p>Fish &amp; chips &mdash; &#169; 2024 &lt;Example&gt; &nbsp;</p>",
+    "whitespace": "<div>\n  <p>   First   line\n  </p>\n\t<p>Second <b>bold</b>, <i>italic</i></p>\n  <br/>  <p> </p>\n</div>",
+    "long": "<div>" + "<p>Lorem ipsum dolor sit amet.</p>" * 200 + "</div>",
+}
+
+
+class TestGetHtmlPreview(SimpleTestCase):
+
+    def test_matches_the_bs4_engine(self):
+        for name, html in HTML_SAMPLES.items():
+            for length in (10, 40, 100):
+                with self.subTest(sample=name, length=length):
+                    self.assertEqual(get_html_preview(html, length, engine="stream"),
+                                     get_html_preview(html, length, engine="bs4"))
+
+    def test_skips_the_text_of_scripts_styles_and_templates(self):
+        self.assertEqual(get_html_preview(HTML_SAMPLES["document"], 100, engine="stream"),
+                         "Welcome Hello Ada Thanks for joining Example")
+
+    def test_decodes_entities(self):
+        self.assertEqual(get_html_preview(HTML_SAMPLES["entities"], 100, engine="stream"), "Fish & chips — © 2024 <Example>")
+
+    def test_joins_the_text_of_separate_elements_with_one_space(self):
+        self.assertEqual(get_html_preview(HTML_SAMPLES["whitespace"], 100, engine="stream"),
+                         "First   line Second bold , italic")
+
+    def test_truncates_the_preview_to_the_length(self):
+        preview = get_html_preview(HTML_SAMPLES["long"], 20, engine="stream")
+
+        self.assertEqual(preview, "Lorem ipsum dolor si...")
+
+    def test_skips_cdata_sections_unlike_bs4(self):
+        html = "<p>Before<svg><![CDATA[chart data]]></svg>after</p>"
+
+        self.assertEqual(get_html_preview(html, 100, engine="stream"), "Before after")
+        self.assertEqual(get_html_preview(html, 100, engine="bs4"), "Before chart data after")
+
+    @override_settings(EMAIL_SENDER_PREVIEW_ENGINE="bs4")
+    def test_uses_the_configured_engine(self):
+        self.assertEqual(get_html_preview("<p>Before<![CDATA[data]]>after</p>"), "Before data after")
+
+    def test_rejects_an_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            get_html_preview("<p>Hello</p>", engine="lxml")
+
+
+class Traced:
+
+    def method(self):
+        return mark_method_for_debugging()
+
+    def helper(self):
+        return mark_method_for_debugging(depth=2)
+
+    def wrapped_method(self):
+        return self.helper()
+
+
+class TestMarkMethodForDebugging(SimpleTestCase):
+
+    def test_describes_the_calling_method(self):
+        debug_info = Traced().method()
+
+        self.assertEqual((debug_info.CLASS_NAME, debug_info.CURRENT_METHOD), ("Traced", "method"))
+        self.assertGreater(debug_info.LINE_NUMBER, 0)
+
+    def test_skips_the_given_number_of_frames(self):
+        debug_info = Traced().wrapped_method()
+
+        self.assertEqual((debug_info.CLASS_NAME, debug_info.CURRENT_METHOD), ("Traced", "wrapped_method"))
+
+    def test_describes_an_unknown_method_when_the_call_stack_is_too_shallow(self):
+        debug_info = mark_method_for_debugging(depth=10_000)
+
+        self.assertEqual((debug_info.CLASS_NAME, debug_info.CURRENT_METHOD, debug_info.LINE_NUMBER), ("Unknown", "Unknown", -1))
+
+
+class TestDumpsJson(SimpleTestCase):
+
+    def test_every_engine_matches_the_sanitized_output(self):
+        context  = create_context()
+        expected = json.loads(json.dumps(sanitize_for_json(context)))
+
+        for engine in JSON_ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(json.loads(dumps_json(context, engine=engine)), expected)
+
+    def test_writes_compact_json_by_default(self):
+        for engine in JSON_ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(dumps_json({"a": [1, 2], "b": "Zürich"}, engine=engine), '{"a":[1,2],"b":"Zürich"}')
+
+    def test_indents_with_every_engine(self):
+        expected = json.dumps({"a": [1, 2]}, indent=2)
+
+        for engine in JSON_ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(dumps_json({"a": [1, 2]}, indent=2, engine=engine), expected)
+
+    def test_orjson_falls_back_to_the_standard_library_for_wide_integers(self):
+        self.assertEqual(dumps_json({"id": 2 ** 70}, engine="orjson"), f'{{"id":{2 ** 70}}}')
+
+    def test_orjson_falls_back_to_the_standard_library_when_it_is_not_installed(self):
+        with mock.patch.object(utils, "_orjson", False):
+            self.assertEqual(dumps_json({"greeting": _("Welcome")}, engine="orjson"), '{"greeting":"Welcome"}')
+
+    @override_settings(EMAIL_SENDER_JSON_ENGINE="json")
+    def test_uses_the_configured_engine(self):
+        with mock.patch.dict(JSON_ENGINES, {"json": mock.Mock(return_value="{}")}):
+            self.assertEqual(dumps_json({}), "{}")
+            JSON_ENGINES["json"].assert_called_once_with({}, None)
+
+    def test_rejects_an_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            dumps_json({}, engine="simplejson")
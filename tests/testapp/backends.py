@@ -0,0 +1,59 @@
+import smtplib
+
+from django.core.mail.backends.locmem import EmailBackend
+
+
+class FlakyEmailBackend(EmailBackend):
+    """
+    A locmem backend that behaves like an SMTP connection the server can fail or drop.
+
+    `failures` maps a recipient to the errors raised, one per attempt, when a message is sent
+    to it. After an `SMTPServerDisconnected` the connection refuses every message until it is
+    closed and opened again, as `smtplib` does.
+    """
+
+    failures = {}
+    opened   = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_open    = False
+        self.is_dropped = False
+
+    @classmethod
+    def reset(cls, failures=None):
+        cls.failures = {address: list(errors) for address, errors in (failures or {}).items()}
+        cls.opened   = 0
+
+    def open(self):
+        if self.is_open:
+            return False
+
+        self.is_open    = True
+        self.is_dropped = False
+        type(self).opened += 1
+        return True
+
+    def close(self):
+        self.is_open = False
+
+    def send_messages(self, messages):
+        new_connection = self.open()
+
+        try:
+            for message in messages:
+                if self.is_dropped:
+                    raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+                for recipient in message.to:
+                    errors = type(self).failures.get(recipient)
+
+                    if errors:
+                        error           = errors.pop(0)
+                        self.is_dropped = isinstance(error, smtplib.SMTPServerDisconnected)
+                        raise error
+
+            return super().send_messages(messages)
+        finally:
+            if new_connection:
+                self.close()
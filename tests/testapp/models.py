@@ -0,0 +1,11 @@
+from django_email_sender.models import EmailBaseLog, EmailBaseOutbox
+
+
+class EmailLog(EmailBaseLog):
+    class Meta:
+        app_label = "testapp"
+
+
+class EmailOutbox(EmailBaseOutbox):
+    class Meta:
+        app_label = "testapp"